@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Runs JSONPipeline over many portfolios at once.
+
+Input is a directory of *.json files or a JSONL stream (one portfolio per line, "-" for
+stdin). Documents are sent to a process pool in chunks; each worker builds one pipeline
+(and so one compiled Draft7Validator and skill matcher) and reuses it for every
+document it gets. Transformed profiles go to a JSONL output, documents that fail to
+parse or validate go to a separate JSONL error report.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from game.managers.json_pipeline import JSONPipeline, serialize_portfolio
+from game.utils.portfolio_records import CompactPortfolio
+
+DEFAULT_SCHEMA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schemas", "portfolio_schema.json")
+
+# One pipeline per worker process, built by _init_worker
+_pipeline = None
+
+def _init_worker(schema_path, stat_mappings_path):
+    global _pipeline
+    _pipeline = JSONPipeline(schema_path, cache_dir=None, stat_mappings_path=stat_mappings_path)
+    _pipeline.validator # Compile the schema once, up front
+
+def process_chunk(chunk):
+    """[(source, text)] -> [(source, output line or None, error line or None)], in order."""
+    results = []
+    for source, text in chunk:
+        try:
+            raw_data = json.loads(text)
+        except json.JSONDecodeError as e:
+            results.append((source, None, json.dumps({"source": source, "errors": [f"Invalid JSON: {e.msg} at line {e.lineno}"]})))
+            continue
+        if not isinstance(raw_data, dict):
+            results.append((source, None, json.dumps({"source": source, "errors": ["Portfolio must be a JSON object"]})))
+            continue
+
+        result, errors = _pipeline.process_portfolio(raw_data)
+        if errors:
+            results.append((source, None, json.dumps({"source": source, "errors": errors})))
+        else:
+            results.append((source, json.dumps({"source": source, "profile": serialize_portfolio(result)}), None))
+    return results
+
+def read_documents(input_path):
+    """Yields (source, text) for each portfolio in a directory, a JSONL file, or stdin ("-")."""
+    if os.path.isdir(input_path):
+        # One case-insensitive filter: globbing *.json and *.JSON lists each file twice on Windows
+        paths = [path for path in glob.glob(os.path.join(input_path, "*")) if path.lower().endswith(".json")]
+        for path in sorted(paths):
+            with open(path, "r", encoding="utf-8") as f:
+                yield os.path.basename(path), f.read()
+        return
+
+    stream = sys.stdin if input_path == "-" else open(input_path, "r", encoding="utf-8")
+    name = "stdin" if input_path == "-" else os.path.basename(input_path)
+    try:
+        for line_number, line in enumerate(stream, 1):
+            if line.strip():
+                yield f"{name}:{line_number}", line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def chunked(documents, chunk_size):
+    documents = iter(documents)
+    while True:
+        chunk = list(islice(documents, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def ordered_results(executor, fn, items, window):
+    """
+    executor.map(fn, items) in order, but with at most window items submitted at a time,
+    so input is only read as fast as results are consumed (Executor.map submits everything
+    up front).
+    """
+    in_flight = deque()
+    try:
+        for item in items:
+            in_flight.append(executor.submit(fn, item))
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+def run_batch(input_path, output_path, errors_path, workers=None, chunk_size=32,
+              schema_path=DEFAULT_SCHEMA, stat_mappings_path=None):
+    """Processes every document and returns {documents, profiles, errors, seconds, docs_per_second}."""
+    workers = workers or os.cpu_count() or 1
+    chunks = chunked(read_documents(input_path), chunk_size)
+    start = time.perf_counter()
+    summary = {"documents": 0, "profiles": 0, "errors": 0}
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(schema_path, stat_mappings_path))
+        # Ordered, with at most two chunks per worker in flight
+        results = ordered_results(executor, process_chunk, chunks, 2 * workers)
+    else:
+        _init_worker(schema_path, stat_mappings_path)
+        results = map(process_chunk, chunks)
+
+    try:
+        with open(output_path, "w", encoding="utf-8") as output, open(errors_path, "w", encoding="utf-8") as errors:
+            for chunk_results in results:
+                for source, profile_line, error_line in chunk_results:
+                    summary["documents"] += 1
+                    if profile_line is not None:
+                        output.write(profile_line + "\n")
+                        summary["profiles"] += 1
+                    else:
+                        errors.write(error_line + "\n")
+                        summary["errors"] += 1
+    finally:
+        if executor:
+            executor.shutdown()
+
+    summary["seconds"] = time.perf_counter() - start
+    summary["docs_per_second"] = summary["documents"] / summary["seconds"] if summary["seconds"] else 0.0
+    return summary
+
+def read_profiles(path):
+    """Yields (source, CompactPortfolio) from a batch output file, e.g. to rank thousands of them."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            yield sys.intern(record["source"]), CompactPortfolio.from_dict(record["profile"])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transform many portfolio JSON files into game profiles")
+    parser.add_argument("input", help="directory of *.json portfolios, a JSONL file, or - for JSONL on stdin")
+    parser.add_argument("--output", default="profiles.jsonl", help="transformed profiles (default: %(default)s)")
+    parser.add_argument("--errors", default="errors.jsonl", help="parse/validation error report (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count, 1 = in-process)")
+    parser.add_argument("--chunk-size", type=int, default=32, help="documents per task sent to a worker (default: %(default)s)")
+    parser.add_argument("--schema", default=DEFAULT_SCHEMA, help="portfolio JSON schema")
+    parser.add_argument("--stat-mappings", default=None, help="JSON skill -> stat table replacing the built-in one")
+    args = parser.parse_args(argv)
+
+    summary = run_batch(args.input, args.output, args.errors, args.workers, args.chunk_size,
+                        args.schema, args.stat_mappings)
+    print(f"Processed {summary['documents']} documents in {summary['seconds']:.2f}s "
+          f"({summary['docs_per_second']:.1f} docs/s): {summary['profiles']} profiles, "
+          f"{summary['errors']} errors (see {args.errors})")
+    return 1 if summary["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Headless performance benchmark.
+
+Drives the real scenes under the SDL dummy drivers for a fixed number of frames with
+scripted input and reports update/draw timings, per-frame allocations and peak memory
+as JSON. Two runs can be compared to flag regressions:
+
+    python benchmark.py --frames 300 --output baseline.json
+    python benchmark.py --frames 300 --compare baseline.json --threshold 0.15
+"""
+
+import os
+
+# Must be set before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1") # Keep stdout valid JSON
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+from config import SIMULATION_TICK_RATE, KEYS
+from game.managers.asset_manager import AssetManager
+from game.managers.input_manager import InputManager
+from game.utils.headless import HeadlessGame
+
+DEFAULT_FRAMES = 300
+DEFAULT_THRESHOLD = 0.15
+# Timing differences smaller than this many milliseconds are treated as noise
+MIN_ABSOLUTE_DELTA_MS = 0.05
+# Metrics checked by compare(): scene_report key -> stat keys
+COMPARED_METRICS = {
+    "update_ms": ("p50", "p95", "p99"),
+    "draw_ms": ("p50", "p95", "p99"),
+}
+
+class BenchmarkSaveManager:
+    """In-memory save data for the zones."""
+
+    def __init__(self):
+        self.player_data = {"position": [400, 300]}
+        self.game_data = {"completed_zones": []}
+
+    def get_player_data(self):
+        return self.player_data
+
+    def get_game_data(self):
+        return self.game_data
+
+    def set_game_data(self, data):
+        self.game_data.update(data)
+
+class BenchmarkGame(HeadlessGame):
+    """HeadlessGame plus the managers the zones reach through game_manager."""
+
+    def __init__(self):
+        super().__init__()
+        self.asset_manager = AssetManager()
+        self.save_manager = BenchmarkSaveManager()
+        self.interpolation_alpha = 1.0
+
+class HeldKeys(dict):
+    """Stands in for pygame.key.get_pressed(): any key not held reads as False."""
+
+    def __missing__(self, key):
+        return False
+
+# Scripted input. Each script is called once per frame with the frame index and the
+# scene and returns the events for that frame; held keys go through InputManager.
+
+def menu_script(frame, scene):
+    if frame % 30 == 0:
+        return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN)]
+    return []
+
+def walk_script(frame, scene):
+    # Walk a square so the player moves through the map and the camera follows
+    side = (frame // 60) % 4
+    direction = ("RIGHT", "DOWN", "LEFT", "UP")[side]
+    InputManager().keyboard_state = HeldKeys({KEYS[direction]: True})
+    return []
+
+def idle_script(frame, scene):
+    return []
+
+def scroll_script(frame, scene):
+    direction = -1 if (frame // 60) % 2 == 0 else 1
+    if frame % 5 == 0:
+        return [pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=direction)]
+    return []
+
+def make_menu(game):
+    from game.scenes.menu_scene import MenuScene
+    return MenuScene(game), menu_script
+
+def make_game(game):
+    from game.scenes.game_scene import GameScene
+    scene = GameScene(game)
+    game.scene_manager.add_scene("game_scene", scene)
+    return scene, walk_script
+
+def make_game_demo(game):
+    scene, _ = make_game(game)
+    scene.enter_demo_mode() # Driven by the demo AI in update_demo
+    return scene, idle_script
+
+def make_resume(game):
+    from game.scenes.resume_scene import ResumeScene
+    return ResumeScene(game), scroll_script
+
+def make_zone(zone_class_path):
+    module_name, class_name = zone_class_path.rsplit(".", 1)
+
+    def factory(game):
+        module = __import__(module_name, fromlist=[class_name])
+        scene = getattr(module, class_name)(game)
+        scene.enter()
+        return scene, walk_script
+    return factory
+
+SCENARIOS = {
+    "menu": make_menu,
+    "game": make_game,
+    "game_demo": make_game_demo,
+    "resume": make_resume,
+    "zone1": make_zone("game.scenes.zones.zone1.Zone1"),
+    "zone2": make_zone("game.scenes.zones.zone2.Zone2"),
+    "zone3": make_zone("game.scenes.zones.zone3.Zone3"),
+    "zone4": make_zone("game.scenes.zones.zone4.Zone4"),
+}
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def summarize(values):
+    ordered = sorted(values)
+    return {
+        "p50": percentile(ordered, 0.50),
+        "p95": percentile(ordered, 0.95),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else 0.0,
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+    }
+
+def _run_frames(scene, script, frames, screen, on_frame=None):
+    dt = 1.0 / SIMULATION_TICK_RATE
+    for frame in range(frames):
+        events = script(frame, scene)
+        scene.handle_events(events)
+        on_frame and on_frame("update_start")
+        scene.update(dt)
+        on_frame and on_frame("update_end")
+        scene.draw(screen)
+        on_frame and on_frame("draw_end")
+
+def _setup(name):
+    game = BenchmarkGame()
+    InputManager().keyboard_state = HeldKeys()
+    InputManager().prev_keyboard_state = HeldKeys()
+    scene, script = SCENARIOS[name](game)
+    return game, scene, script
+
+def run_scene(name, frames=DEFAULT_FRAMES, warmup=10):
+    """
+    Runs one scene and returns its report. Timing and memory tracing use separate passes.
+    pygame must already be initialized; it is kept alive across scenes because fonts
+    cached by the asset manager don't survive a pygame.quit().
+    """
+    game, scene, script = _setup(name)
+    try:
+        # Warm caches (fonts, text, tile chunks) so they don't skew the first frames
+        _run_frames(scene, script, warmup, game.screen)
+
+        update_ms, draw_ms, allocations = [], [], []
+        marks = {}
+
+        def on_frame(stage):
+            marks[stage] = (time.perf_counter(), sys.getallocatedblocks())
+            if stage == "draw_end":
+                update_ms.append((marks["update_end"][0] - marks["update_start"][0]) * 1000.0)
+                draw_ms.append((marks["draw_end"][0] - marks["update_end"][0]) * 1000.0)
+                allocations.append(marks["draw_end"][1] - marks["update_start"][1])
+
+        _run_frames(scene, script, frames, game.screen, on_frame)
+
+        # tracemalloc slows everything down, so peak memory gets its own pass
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        _run_frames(scene, script, frames, game.screen)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        InputManager().keyboard_state = {}
+        InputManager().prev_keyboard_state = {}
+
+    return {
+        "frames": frames,
+        "update_ms": summarize(update_ms),
+        "draw_ms": summarize(draw_ms),
+        "allocated_blocks_per_frame": summarize(allocations),
+        "peak_memory_bytes": peak - baseline,
+    }
+
+def run(scene_names=None, frames=DEFAULT_FRAMES):
+    scene_names = scene_names or list(SCENARIOS)
+    unknown = [name for name in scene_names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenes: {', '.join(unknown)}")
+
+    pygame.init()
+    try:
+        scenes = {name: run_scene(name, frames) for name in scene_names}
+    finally:
+        pygame.quit()
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frames": frames,
+        },
+        "scenes": scenes,
+    }
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Returns a list of regressions: metrics in current that are slower than baseline by
+    more than threshold (a fraction, 0.15 = 15%). Scenes missing from either run are skipped.
+    """
+    regressions = []
+    for name, report in current["scenes"].items():
+        base_report = baseline["scenes"].get(name)
+        if base_report is None:
+            continue
+        for metric, stats in COMPARED_METRICS.items():
+            for stat in stats:
+                old = base_report[metric][stat]
+                new = report[metric][stat]
+                if new - old <= MIN_ABSOLUTE_DELTA_MS:
+                    continue
+                change = (new - old) / old if old else float("inf")
+                if change > threshold:
+                    regressions.append({
+                        "scene": name,
+                        "metric": f"{metric}.{stat}",
+                        "baseline": old,
+                        "current": new,
+                        "change": change,
+                    })
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless scene benchmark")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames per scene")
+    parser.add_argument("--scenes", nargs="+", choices=list(SCENARIOS), help="scenes to run (default: all)")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    report = run(args.scenes, args.frames)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['scene']} {r['metric']}: {r['baseline']:.3f}ms -> {r['current']:.3f}ms "
+                  f"(+{r['change'] * 100:.1f}%)", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,15 @@ import os
 import sys
 import subprocess
 import shutil
+from pack_assets import pack_assets
 
-def build_executable():
-    """Build the standalone executable for Windows distribution."""
+def build_executable(onedir=False):
+    """
+    Build the standalone executable for Windows distribution.
+
+    onedir builds a folder instead of a single file; it starts noticeably faster
+    because nothing has to be unpacked to a temp directory on every launch.
+    """
 
     # Check if PyInstaller is installed
     try:
@@ -24,21 +30,27 @@ def build_executable():
     if os.path.exists("dist"):
         shutil.rmtree("dist")
 
+    # All assets go into one indexed file instead of hundreds of loose ones
+    pack_assets("assets", "assets.pak")
+
     # PyInstaller command
     cmd = [
         "pyinstaller",
-        "--onefile",  # Create a single executable file
+        "--onedir" if onedir else "--onefile",  # Single file unpacks itself on every start
         "--windowed",  # Don't show console window
         "--name", "Pixel_Art_RPG_Portfolio",
-        "--add-data", f"assets{os.pathsep}assets",  # Include assets directory
+        "--add-data", f"assets.pak{os.pathsep}.",  # Packed assets (read via mmap by AssetManager)
         "--add-data", f"config.py{os.pathsep}.",  # Include config file
         "--add-data", f"savegame.json{os.pathsep}.",  # Include save file
         "--hidden-import", "pygame",
-        "--hidden-import", "pygame_gui",
         "--hidden-import", "pytmx",
-        "--hidden-import", "PIL",
         "--hidden-import", "numpy",
         "--hidden-import", "jsonschema",
+        # pygame.pkgdata falls back to plain file paths without pkg_resources, which
+        # otherwise costs ~120ms of imports at startup and bloats the archive
+        "--exclude-module", "pkg_resources",
+        "--exclude-module", "setuptools",
+        "--exclude-module", "tkinter",
         "main.py"
     ]
 
@@ -46,7 +58,10 @@ def build_executable():
     subprocess.check_call(cmd)
 
     print("Build completed successfully!")
-    print(f"Executable created at: {os.path.join('dist', 'Pixel_Art_RPG_Portfolio.exe')}")
+    if onedir:
+        print(f"Executable created at: {os.path.join('dist', 'Pixel_Art_RPG_Portfolio', 'Pixel_Art_RPG_Portfolio.exe')}")
+    else:
+        print(f"Executable created at: {os.path.join('dist', 'Pixel_Art_RPG_Portfolio.exe')}")
 
 if __name__ == "__main__":
-    build_executable()
\ No newline at end of file
+    build_executable(onedir="--onedir" in sys.argv)
\ No newline at end of file
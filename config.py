@@ -1,3 +1,4 @@
+import os
 import pygame
 
 # Screen dimensions
@@ -27,6 +28,22 @@ BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 CYAN = (0, 255, 255)
 MAGENTA = (255, 0, 255)
+PURPLE = (128, 0, 128)
+ORANGE = (255, 165, 0)
+TEAL = (0, 128, 128)
+
+# World
+# Zones are larger than the screen; the camera is clamped to these bounds.
+WORLD_WIDTH = 1600
+WORLD_HEIGHT = 1200
+
+# Zone names, keyed by zone id
+ZONES = {
+    1: "Test Automation Lab",
+    2: "Data Analytics Hub",
+    3: "AI/ML Research Center",
+    4: "Systems Engineering Plant",
+}
 
 # Game states
 GAME_STATE_MENU = 0
@@ -41,5 +58,102 @@ KEYS = {
     "LEFT": pygame.K_a,
     "RIGHT": pygame.K_d,
     "INTERACT": pygame.K_e,
-    "MENU": pygame.K_ESCAPE
+    "MENU": pygame.K_ESCAPE,
+    "PROFILER": pygame.K_F3,
+    "PROFILER_EXPORT": pygame.K_F4
+}
+
+# Particles
+# Colors are quantized to 4 bits per channel and share one atlas per particle size, holding
+# at most this many; past it the least recently used color's square is reused.
+PARTICLE_ATLAS_MAX_COLORS = 256
+
+# Local caches
+# Measured and compiled data kept between runs, next to the game rather than the working directory.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+# Tilemap rendering
+# Tile layers are pre-baked into square chunks of this many tiles per side.
+TILEMAP_CHUNK_SIZE = 16
+# Compiled (binary) forms of TMX maps are cached here, keyed by the TMX content hash.
+MAP_CACHE_DIR = os.path.join(CACHE_DIR, "maps")
+
+# Text rendering
+# Upper bound for pixel bytes held by the shared TextCache.
+TEXT_CACHE_BUDGET_BYTES = 4 * 1024 * 1024
+
+# Dirty-rectangle rendering (opt-in)
+# Scenes that report changed regions are presented with pygame.display.update(rects).
+# Falls back to a full flip when the changed area exceeds this fraction of the screen.
+DIRTY_RECT_RENDERING = False
+DIRTY_RECT_FULL_FLIP_RATIO = 0.5
+
+# Scenes
+# Scenes are built on first use. While a scene is showing, the ones it is likely to lead to
+# are built ahead of time, one per frame, in frames with at least this much time to spare
+# and no less than the scene's expected build time.
+SCENE_WARMUP_MIN_IDLE_MS = 8
+SCENE_WARMUP = {
+    "menu_scene": ["game_scene", "resume_scene", "about_scene"],
+}
+# Expected build time (ms) of scenes not measured yet; measured times are saved here on quit.
+SCENE_BUILD_ESTIMATES_MS = {"game_scene": 50}
+SCENE_BUILD_TIMES_PATH = os.path.join(CACHE_DIR, "scene_build_times.json")
+
+# Portfolio data
+# Transformed JSONPipeline results, keyed by the source file's content hash.
+JSON_PIPELINE_CACHE_DIR = os.path.join(CACHE_DIR, "json_pipeline")
+
+# Leveling
+# Reaching level 2 costs XP_FIRST_LEVEL; each further level costs XP_GROWTH times the last.
+XP_FIRST_LEVEL = 100
+XP_GROWTH = 1.5
+MAX_LEVEL = 100
+
+# Startup
+# Cold start (imports through the first menu frame) must stay under this; checked by
+# `python main.py --profile-startup` and tests/test_startup_profile.py.
+STARTUP_BUDGET_MS = 1500
+
+# Simulation
+# Scenes are updated in fixed steps of 1 / SIMULATION_TICK_RATE seconds, independent of FPS.
+SIMULATION_TICK_RATE = 60
+# Upper bound on catch-up steps per rendered frame; older backlog is dropped.
+MAX_SIMULATION_STEPS_PER_FRAME = 5
+
+# Frame profiler (toggle with KEYS["PROFILER"], export with KEYS["PROFILER_EXPORT"])
+# Number of frames kept for the overlay graph and exported traces.
+PROFILER_HISTORY_FRAMES = 240
+# Frame time drawn as the reference line on the overlay.
+PROFILER_FRAME_BUDGET_MS = 1000.0 / FPS
+
+# Lighting
+# Brightness (0-255) of unlit areas; 55 matches the old 200-alpha darkness overlay.
+LIGHTING_AMBIENT = 55
+# The light map is composited at 1/LIGHTING_SCALE resolution and upscaled to the screen.
+LIGHTING_SCALE = 2
+# Light around the player and around interactables (terminals, NPCs).
+PLAYER_LIGHT_RADIUS = 150
+INTERACTABLE_LIGHT_RADIUS = 64
+
+# Asset loading
+# Worker threads decoding images, sounds, fonts and JSON in the background.
+ASSET_LOADER_WORKERS = 2
+# Assets finished per AssetManager.poll() when loading synchronously (web build).
+ASSET_LOADS_PER_POLL = 2
+
+# Asset cache budgets (bytes of decoded data held by AssetManager, per cache).
+# Least recently used assets are evicted past the budget; pinned assets never are.
+ASSET_CACHE_BUDGETS = {
+    "image": 96 * 1024 * 1024,
+    "sound": 48 * 1024 * 1024,
+    "font": 4 * 1024 * 1024,
+    "json": 8 * 1024 * 1024,
+}
+# Browser build: the tab has a hard memory ceiling
+ASSET_CACHE_BUDGETS_WEB = {
+    "image": 32 * 1024 * 1024,
+    "sound": 16 * 1024 * 1024,
+    "font": 2 * 1024 * 1024,
+    "json": 4 * 1024 * 1024,
 }
@@ -1,10 +1,40 @@
 import pygame
+import weakref
+
+# Frames cut (and scaled) from a sprite sheet, shared by every entity using that sheet.
+# sprite_sheet -> {(x, y, w, h, target_w, target_h): Surface}. Weak keys let the
+# frames go away together with the sheet when the asset cache drops it.
+_frame_cache = weakref.WeakKeyDictionary()
+
+def get_frame(sprite_sheet, rect, target_size=None):
+    """Returns the frame at rect, scaled to target_size, building it only once per sheet."""
+    rect = pygame.Rect(rect)
+    if target_size is None:
+        target_size = rect.size
+    key = (rect.x, rect.y, rect.w, rect.h, target_size[0], target_size[1])
+
+    sheet_frames = _frame_cache.get(sprite_sheet)
+    if sheet_frames is None:
+        sheet_frames = {}
+        _frame_cache[sprite_sheet] = sheet_frames
+
+    frame = sheet_frames.get(key)
+    if frame is None:
+        frame = sprite_sheet.subsurface(rect)
+        if tuple(target_size) != rect.size:
+            frame = pygame.transform.scale(frame, target_size)
+        else:
+            frame = frame.copy() # A subsurface references its sheet and would keep the weak key alive
+        sheet_frames[key] = frame
+    return frame
 
 class AnimationComponent:
-    def __init__(self, sprite_sheet, frame_width, frame_height):
+    def __init__(self, sprite_sheet, frame_width, frame_height, target_size=None):
         self.sprite_sheet = sprite_sheet
         self.frame_width = frame_width
         self.frame_height = frame_height
+        # Frames are pre-scaled to this size so callers can blit them as-is
+        self.target_size = target_size
         self.animations = {}
         self.current_animation = None
         self.current_frame_index = 0
@@ -20,7 +50,7 @@ class AnimationComponent:
             try:
                 # Ensure the rect is within the sprite sheet
                 if rect.right <= self.sprite_sheet.get_width() and rect.bottom <= self.sprite_sheet.get_height():
-                     frames.append(self.sprite_sheet.subsurface(rect))
+                     frames.append(get_frame(self.sprite_sheet, rect, self.target_size))
                 else:
                     print(f"Warning: Frame {i} in animation {name} is out of bounds.")
             except ValueError as e:
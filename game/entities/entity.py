@@ -1,6 +1,8 @@
 import pygame
 
 from game.managers.asset_manager import AssetManager
+from game.components.animation_component import get_frame
+from game.utils.text_cache import TextCache
 from config import MAGENTA, BLACK
 
 class Entity(pygame.sprite.Sprite):
@@ -13,11 +15,11 @@ class Entity(pygame.sprite.Sprite):
         if asset_key:
             loaded_image = self.asset_manager.get_image(asset_key)
             if loaded_image:
-                self.image = pygame.transform.scale(loaded_image, (width, height))
+                self.image = get_frame(loaded_image, loaded_image.get_rect(), (width, height))
             else:
                 loaded_image = self.asset_manager.load_image(asset_key)
                 if loaded_image:
-                     self.image = pygame.transform.scale(loaded_image, (width, height))
+                     self.image = get_frame(loaded_image, loaded_image.get_rect(), (width, height))
                 else:
                     self.image = self._create_missing_texture_surface(width, height)
         elif image:
@@ -26,6 +28,9 @@ class Entity(pygame.sprite.Sprite):
             self.image = self._create_missing_texture_surface(width, height)
 
         self.rect = self.image.get_rect(topleft=(x, y))
+        # Sub-pixel position the rect follows, plus last step's position for render interpolation
+        self.position = pygame.math.Vector2(self.rect.topleft)
+        self.previous_position = pygame.math.Vector2(self.position)
         self.velocity = pygame.math.Vector2(0, 0)
         self.speed = 0
         self.interaction_range = 50 # Default interaction range
@@ -40,17 +45,22 @@ class Entity(pygame.sprite.Sprite):
              dist = entity_center.distance_to(pygame.math.Vector2(player_pos))
 
         if dist < self.interaction_range:
-            # Draw white outline
-            pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)
-            # Draw "!" bubble
-            font = pygame.font.Font(None, 30)
-            text = font.render("!", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(self.rect.centerx, self.rect.top - 20))
-            # Draw bubble bg
-            bubble_rect = text_rect.inflate(10, 10)
-            pygame.draw.ellipse(screen, (0, 0, 0), bubble_rect)
-            pygame.draw.ellipse(screen, (255, 255, 255), bubble_rect, 2)
-            screen.blit(text, text_rect)
+            self.draw_interaction_marker(screen)
+
+    def draw_interaction_marker(self, screen, offset=(0, 0)):
+        # Outline + "!" bubble, drawn for entities the player can interact with
+        rect = self.rect.move(offset)
+        # Draw white outline
+        pygame.draw.rect(screen, (255, 255, 255), rect, 2)
+        # Draw "!" bubble
+        text_cache = TextCache()
+        text = text_cache.render(text_cache.get_font(30), "!", True, (255, 255, 255))
+        text_rect = text.get_rect(center=(rect.centerx, rect.top - 20))
+        # Draw bubble bg
+        bubble_rect = text_rect.inflate(10, 10)
+        pygame.draw.ellipse(screen, (0, 0, 0), bubble_rect)
+        pygame.draw.ellipse(screen, (255, 255, 255), bubble_rect, 2)
+        screen.blit(text, text_rect)
 
     def _create_missing_texture_surface(self, width, height):
         surface = pygame.Surface((width, height))
@@ -66,8 +76,25 @@ class Entity(pygame.sprite.Sprite):
         return surface
 
     def update(self, dt):
-        self.rect.x += self.velocity.x * self.speed * dt
-        self.rect.y += self.velocity.y * self.speed * dt
+        # Rect was moved directly (teleport, collision push): snap without interpolating
+        if (round(self.position.x), round(self.position.y)) != self.rect.topleft:
+            self.position.update(self.rect.topleft)
+        self.previous_position.update(self.position)
+
+        self.position.x += self.velocity.x * self.speed * dt
+        self.position.y += self.velocity.y * self.speed * dt
+        self.rect.topleft = (round(self.position.x), round(self.position.y))
+
+    def get_render_position(self, alpha=1.0):
+        # Position between the last two simulation steps, alpha from the fixed-timestep loop
+        if (round(self.position.x), round(self.position.y)) != self.rect.topleft:
+            return self.rect.topleft
+        render_position = self.previous_position.lerp(self.position, alpha)
+        return (round(render_position.x), round(render_position.y))
 
     def draw(self, screen):
         screen.blit(self.image, self.rect)
+
+    def render(self, screen, camera_x=0, camera_y=0):
+        # Camera-relative draw used by the zones
+        screen.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
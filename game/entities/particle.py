@@ -1,6 +1,12 @@
 import pygame
 import random
-from config import SUCCESS_GREEN
+from collections import OrderedDict
+from config import SUCCESS_GREEN, PARTICLE_ATLAS_MAX_COLORS
+
+try:
+    import numpy as np
+except ImportError: # ParticleSystem falls back to one sprite per particle
+    np = None
 
 class Particle(pygame.sprite.Sprite):
     def __init__(self, x, y, color=SUCCESS_GREEN, lifetime=1.0):
@@ -20,16 +26,172 @@ class Particle(pygame.sprite.Sprite):
         self.rect.x += self.velocity.x * dt
         self.rect.y += self.velocity.y * dt
 
+class ParticleAtlas:
+    """
+    One small surface holding a size x size square per particle color, in a grid of
+    COLUMNS squares per row. Shared by every particle engine using the same particle size.
+    Rows are added by doubling up to max_colors squares; past that the least recently
+    used color's square is repainted, recoloring any particles still using it.
+    """
+    COLUMNS = 16
+    _atlases = {}
+
+    @classmethod
+    def get(cls, size):
+        if size not in cls._atlases:
+            cls._atlases[size] = cls(size)
+        return cls._atlases[size]
+
+    def __init__(self, size, max_colors=PARTICLE_ATLAS_MAX_COLORS):
+        self.size = size
+        self.max_colors = max_colors
+        self.columns = min(self.COLUMNS, max_colors)
+        self.surface = None
+        self.areas = [] # palette index -> area rect inside the atlas
+        self.palette = OrderedDict() # quantized color -> palette index, least recently used first
+        self._resize(self.columns)
+
+    @staticmethod
+    def quantize(color):
+        # 4 bits per channel; 0 and 255 stay exact
+        return tuple((channel >> 4) * 17 for channel in tuple(color)[:3])
+
+    def _resize(self, slots):
+        rows = -(-slots // self.columns)
+        surface = pygame.Surface((self.columns * self.size, rows * self.size))
+        if self.surface is not None:
+            surface.blit(self.surface, (0, 0)) # Existing squares keep their place
+        if pygame.display.get_surface():
+            surface = surface.convert()
+        self.surface = surface
+        self.areas = [pygame.Rect((i % self.columns) * self.size, (i // self.columns) * self.size, self.size, self.size)
+                      for i in range(slots)]
+
+    def index_for(self, color):
+        color = self.quantize(color)
+        index = self.palette.get(color)
+        if index is not None:
+            self.palette.move_to_end(color)
+            return index
+
+        if len(self.palette) < self.max_colors:
+            index = len(self.palette)
+            if index == len(self.areas):
+                self._resize(min(len(self.areas) * 2, self.max_colors))
+        else:
+            _, index = self.palette.popitem(last=False)
+        self.surface.fill(color, self.areas[index])
+        self.palette[color] = index
+        return index
+
+class ParticleEngine:
+    """
+    Structure-of-arrays particle storage: position, velocity, age, lifetime and
+    color live in preallocated NumPy arrays and are updated in bulk. Live particles
+    are always packed in [0, count); dead ones are replaced by live ones from the tail.
+    """
+
+    def __init__(self, capacity=1024, size=4, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.size = size
+        self.atlas = ParticleAtlas.get(size)
+        self.rng = np.random.default_rng(seed)
+
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.float32)
+        self.color_index = np.zeros(capacity, dtype=np.int32)
+
+    def _arrays(self):
+        return (self.position, self.velocity, self.age, self.lifetime, self.color_index)
+
+    def _grow(self, needed):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        for name in ("position", "velocity", "age", "lifetime", "color_index"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def emit(self, x, y, count, color, lifetime=1.0, speed=50):
+        if self.count + count > self.capacity:
+            self._grow(self.count + count)
+
+        start, end = self.count, self.count + count
+        self.position[start:end] = (x, y)
+        self.velocity[start:end] = self.rng.uniform(-speed, speed, (count, 2))
+        self.age[start:end] = 0
+        self.lifetime[start:end] = lifetime
+        self.color_index[start:end] = self.atlas.index_for(color)
+        self.count = end
+
+    def update(self, dt):
+        n = self.count
+        if not n:
+            return
+
+        self.age[:n] += dt
+        self.position[:n] += self.velocity[:n] * dt
+
+        alive = self.age[:n] < self.lifetime[:n]
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count == n:
+            return
+
+        # Swap-compaction: every dead slot below alive_count is filled by a live
+        # particle from above it, so only len(holes) rows move.
+        holes = np.flatnonzero(~alive[:alive_count])
+        movers = np.flatnonzero(alive[alive_count:]) + alive_count
+        for array in self._arrays():
+            array[holes] = array[movers]
+        self.count = alive_count
+
+    def draw(self, screen):
+        n = self.count
+        if not n:
+            return
+
+        half = self.size / 2
+        coords = (self.position[:n] - half).astype(np.int32).tolist()
+        areas = self.atlas.areas
+        source = self.atlas.surface
+        screen.blits([(source, pos, areas[i]) for pos, i in zip(coords, self.color_index[:n].tolist())], doreturn=False)
+
+    def __len__(self):
+        return self.count
+
 class ParticleSystem:
     def __init__(self):
-        self.particles = pygame.sprite.Group()
+        if np is not None:
+            self.engine = ParticleEngine()
+            self.particles = None
+        else:
+            self.engine = None
+            self.particles = pygame.sprite.Group()
 
     def emit(self, x, y, count=15, color=SUCCESS_GREEN):
+        if self.engine is not None:
+            self.engine.emit(x, y, count, color)
+            return
         for _ in range(count):
             self.particles.add(Particle(x, y, color))
 
     def update(self, dt):
-        self.particles.update(dt)
+        if self.engine is not None:
+            self.engine.update(dt)
+        else:
+            self.particles.update(dt)
 
     def draw(self, screen):
-        self.particles.draw(screen)
+        if self.engine is not None:
+            self.engine.draw(screen)
+        else:
+            self.particles.draw(screen)
+
+    def __len__(self):
+        return len(self.engine) if self.engine is not None else len(self.particles)
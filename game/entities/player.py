@@ -2,6 +2,7 @@ import pygame
 from game.entities.entity import Entity
 from game.managers.input_manager import InputManager
 from game.components.animation_component import AnimationComponent
+from game.utils.xp_table import level_for_xp, xp_for_level
 from config import BLACK, WHITE
 
 class Player(Entity):
@@ -10,6 +11,8 @@ class Player(Entity):
         # We will handle the image setting via animation component
         super().__init__(x, y, width, height, image=image)
         self.speed = 200 # pixels per second
+        self.level = 1
+        self.experience = 0
         self.input_manager = InputManager() # Singleton instance
 
         self.animation = None
@@ -28,7 +31,8 @@ class Player(Entity):
                 # Assume 4 columns (frames)
                 frame_w = sheet_width // 4
 
-                self.animation = AnimationComponent(spritesheet, frame_w, frame_h)
+                # Frames are scaled once to the entity size and shared through the frame cache
+                self.animation = AnimationComponent(spritesheet, frame_w, frame_h, target_size=(self.width, self.height))
                 self.animation.add_animation("down", 0, 4)
                 self.animation.add_animation("left", 1, 4)
                 self.animation.add_animation("right", 2, 4)
@@ -38,9 +42,21 @@ class Player(Entity):
                 # Set initial image
                 current_frame = self.animation.get_current_frame()
                 if current_frame:
-                    self.image = pygame.transform.scale(current_frame, (self.width, self.height))
+                    self.image = current_frame
 
 
+    @property
+    def max_experience(self):
+        """Total XP at which the next level is reached (the XP bar's end)."""
+        return xp_for_level(self.level + 1)
+
+    def gain_experience(self, amount):
+        """Adds XP and levels up from the shared XP table; returns the number of levels gained."""
+        self.experience += amount
+        previous_level = self.level
+        self.level = level_for_xp(self.experience)
+        return self.level - previous_level
+
     def update(self, dt, velocity_override=None):
         if velocity_override:
             self.velocity = pygame.math.Vector2(velocity_override)
@@ -78,7 +94,7 @@ class Player(Entity):
             self.animation.update(dt)
             current_frame = self.animation.get_current_frame()
             if current_frame:
-                 self.image = pygame.transform.scale(current_frame, (self.width, self.height))
+                 self.image = current_frame
 
             # Idle frame logic (REQ-VISUAL-04: Idle frame when velocity == 0)
             if self.velocity.length() == 0:
@@ -88,7 +104,7 @@ class Player(Entity):
                  # We need to update image immediately
                  current_frame = self.animation.get_current_frame()
                  if current_frame:
-                      self.image = pygame.transform.scale(current_frame, (self.width, self.height))
+                      self.image = current_frame
 
         super().update(dt) # Call parent's update for position change
 
@@ -1,8 +1,80 @@
 import pygame
 import os
+import io
 import json
 import logging
-from typing import Dict, Any, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List
+from config import ASSET_LOADER_WORKERS, ASSET_LOADS_PER_POLL, ASSET_CACHE_BUDGETS, ASSET_CACHE_BUDGETS_WEB
+from game.utils.asset_pack import AssetPack
+from game.utils.lru_cache import SizedLRUCache
+from game.utils.runtime import threads_available, is_web
+from game.utils.startup_profile import StartupProfile
+
+# Per-zone asset lists, under assets/data
+ZONE_MANIFEST = "zone_manifest.json"
+
+# Subdirectory of the assets root for each kind of asset
+ASSET_FOLDERS = {"image": "sprites", "font": "fonts", "sound": "sounds", "json": "data"}
+
+# Resident-size estimates used for the cache budgets
+
+def _image_bytes(key, image) -> int:
+    return image.get_width() * image.get_height() * image.get_bytesize()
+
+def _sound_bytes(key, sound) -> int:
+    mixer = pygame.mixer.get_init()
+    if mixer:
+        frequency, sample_format, channels = mixer
+        return int(sound.get_length() * frequency * channels * (abs(sample_format) // 8))
+    return len(sound.get_raw())
+
+def _font_bytes(key, font) -> int:
+    # A loaded font keeps its file in memory; fonts that fell back to the default use pygame's
+    path = key[0]
+    if not os.path.exists(path):
+        path = os.path.join(os.path.dirname(pygame.font.__file__), pygame.font.get_default_font())
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def _json_bytes(key, data) -> int:
+    return len(json.dumps(data))
+
+class AssetBatch:
+    """
+    A group of asset requests loading in the background. Each request has a Future
+    that resolves (on the main thread, from AssetManager.poll) to the cached asset.
+    """
+
+    def __init__(self, requests: List[Tuple], only_retained: bool = False):
+        self.requests = list(requests)
+        # Prefetches only cache assets whose zone is still retained when they finish
+        self.only_retained = only_retained
+        self.futures: Dict[Tuple, Future] = {request: Future() for request in self.requests}
+        self.failed: List[Tuple] = []
+
+    @property
+    def total(self) -> int:
+        return len(self.futures)
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for future in self.futures.values() if future.done())
+
+    @property
+    def progress(self) -> float:
+        """Fraction of requests finished (loaded or failed), 1.0 for an empty batch."""
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return all(future.done() for future in self.futures.values())
+
+    def result(self, request: Tuple) -> Any:
+        return self.futures[request].result(timeout=0)
 
 class AssetManager:
     _instance = None
@@ -10,72 +82,232 @@ class AssetManager:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(AssetManager, cls).__new__(cls)
-            cls._instance.images = {}
-            cls._instance.fonts = {}
-            cls._instance.sounds = {}
-            cls._instance.json_data = {}
+            # Budgets are tighter in the browser build, where the tab has a hard memory ceiling
+            budgets = ASSET_CACHE_BUDGETS_WEB if is_web() else ASSET_CACHE_BUDGETS
+            cls._instance.images = SizedLRUCache(budgets["image"], _image_bytes, "images")
+            cls._instance.fonts = SizedLRUCache(budgets["font"], _font_bytes, "fonts")
+            cls._instance.sounds = SizedLRUCache(budgets["sound"], _sound_bytes, "sounds")
+            cls._instance.json_data = SizedLRUCache(budgets["json"], _json_bytes, "json")
             cls._instance.base_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets')
             cls._instance.logger = logging.getLogger("AssetManager")
+            cls._instance.startup_profile = StartupProfile()
+            cls._instance.executor = None
+            cls._instance.pending = deque() # (batch, request, worker future or None)
+            cls._instance.zone_refcounts = {} # request -> number of retained zones using it
+            cls._instance.retained_zones = set()
+            cls._instance.prefetch = None
+            cls._instance._pack = None
+            cls._instance._pack_path = None
         return cls._instance
 
+    # Asset sources: assets come from <base_path>.pak (see pack_assets.py) when it exists
+    # and contains them, otherwise from the loose files under base_path.
+
+    def get_pack(self) -> Optional[AssetPack]:
+        pack_path = os.path.normpath(self.base_path) + ".pak"
+        if pack_path != self._pack_path:
+            if self._pack is not None:
+                self._pack.close()
+            self._pack, self._pack_path = None, pack_path
+            if os.path.exists(pack_path):
+                try:
+                    self._pack = AssetPack(pack_path)
+                    self.logger.info(f"Using asset pack {pack_path} ({len(self._pack)} files)")
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"Ignoring asset pack {pack_path}: {e}")
+        return self._pack
+
+    def get_source(self, folder: str, path: str) -> Any:
+        """
+        A file object reading from the pack, or the loose file path. pygame's image, sound,
+        font and music loaders accept either.
+        """
+        pack = self.get_pack()
+        if pack is not None:
+            name = os.path.normpath(os.path.join(folder, path)).replace(os.sep, "/")
+            if name in pack:
+                return pack.open(name)
+        return os.path.join(self.base_path, folder, path)
+
+    def _read_json(self, path: str) -> Any:
+        source = self.get_source('data', path)
+        if isinstance(source, str):
+            with open(source, 'r') as f:
+                return json.load(f)
+        return json.load(io.TextIOWrapper(source, encoding='utf-8'))
+
+    # Background loading: files are read and decoded on a worker pool, anything
+    # that touches the display (convert_alpha) happens on the main thread in poll().
+
+    def _full_path(self, kind: str, path: str) -> str:
+        return os.path.join(self.base_path, ASSET_FOLDERS[kind], path)
+
+    def _cache_for(self, kind: str) -> SizedLRUCache:
+        return {"image": self.images, "font": self.fonts, "sound": self.sounds, "json": self.json_data}[kind]
+
+    def _cache_key(self, request: Tuple) -> Any:
+        kind, path = request[0], request[1]
+        full_path = self._full_path(kind, path)
+        return (full_path, request[2]) if kind == "font" else full_path
+
+    def _decode(self, request: Tuple) -> Any:
+        """Runs on a worker thread. Must not touch the display or SDL_ttf."""
+        kind, path = request[0], request[1]
+        if kind == "json":
+            return self._read_json(path)
+        if kind == "font":
+            return request # SDL_ttf isn't thread-safe; poll opens the Font
+        source = self.get_source(ASSET_FOLDERS[kind], path)
+        if kind == "image":
+            return pygame.image.load(source, os.path.basename(path))
+        return pygame.mixer.Sound(source)
+
+    def _open_font(self, request: Tuple) -> pygame.font.Font:
+        """Main thread only, like every other SDL_ttf call."""
+        source = self.get_source(ASSET_FOLDERS["font"], request[1])
+        if isinstance(source, str) and not os.path.exists(source):
+            source = None
+        return pygame.font.Font(source, request[2])
+
+    def _finalize(self, request: Tuple, asset: Any) -> Any:
+        """Main-thread half of a load: display conversion and caching."""
+        if request[0] == "image" and pygame.display.get_surface():
+            asset = asset.convert_alpha()
+        self._cache_for(request[0])[self._cache_key(request)] = asset
+        return asset
+
+    def load_batch(self, requests: List[Tuple], only_retained: bool = False) -> AssetBatch:
+        """
+        Queues ("image", path), ("sound", path), ("json", path) and ("font", path, size)
+        requests. Already cached assets resolve immediately; call poll() every frame to
+        finish the rest. Without threads (web build) assets load a few per poll() instead.
+        """
+        batch = AssetBatch(requests, only_retained)
+        for request in batch.requests:
+            cached = self._cache_for(request[0]).get(self._cache_key(request))
+            if cached is not None:
+                batch.futures[request].set_result(cached)
+                continue
+
+            worker_future = None
+            if threads_available():
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(max_workers=ASSET_LOADER_WORKERS, thread_name_prefix="AssetLoader")
+                worker_future = self.executor.submit(self._decode, request)
+            self.pending.append((batch, request, worker_future))
+        return batch
+
+    def poll(self, max_loads: int = ASSET_LOADS_PER_POLL) -> int:
+        """Finishes decoded assets on the main thread. Returns how many were finished."""
+        finished = 0
+        still_pending = deque()
+        while self.pending:
+            batch, request, worker_future = self.pending.popleft()
+            if worker_future is None:
+                # Synchronous fallback, spread over frames so a loading bar can still advance
+                if finished >= max_loads:
+                    still_pending.append((batch, request, worker_future))
+                    continue
+            elif not worker_future.done():
+                still_pending.append((batch, request, worker_future))
+                continue
+
+            future = batch.futures[request]
+            try:
+                asset = worker_future.result() if worker_future is not None else self._decode(request)
+                if request[0] == "font":
+                    asset = self._open_font(request)
+                if batch.only_retained and request not in self.zone_refcounts:
+                    future.set_result(asset) # Zone was left before this finished, don't cache it
+                else:
+                    future.set_result(self._finalize(request, asset))
+            except Exception as e:
+                self.logger.error(f"Error loading {request[0]} {request[1]}: {e}")
+                batch.failed.append(request)
+                future.set_exception(e)
+            finished += 1
+        self.pending = still_pending
+        return finished
+
+    def wait(self, batch: AssetBatch) -> AssetBatch:
+        """Blocks until the batch is finished, e.g. for loading screens that can't yield."""
+        while not batch.done:
+            for _, _, worker_future in list(self.pending):
+                if worker_future is not None:
+                    worker_future.exception() # Block until this one is decoded
+            self.poll(max_loads=len(self.pending) or 1)
+        return batch
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    # The caches may drop entries (budget) or refuse ones bigger than the whole budget,
+    # so loaders return what they loaded rather than reading it back from the cache.
+
     def load_json(self, path: str) -> Optional[Any]:
         full_path = os.path.join(self.base_path, 'data', path)
-        if full_path not in self.json_data:
-            try:
-                with open(full_path, 'r') as f:
-                    data = json.load(f)
-                self.json_data[full_path] = data
-            except (FileNotFoundError, json.JSONDecodeError) as e:
-                self.logger.error(f"Error loading JSON {full_path}: {e}")
-                return None
-        return self.json_data[full_path]
+        data = self.json_data.get(full_path)
+        if data is None:
+            with self.startup_profile.phase(f"load json {path}"):
+                try:
+                    data = self._read_json(path)
+                    self.json_data[full_path] = data
+                except (FileNotFoundError, json.JSONDecodeError) as e:
+                    self.logger.error(f"Error loading JSON {full_path}: {e}")
+                    return None
+        return data
 
     def get_json(self, path: str) -> Optional[Any]:
-        full_path = os.path.join(self.base_path, 'data', path)
-        return self.json_data.get(full_path) or self.load_json(path)
+        return self.load_json(path)
 
     def load_image(self, path: str, colorkey: Optional[Any] = None) -> Optional[pygame.Surface]:
         full_path = os.path.join(self.base_path, 'sprites', path)
-        if full_path not in self.images:
-            try:
-                image = pygame.image.load(full_path).convert_alpha()
-                if colorkey is not None:
-                    if colorkey == -1:
-                        colorkey = image.get_at((0,0))
-                    image.set_colorkey(colorkey)
-                self.images[full_path] = image
-            except pygame.error as e:
-                self.logger.error(f"Error loading image {full_path}: {e}")
-                return None
-        return self.images[full_path]
+        image = self.images.get(full_path)
+        if image is None:
+            with self.startup_profile.phase(f"load image {path}"):
+                try:
+                    image = pygame.image.load(self.get_source('sprites', path), os.path.basename(path)).convert_alpha()
+                    if colorkey is not None:
+                        if colorkey == -1:
+                            colorkey = image.get_at((0,0))
+                        image.set_colorkey(colorkey)
+                    self.images[full_path] = image
+                except pygame.error as e:
+                    self.logger.error(f"Error loading image {full_path}: {e}")
+                    return None
+        return image
 
     def load_font(self, path: str, size: int) -> pygame.font.Font:
         full_path = os.path.join(self.base_path, 'fonts', path)
         font_key = (full_path, size)
-        if font_key not in self.fonts:
-            try:
-                font = pygame.font.Font(full_path, size)
-                self.fonts[font_key] = font
-            except FileNotFoundError:
-                self.logger.warning(f"Error loading font {full_path}: File not found. Using default font.")
-                font = pygame.font.Font(None, size)
+        font = self.fonts.get(font_key)
+        if font is None:
+            with self.startup_profile.phase(f"load font {path}"):
+                try:
+                    font = pygame.font.Font(self.get_source('fonts', path), size)
+                except FileNotFoundError:
+                    self.logger.warning(f"Error loading font {full_path}: File not found. Using default font.")
+                    font = pygame.font.Font(None, size)
+                except Exception as e:
+                    self.logger.error(f"Error loading font {full_path}: {e}")
+                    font = pygame.font.Font(None, size)
                 self.fonts[font_key] = font
-            except Exception as e:
-                self.logger.error(f"Error loading font {full_path}: {e}")
-                font = pygame.font.Font(None, size)
-                self.fonts[font_key] = font
-        return self.fonts[font_key]
+        return font
 
     def load_sound(self, path: str) -> Optional[pygame.mixer.Sound]:
         full_path = os.path.join(self.base_path, 'sounds', path)
-        if full_path not in self.sounds:
-            try:
-                sound = pygame.mixer.Sound(full_path)
-                self.sounds[full_path] = sound
-            except pygame.error as e:
-                self.logger.error(f"Error loading sound {full_path}: {e}")
-                return None
-        return self.sounds[full_path]
+        sound = self.sounds.get(full_path)
+        if sound is None:
+            with self.startup_profile.phase(f"load sound {path}"):
+                try:
+                    sound = pygame.mixer.Sound(self.get_source('sounds', path))
+                    self.sounds[full_path] = sound
+                except pygame.error as e:
+                    self.logger.error(f"Error loading sound {full_path}: {e}")
+                    return None
+        return sound
 
     def get_image(self, path: str) -> Optional[pygame.Surface]:
         return self.images.get(os.path.join(self.base_path, 'sprites', path))
@@ -87,15 +319,83 @@ class AssetManager:
         return self.sounds.get(os.path.join(self.base_path, 'sounds', path))
 
     def clear_cache(self) -> None:
-        self.images = {}
-        self.fonts = {}
-        self.sounds = {}
-        self.json_data = {}
+        for cache in (self.images, self.fonts, self.sounds, self.json_data):
+            cache.clear()
 
-    def preload_zone_assets(self, zone_id: str) -> None:
+    def pin(self, kind: str, path: str, size: Optional[int] = None) -> None:
+        """Keeps an asset out of LRU and zone eviction, e.g. the player sprite or HUD fonts."""
+        request = (kind, path, size) if kind == "font" else (kind, path)
+        self._cache_for(kind).pin(self._cache_key(request))
+
+    def unpin(self, kind: str, path: str, size: Optional[int] = None) -> None:
+        request = (kind, path, size) if kind == "font" else (kind, path)
+        self._cache_for(kind).unpin(self._cache_key(request))
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses, evictions and resident bytes per cache."""
+        return {cache.name: cache.stats() for cache in (self.images, self.fonts, self.sounds, self.json_data)}
+
+    # Zone manifest: which assets each zone needs. The current zone and its adjacent
+    # zones are "retained"; every retained zone holds one reference on each of its
+    # assets, and an asset is evicted when its last reference goes away.
+
+    def get_zone_manifest(self) -> Dict[str, Any]:
+        return self.get_json(ZONE_MANIFEST) or {"common": {}, "zones": {}}
+
+    def _manifest_requests(self, entry: Dict[str, Any]) -> List[Tuple]:
+        # Music is streamed by pygame.mixer.music and maps are loaded by TileMapManager,
+        # so only sprites, sounds and fonts go through the caches
+        requests = [("image", path) for path in entry.get("sprites", [])]
+        requests += [("sound", path) for path in entry.get("sounds", [])]
+        requests += [("font", path, size) for path, size in entry.get("fonts", [])]
+        return requests
+
+    def zone_requests(self, zone_id: Any) -> List[Tuple]:
+        return self._manifest_requests(self.get_zone_manifest()["zones"].get(str(zone_id), {}))
+
+    def common_requests(self) -> List[Tuple]:
+        return self._manifest_requests(self.get_zone_manifest().get("common", {}))
+
+    def adjacent_zones(self, zone_id: Any) -> List[int]:
+        return self.get_zone_manifest()["zones"].get(str(zone_id), {}).get("adjacent", [])
+
+    def retain_zones(self, zone_ids: List[Any]) -> None:
+        """Makes zone_ids the retained set, evicting assets no retained zone references."""
+        wanted = {int(zone_id) for zone_id in zone_ids}
+        for zone_id in wanted - self.retained_zones:
+            for request in self.zone_requests(zone_id):
+                self.zone_refcounts[request] = self.zone_refcounts.get(request, 0) + 1
+        for zone_id in self.retained_zones - wanted:
+            for request in self.zone_requests(zone_id):
+                self.zone_refcounts[request] -= 1
+                if self.zone_refcounts[request] <= 0:
+                    del self.zone_refcounts[request]
+                    self.evict(request)
+        self.retained_zones = wanted
+
+    def evict(self, request: Tuple) -> None:
+        cache, key = self._cache_for(request[0]), self._cache_key(request)
+        if cache.is_pinned(key):
+            return
+        if cache.pop(key, None) is not None:
+            self.logger.debug(f"Evicted {request[0]} {request[1]}")
+
+    def preload_zone_assets(self, zone_id: Any) -> AssetBatch:
         # REQ-TECH-06: Asset Pre-loading
         self.logger.info(f"Preloading assets for zone: {zone_id}")
 
-        # Example: Preload player and common UI
-        self.load_image("player.png")
-        # Add more assets as needed based on zone_id
+        # Assets every zone needs stay resident
+        for request in self.common_requests():
+            self._cache_for(request[0]).pin(self._cache_key(request))
+
+        adjacent = self.adjacent_zones(zone_id)
+        self.retain_zones([zone_id] + adjacent)
+
+        # The returned batch is what the loading bar waits on; the next likely zones
+        # are prefetched behind it and finish in later polls
+        batch = self.load_batch(self.common_requests() + self.zone_requests(zone_id))
+        prefetch = []
+        for adjacent_id in adjacent:
+            prefetch += [request for request in self.zone_requests(adjacent_id) if request not in prefetch]
+        self.prefetch = self.load_batch(prefetch, only_retained=True)
+        return batch
@@ -42,6 +42,7 @@ class AudioManager:
 
         self.current_music = None
         self.current_ambient = None
+        self.music_source = None
 
         # Reserve a channel for ambient sound so it doesn't get interrupted by SFX
         # Channel 0: Ambient
@@ -141,9 +142,11 @@ class AudioManager:
 
         import os
         full_path = os.path.join(self.asset_manager.base_path, 'sounds', 'music', path)
+        # Streamed straight from the asset pack when it has the track
+        source = self.asset_manager.get_source('sounds', os.path.join('music', path))
 
         # Verify file exists to avoid crashing mixer
-        if not os.path.exists(full_path):
+        if isinstance(source, str) and not os.path.exists(full_path):
             print(f"[AUDIO] Music file not found: {full_path}")
             return
 
@@ -164,7 +167,8 @@ class AudioManager:
                 # We'll stick to: Start new one with fadein.
                 pass
 
-            pygame.mixer.music.load(full_path)
+            pygame.mixer.music.load(source, os.path.basename(path))
+            self.music_source = source # The mixer keeps reading from it while the track plays
             pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
             pygame.mixer.music.play(-1 if loop else 0, fade_ms=fade_ms)
 
@@ -1,12 +1,10 @@
 import pygame
 from config import *
-from game.managers.scene_manager import SceneManager
+from game.managers.scene_manager import SceneManager, deferred_scene
 from game.managers.asset_manager import AssetManager
 from game.managers.input_manager import InputManager
 from game.managers.save_manager import SaveManager
 from game.managers.audio_manager import AudioManager
-from game.scenes.menu_scene import MenuScene
-from game.scenes.game_scene import GameScene
 
 class GameManager:
     def __init__(self):
@@ -18,9 +16,9 @@ class GameManager:
         self.save_timer = 0.0
         self.save_interval = 30.0  # Save every 30 seconds
 
-        # Initialize scenes
-        self.scene_manager.add_scene("menu", MenuScene(self))
-        self.scene_manager.add_scene("game", GameScene(self))
+        # Initialize scenes (imported and built on first use)
+        self.scene_manager.add_scene_factory("menu", deferred_scene("game.scenes.menu_scene", "MenuScene", self))
+        self.scene_manager.add_scene_factory("game", deferred_scene("game.scenes.game_scene", "GameScene", self))
         self.scene_manager.set_scene("menu")
 
     def handle_event(self, event):
@@ -31,16 +29,27 @@ class GameManager:
         self.input_manager.update(dt)
         self.scene_manager.update(dt)
 
-        # Periodic saving
+        # Periodic saving: the state is copied here, written on the save writer thread
         self.save_timer += dt
         if self.save_timer >= self.save_interval:
-            self.save_manager.save_game()
+            self.save_manager.save_game_async(self.collect_save_data(), "autosave")
             self.save_timer = 0.0
 
+    def collect_save_data(self):
+        """Current game state, in the shape of save_schema.json's "data"."""
+        player = getattr(self.scene_manager.active_scene, "player", None)
+        position = [player.position.x, player.position.y] if player is not None else [0.0, 0.0]
+        return {
+            "player_position": position,
+            "current_scene": self.scene_manager.active_scene_name or "menu",
+            "inventory": [],
+        }
+
     def render(self, screen):
         screen.fill(BLACK)
         self.scene_manager.render(screen)
 
     def quit_game(self):
-        self.save_manager.save_game()
+        self.save_manager.save_game_async(self.collect_save_data(), "autosave")
+        self.save_manager.shutdown() # Waits for the write
         pygame.event.post(pygame.event.Event(pygame.QUIT))
\ No newline at end of file
@@ -1,8 +1,30 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+import hashlib
 import json
-import jsonschema
+import logging
+import os
 from pathlib import Path
+from config import JSON_PIPELINE_CACHE_DIR
+from game.utils.json_stream import DEFAULT_CHUNK_SIZE, iter_jsonl_members, iter_object_members
+from game.utils.skill_matcher import SkillMatcher
+from game.utils.xp_table import XP_TABLE, level_for_xp
+from game.utils.portfolio_records import CompactPortfolio
+
+logger = logging.getLogger("JSONPipeline")
+
+# Bump when a transform changes shape or meaning, so stale disk caches are ignored
+TRANSFORM_VERSION = 1
+
+# Top-level portfolio keys each transformed section is computed from. A section is only
+# recomputed when one of its inputs changed.
+SECTION_INPUTS = {
+    "player_profile": ("contact_info", "professional_experience", "skills", "certifications"),
+    "skill_categories": ("skills",),
+    "experience_entries": ("professional_experience",),
+    "game_stats": ("skills",),
+    "achievement_definitions": ("professional_experience",),
+}
 
 # Data Classes to represent the structured portfolio data
 @dataclass
@@ -20,17 +42,32 @@ class ProfessionalExperience:
     achievements: List[str]
     level_requirement: int
 
+def serialize_portfolio(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Transformed portfolio as plain JSON-compatible data (dataclasses become dicts)."""
+    return {
+        section: [asdict(item) for item in value] if section in ("skill_categories", "experience_entries") else value
+        for section, value in result.items()
+    }
+
+def compact_portfolio(result: Dict[str, Any]) -> CompactPortfolio:
+    """Transformed portfolio as a slotted, array-backed record; to_dict() gives the serialized form back."""
+    return CompactPortfolio.from_dict(serialize_portfolio(result))
+
 class JSONPipeline:
     """Handles loading, validating, and processing of the portfolio JSON data."""
 
-    def __init__(self, schema_path: str = "schemas/portfolio_schema.json"):
-        """Initializes the pipeline by loading the validation schema."""
+    def __init__(self, schema_path: str = "schemas/portfolio_schema.json", cache_dir: Optional[str] = JSON_PIPELINE_CACHE_DIR,
+                 stat_mappings_path: Optional[str] = None):
+        """
+        Initializes the pipeline by loading the validation schema. stat_mappings_path replaces
+        the built-in STAT_MAPPINGS with a JSON table of {"skill substring": {"stat": bonus}}.
+        """
         self.schema = self._load_schema(schema_path)
-        self.cache = {}
-        if self.schema:
-            self.validator = jsonschema.Draft7Validator(self.schema)
-        else:
-            self.validator = None
+        self.cache = {} # json_path -> last load: file stat, content hash, per-section input hashes and results
+        self.cache_dir = cache_dir # Transformed results on disk, None to keep them in memory only
+        self._validator = None
+        self._member_validator = None
+        self.last_recomputed: List[str] = [] # Sections rebuilt by the last load, for hot-reload diagnostics
 
         # Defines the mapping from professional skills to in-game character stats.
         self.STAT_MAPPINGS = {
@@ -49,6 +86,18 @@ class JSONPipeline:
             "agile": {"leadership": 10, "management": 10},
             "gherkin": {"analysis": 10, "communication": 5},
         }
+        if stat_mappings_path:
+            with open(stat_mappings_path, 'r', encoding='utf-8') as file:
+                self.STAT_MAPPINGS = json.load(file)
+        self.set_stat_mappings(self.STAT_MAPPINGS)
+
+    def set_stat_mappings(self, mappings: Dict[str, Dict[str, int]]) -> None:
+        """Replaces the skill -> stat table; the matcher is compiled once here, not per load."""
+        self.STAT_MAPPINGS = mappings
+        self.skill_matcher = SkillMatcher(mappings)
+        self._skill_scores = None # (skills hash, per-category totals, overall totals)
+        self._signature = None
+        self.cache.clear() # Every cached result was scored with the old table
 
     def _load_schema(self, schema_path: str) -> Optional[Dict[str, Any]]:
         """Loads the JSON schema from the specified path."""
@@ -63,26 +112,77 @@ class JSONPipeline:
             print(f"Error loading schema {schema_path}: {e}")
             return None
 
+    @property
+    def validator(self):
+        """Draft 7 validator for the schema, built on first use (jsonschema is slow to import)."""
+        if self._validator is None and self.schema:
+            import jsonschema
+            self._validator = jsonschema.Draft7Validator(self.schema)
+        return self._validator
+
+    @property
+    def member_validator(self):
+        """Validator for one top-level member at a time: the schema without its "required" list."""
+        if self._member_validator is None and self.schema:
+            import jsonschema
+            schema = {key: value for key, value in self.schema.items() if key != "required"}
+            self._member_validator = jsonschema.Draft7Validator(schema)
+        return self._member_validator
+
     def load_portfolio_data(self, json_path: str) -> Optional[Dict[str, Any]]:
         """
         Loads, validates, and transforms the portfolio JSON data from the given path.
+
+        Results are cached by content hash, in memory and under cache_dir. An unchanged file
+        is neither re-parsed nor re-validated; after an edit only the sections whose input
+        keys changed (see SECTION_INPUTS) are recomputed. Calling this every frame to pick
+        up edits is cheap: an untouched file costs one stat().
         """
         try:
             portfolio_file = Path(json_path)
             if not portfolio_file.is_file():
                 raise FileNotFoundError(f"Portfolio file not found: {json_path}")
 
-            with open(portfolio_file, 'r', encoding='utf-8') as file:
-                raw_data = json.load(file)
+            stat = portfolio_file.stat()
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            entry = self.cache.get(json_path)
+            if entry and entry["file_key"] == file_key:
+                self.last_recomputed = []
+                return entry["result"]
+
+            content = portfolio_file.read_bytes()
+            content_hash = hashlib.sha256(content).hexdigest()
+            if entry is None:
+                entry = self._read_disk_cache(json_path)
+            if entry and entry["content_hash"] == content_hash:
+                entry["file_key"] = file_key # Touched but not edited
+                self.cache[json_path] = entry
+                self.last_recomputed = []
+                return entry["result"]
+
+            raw_data = json.loads(content.decode('utf-8'))
+
+            self._raise_validation_errors(self.validation_errors(raw_data))
 
-            if self.validator:
-                errors = list(self.validator.iter_errors(raw_data))
-                if errors:
-                    error_messages = [f"Validation error at {'/'.join(map(str, e.path))}: {e.message}" for e in errors]
-                    raise jsonschema.ValidationError("\n".join(error_messages))
+            input_hashes = {key: self._hash_value(raw_data.get(key)) for key in self._input_keys()}
+            previous = entry or {"input_hashes": {}, "result": {}}
+            processed_data = {}
+            self.last_recomputed = []
+            for section, inputs in SECTION_INPUTS.items():
+                if section in previous["result"] and all(previous["input_hashes"].get(key) == input_hashes[key] for key in inputs):
+                    processed_data[section] = previous["result"][section]
+                else:
+                    processed_data[section] = self._transform_section(section, raw_data)
+                    self.last_recomputed.append(section)
 
-            processed_data = self._transform_portfolio_data(raw_data)
-            self.cache[json_path] = processed_data
+            entry = {
+                "file_key": file_key,
+                "content_hash": content_hash,
+                "input_hashes": input_hashes,
+                "result": processed_data,
+            }
+            self.cache[json_path] = entry
+            self._write_disk_cache(json_path, entry)
             return processed_data
 
         except json.JSONDecodeError as e:
@@ -90,58 +190,204 @@ class JSONPipeline:
         except Exception as e:
             raise RuntimeError(f"Unexpected error loading portfolio data: {str(e)}")
 
+    def validation_errors(self, raw_data: Any) -> List[str]:
+        """Every schema violation in raw_data, as messages (empty when valid or without a schema)."""
+        if not self.validator:
+            return []
+        return [f"Validation error at {'/'.join(map(str, e.path))}: {e.message}" for e in self.validator.iter_errors(raw_data)]
+
+    def process_portfolio(self, raw_data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """
+        Validates and transforms already-parsed data without any caching (batch use).
+        Returns (result, []) or (None, validation errors).
+        """
+        error_messages = self.validation_errors(raw_data)
+        if error_messages:
+            return None, error_messages
+        return self._transform_portfolio_data(raw_data), []
+
+    def iter_portfolio_sections(self, json_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+        """
+        Streaming load for large exports: yields (section, transformed value) as soon as
+        the top-level keys a section needs (SECTION_INPUTS) have been read. Each key is
+        validated as it arrives and dropped once no pending section needs it, so peak
+        memory follows the largest section rather than the whole document. A .jsonl path
+        is read as line-delimited members instead. Nothing is cached.
+
+        Absent keys are only known at the end of the input, so a section with an optional
+        input waits until then, and the schema's "required" list is checked last: a
+        ValidationError can come after some sections have been yielded.
+        """
+        if not Path(json_path).is_file():
+            raise FileNotFoundError(f"Portfolio file not found: {json_path}")
+
+        pending = dict(SECTION_INPUTS)
+        available = {} # Input keys still needed by a pending section
+        seen = set()
+        try:
+            with open(json_path, 'r', encoding='utf-8') as file:
+                if json_path.lower().endswith(".jsonl"):
+                    members = iter_jsonl_members(file)
+                else:
+                    members = iter_object_members(file, chunk_size)
+                for key, value in members:
+                    if key in seen:
+                        # A section built from the first value may already be out
+                        self._raise_validation_errors([f"Validation error at {key}: duplicate top-level key"])
+                    seen.add(key)
+                    self._raise_validation_errors(self.member_validation_errors(key, value))
+                    if any(key in inputs for inputs in pending.values()):
+                        available[key] = value
+                    del value # Don't hold an unneeded section while the consumer has control
+                    yield from self._ready_sections(pending, available, seen, finished=False)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format in {json_path}: {e.msg} at line {e.lineno}")
+
+        required = self.schema.get("required", []) if self.schema else []
+        self._raise_validation_errors([f"Validation error at : '{key}' is a required property"
+                                       for key in required if key not in seen])
+        yield from self._ready_sections(pending, available, seen, finished=True)
+
+    def member_validation_errors(self, key: str, value: Any) -> List[str]:
+        """Schema violations of one top-level member, in the same form as validation_errors()."""
+        if not self.member_validator:
+            return []
+        return [f"Validation error at {'/'.join(map(str, e.path))}: {e.message}"
+                for e in self.member_validator.iter_errors({key: value})]
+
+    @staticmethod
+    def _raise_validation_errors(error_messages: List[str]) -> None:
+        if error_messages:
+            from jsonschema import ValidationError
+            raise ValidationError("\n".join(error_messages))
+
+    def _ready_sections(self, pending, available, seen, finished):
+        for section, inputs in list(pending.items()):
+            if finished or all(key in seen for key in inputs):
+                del pending[section]
+                yield section, self._transform_section(section, available)
+        for key in list(available):
+            if not any(key in inputs for inputs in pending.values()):
+                del available[key]
+
+    def invalidate(self, json_path: Optional[str] = None) -> None:
+        """Drops the in-memory cache for one file (or all); disk entries are still checked by hash."""
+        if json_path is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(json_path, None)
+
+    @staticmethod
+    def _input_keys() -> List[str]:
+        return sorted({key for inputs in SECTION_INPUTS.values() for key in inputs})
+
+    @staticmethod
+    def _hash_value(value: Any) -> str:
+        return hashlib.sha256(json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+    def _cache_signature(self) -> str:
+        # A different schema, stat mapping or XP curve makes every cached result stale
+        if self._signature is None:
+            self._signature = self._hash_value([TRANSFORM_VERSION, self.schema, self.STAT_MAPPINGS, XP_TABLE])
+        return self._signature
+
+    def _disk_cache_path(self, json_path: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        name = hashlib.sha256(os.path.abspath(json_path).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{Path(json_path).stem}-{name}.json")
+
+    def _read_disk_cache(self, json_path: str) -> Optional[Dict[str, Any]]:
+        path = self._disk_cache_path(json_path)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                stored = json.load(file)
+            if stored.get("signature") != self._cache_signature():
+                return None
+            return {
+                "file_key": None,
+                "content_hash": stored["content_hash"],
+                "input_hashes": stored["input_hashes"],
+                "result": self._restore_result(stored["result"]),
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable pipeline cache {path}: {e}")
+            return None
+
+    def _write_disk_cache(self, json_path: str, entry: Dict[str, Any]) -> None:
+        path = self._disk_cache_path(json_path)
+        if not path:
+            return
+        stored = {
+            "signature": self._cache_signature(),
+            "content_hash": entry["content_hash"],
+            "input_hashes": entry["input_hashes"],
+            "result": serialize_portfolio(entry["result"]),
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(stored, file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write pipeline cache {path}: {e}")
+
+    @staticmethod
+    def _restore_result(stored: Dict[str, Any]) -> Dict[str, Any]:
+        result = dict(stored)
+        result["skill_categories"] = [SkillCategory(**item) for item in stored["skill_categories"]]
+        result["experience_entries"] = [ProfessionalExperience(**item) for item in stored["experience_entries"]]
+        return result
+
+    def _transform_section(self, section: str, raw_data: Dict[str, Any]) -> Any:
+        if section == "player_profile":
+            return self._create_player_profile(raw_data)
+        if section == "skill_categories":
+            return self._process_skill_categories(raw_data.get("skills", {}))
+        if section == "experience_entries":
+            return self._process_experience(raw_data.get("professional_experience", []))
+        if section == "game_stats":
+            return self._calculate_game_stats(raw_data)
+        if section == "achievement_definitions":
+            return self._generate_achievements(raw_data)
+        raise KeyError(section)
+
     def _transform_portfolio_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Transforms the raw JSON data into a game-ready structured format."""
-        return {
-            "player_profile": self._create_player_profile(raw_data),
-            "skill_categories": self._process_skill_categories(raw_data.get("skills", {})),
-            "experience_entries": self._process_experience(raw_data.get("professional_experience", [])),
-            "game_stats": self._calculate_game_stats(raw_data),
-            "achievement_definitions": self._generate_achievements(raw_data)
-        }
+        return {section: self._transform_section(section, raw_data) for section in SECTION_INPUTS}
 
     def _create_player_profile(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Creates the player's main profile from the contact info and calculated level."""
-        level = self._calculate_character_level(data)
+        experience_points = self._calculate_total_experience(data)
+        level = self._calculate_character_level(experience_points)
         return {
             "name": data.get("contact_info", {}).get("name", "Professional Hero"),
             "title": data.get("contact_info", {}).get("title", "Analyst"),
             "current_level": level,
-            "experience_points": self._calculate_total_experience(data),
+            "experience_points": experience_points,
             "available_skill_points": (level - 1) * 3, # 3 points per level above 1
             "avatar_sprite": self._determine_avatar_sprite(data)
         }
 
     def _process_skill_categories(self, skills_data: Dict[str, List[str]]) -> List[SkillCategory]:
         """Converts skill data into structured SkillCategory objects with stat mappings."""
+        per_category, _ = self._score_skills(skills_data)
         categories = []
         for category_name, skills in skills_data.items():
-            category_stats = {}
-            for skill in skills:
-                # Find matching stat mappings for each skill
-                for map_key, stats in self.STAT_MAPPINGS.items():
-                    if map_key in skill.lower():
-                        for stat, value in stats.items():
-                            category_stats[stat] = category_stats.get(stat, 0) + value
-            
             category = SkillCategory(
                 name=category_name.replace("_", " ").title(),
                 skills=skills,
-                game_stat_mapping=category_stats
+                game_stat_mapping=dict(per_category[category_name])
             )
             categories.append(category)
         return categories
 
-    def _calculate_character_level(self, data: Dict[str, Any]) -> int:
-        """Calculates the character's level based on total experience points."""
-        experience_points = self._calculate_total_experience(data)
-        level = 1
-        xp_for_next_level = 100
-        while experience_points >= xp_for_next_level:
-            level += 1
-            experience_points -= xp_for_next_level
-            xp_for_next_level = int(xp_for_next_level * 1.5) # Exponential growth
-        return min(level, 100)  # Level cap
+    def _calculate_character_level(self, experience_points: int) -> int:
+        """Calculates the character's level from total experience points (shared XP_TABLE, capped)."""
+        return level_for_xp(experience_points)
 
     def _calculate_total_experience(self, data: Dict[str, Any]) -> int:
         """Calculates total experience points from experience, skills, and certifications."""
@@ -190,15 +436,23 @@ class JSONPipeline:
             "intelligence": 10, "programming": 5, "analysis": 5, "technical": 5,
             "integration": 5, "leadership": 5, "management": 5, "charisma": 8
         }
-        for category, skill_list in data.get("skills", {}).items():
-            for skill in skill_list:
-                # Find matching stat mappings for each skill
-                for map_key, stats in self.STAT_MAPPINGS.items():
-                    if map_key in skill.lower():
-                        for stat, bonus in stats.items():
-                            base_stats[stat] = base_stats.get(stat, 0) + bonus
+        _, totals = self._score_skills(data.get("skills", {}))
+        for stat, bonus in totals.items():
+            base_stats[stat] = base_stats.get(stat, 0) + bonus
         return base_stats
 
+    def _score_skills(self, skills_data: Dict[str, List[str]]):
+        """
+        Per-category and overall stat bonuses from one matcher pass over all skills.
+        Both skill sections need it, so the last result is kept for the same skills.
+        """
+        skills_hash = self._hash_value(skills_data)
+        if self._skill_scores is None or self._skill_scores[0] != skills_hash:
+            totals: Dict[str, int] = {}
+            per_category = self.skill_matcher.score_categories(skills_data, totals)
+            self._skill_scores = (skills_hash, per_category, totals)
+        return self._skill_scores[1], self._skill_scores[2]
+
     def _generate_achievements(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generates in-game achievements based on real-world accomplishments."""
         achievements = []
@@ -1,17 +1,22 @@
+import copy
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import time
 from datetime import datetime
-import jsonschema
-from jsonschema import validate
 import logging
+from game.utils.runtime import threads_available
 
 class SaveManager:
     """
     Manages saving and loading game data to and from the filesystem.
     Handles save file versioning and naming.
+
+    Files are written atomically (temporary file, fsync, rename), so a crash mid-write
+    leaves the previous save intact. save_game_async() hands the write to a background
+    writer thread; flush() waits for it.
     """
 
     def __init__(self, saves_directory: str = "saves", schema_path: str = "schemas/save_schema.json"):
@@ -35,6 +40,14 @@ class SaveManager:
         else:
             self.logger.warning(f"Save schema not found at {schema_path}")
 
+        # Background writer, started on the first async save
+        self.condition = threading.Condition()
+        self.pending_saves: Dict[str, Dict[str, Any]] = {} # filename -> newest package not yet written
+        self.saves_coalesced = 0
+        self.writer: Optional[threading.Thread] = None
+        self.writer_busy = False
+        self.stopping = False
+
     def save_game(self, game_data: Dict[str, Any], filename: Optional[str] = None) -> bool:
         """
         Saves the provided game data to a JSON file.
@@ -48,28 +61,108 @@ class SaveManager:
             bool: True if saving was successful, False otherwise.
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"save_{timestamp}"
+            filename = self._timestamped_filename()
+        return self._write_save(filename, self._package(game_data))
 
+    def save_game_async(self, game_data: Dict[str, Any], filename: Optional[str] = None) -> None:
+        """
+        Snapshots game_data (a deep copy, taken on the calling thread) and leaves serializing
+        and writing it to the writer thread. A save still queued for the same file is
+        replaced by this one. Without threads (web build) the save happens right away.
+        """
+        if filename is None:
+            filename = self._timestamped_filename()
+        package = self._package(copy.deepcopy(game_data))
+        if not threads_available():
+            self._write_save(filename, package)
+            return
+
+        with self.condition:
+            if filename in self.pending_saves:
+                self.saves_coalesced += 1
+            self.pending_saves[filename] = package
+            if self.writer is None:
+                self.stopping = False
+                self.writer = threading.Thread(target=self._writer_loop, name="SaveWriter", daemon=True)
+                self.writer.start()
+            self.condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every queued save has been written. Returns False on timeout."""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending_saves and not self.writer_busy, timeout)
+
+    def shutdown(self) -> None:
+        """Writes any queued save and stops the writer thread (call on quit)."""
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+            writer = self.writer
+        if writer is not None:
+            writer.join()
+        with self.condition:
+            self.writer = None
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending_saves or self.stopping)
+                if not self.pending_saves:
+                    return # Stopping, and everything queued is written
+                filename = next(iter(self.pending_saves))
+                package = self.pending_saves.pop(filename)
+                self.writer_busy = True
+            try:
+                self._write_save(filename, package)
+            finally:
+                with self.condition:
+                    self.writer_busy = False
+                    self.condition.notify_all()
+
+    def _timestamped_filename(self) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"save_{timestamp}"
+
+    def _package(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "version": self.current_save_version,
+            "timestamp": time.time(),
+            "data": game_data
+        }
+
+    def _write_save(self, filename: str, save_package: Dict[str, Any]) -> bool:
         save_path = self.saves_directory / f"{filename}.json"
-
+        # Per thread, so a direct save and the writer never share a temporary file
+        tmp_path = save_path.with_name(f"{save_path.name}.{threading.get_ident()}.tmp")
         try:
-            save_package = {
-                "version": self.current_save_version,
-                "timestamp": time.time(),
-                "data": game_data
-            }
-
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_package, f, indent=2)
-            
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(save_package, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, save_path)
+            self._fsync_directory()
+
             self.logger.info(f"Game saved successfully to {save_path}")
             return True
 
         except Exception as e:
             self.logger.error(f"Failed to save game: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             return False
 
+    def _fsync_directory(self) -> None:
+        # Makes the rename itself durable; directories can't be opened for this on Windows
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.saves_directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
     def load_game(self, filename: str) -> Optional[Dict[str, Any]]:
         """
         Loads game data from a specified JSON file.
@@ -92,8 +185,9 @@ class SaveManager:
 
             # REQ-TECH-05: Validation
             if self.schema:
+                import jsonschema # Slow to import (~150ms), so only once a save is actually loaded
                 try:
-                    validate(instance=save_package, schema=self.schema)
+                    jsonschema.validate(instance=save_package, schema=self.schema)
                 except jsonschema.exceptions.ValidationError as err:
                     self.logger.error(f"Save file validation failed: {err}")
                     # Attempt backup or graceful failure
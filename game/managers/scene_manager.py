@@ -1,35 +1,196 @@
-from typing import Dict, Any, Optional
+import importlib
+import json
+import os
+import time
+from collections import deque
+from typing import Callable, Dict, Any, Iterable, Optional, List
+from game.managers.asset_manager import AssetManager
 from game.utils.event_bus import EventBus
+from game.utils.profiler import FrameProfiler
+from game.utils.startup_profile import StartupProfile
+from config import (DIRTY_RECT_FULL_FLIP_RATIO, SCENE_WARMUP, SCENE_WARMUP_MIN_IDLE_MS,
+                    SCENE_BUILD_ESTIMATES_MS, SCENE_BUILD_TIMES_PATH)
 import logging
 
+def deferred_scene(module_name: str, class_name: str, *args: Any) -> Callable[[], Any]:
+    """Scene factory that imports the scene's module only when the scene is first built."""
+    def build():
+        return getattr(importlib.import_module(module_name), class_name)(*args)
+    return build
+
 class SceneManager:
-    def __init__(self, event_bus: Optional[EventBus] = None):
-        self.scenes: Dict[str, Any] = {}
+    """
+    Owns the scenes and forwards the loop to the active one.
+
+    Scenes can be registered ready-made (add_scene) or as factories (add_scene_factory),
+    which are only called when the scene is first needed: on set_scene/get_scene, or
+    ahead of time from warm_up() while the loop has idle time left in a frame.
+    """
+
+    def __init__(self, event_bus: Optional[EventBus] = None, build_times_path: Optional[str] = SCENE_BUILD_TIMES_PATH):
+        self.scenes: Dict[str, Any] = {} # Built scenes only
+        self.factories: Dict[str, Callable[[], Any]] = {}
+        self.factory_assets: Dict[str, List[tuple]] = {} # AssetManager requests a scene's constructor loads
+        self.warm_up_queue = deque()
+        self.warm_up_batches: Dict[str, Any] = {} # name -> AssetBatch prefetching its assets
+        self.build_times: Dict[str, float] = {} # ms spent in each factory
+        self.build_times_path = build_times_path
+        self.build_times_changed = False # Measured since the last save_build_times()
+        self.expected_build_ms: Dict[str, float] = dict(SCENE_BUILD_ESTIMATES_MS)
+        self.expected_build_ms.update(self._read_build_times())
         self.active_scene: Any = None
+        self.active_scene_name: Optional[str] = None
+        self.profiler = FrameProfiler()
+        self.startup_profile = StartupProfile()
         self.event_bus = event_bus
         self.logger = logging.getLogger("SceneManager")
 
     def add_scene(self, name: str, scene: Any) -> None:
         self.scenes[name] = scene
 
+    def add_scene_factory(self, name: str, factory: Callable[[], Any], assets: Optional[List[tuple]] = None) -> None:
+        """assets: AssetManager requests the scene loads when built, decoded on the loader threads before a warm-up."""
+        self.factories[name] = factory
+        if assets:
+            self.factory_assets[name] = list(assets)
+
+    def has_scene(self, name: str) -> bool:
+        return name in self.scenes or name in self.factories
+
+    def is_built(self, name: str) -> bool:
+        return name in self.scenes
+
+    def get_scene(self, name: str) -> Any:
+        """The named scene, built now if it was only registered as a factory. None if unknown."""
+        scene = self.scenes.get(name)
+        if scene is None and name in self.factories:
+            start = time.perf_counter()
+            with self.startup_profile.phase(f"scene {name}"):
+                scene = self.factories[name]()
+            self.build_times[name] = (time.perf_counter() - start) * 1000.0
+            self.expected_build_ms[name] = self.build_times[name]
+            self.build_times_changed = True
+            self.warm_up_batches.pop(name, None)
+            self.scenes[name] = scene
+            self.logger.info(f"Built scene {name} in {self.build_times[name]:.1f}ms")
+        return scene
+
+    def schedule_warm_up(self, names: Iterable[str]) -> None:
+        """Queues scenes to be built by warm_up(), in order, skipping ones already built."""
+        for name in names:
+            if name in self.factories and name not in self.scenes and name not in self.warm_up_queue:
+                self.warm_up_queue.append(name)
+
+    def warm_up(self, idle_ms: float) -> Optional[str]:
+        """
+        Spends a frame's idle time on the queued scenes. Their assets are decoded on the
+        AssetManager loader threads first; a scene is then built in the first frame whose
+        idle time covers its expected build time (last measured, else the configured
+        estimate). At most one build per call. A scene too expensive for any frame stays
+        queued and is built on demand as before. Returns the name of the scene built, if any.
+        """
+        self.warm_up_queue = deque(name for name in self.warm_up_queue if name not in self.scenes)
+        if not self.warm_up_queue or idle_ms < SCENE_WARMUP_MIN_IDLE_MS:
+            return None
+
+        for name in self.warm_up_queue:
+            if not self._warm_up_assets_ready(name):
+                continue
+            if idle_ms >= self.expected_build_ms.get(name, 0.0):
+                self.warm_up_queue.remove(name)
+                self.get_scene(name)
+                return name
+        return None
+
+    def _warm_up_assets_ready(self, name: str) -> bool:
+        requests = self.factory_assets.get(name)
+        if not requests:
+            return True
+        asset_manager = AssetManager()
+        batch = self.warm_up_batches.get(name)
+        if batch is None:
+            batch = self.warm_up_batches[name] = asset_manager.load_batch(requests)
+        if not batch.done:
+            asset_manager.poll()
+        return batch.done
+
+    def _read_build_times(self) -> Dict[str, float]:
+        if not self.build_times_path or not os.path.exists(self.build_times_path):
+            return {}
+        try:
+            with open(self.build_times_path, "r") as f:
+                return {name: float(ms) for name, ms in json.load(f).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable scene build times {self.build_times_path}: {e}")
+            return {}
+
+    def save_build_times(self) -> None:
+        """Keeps this run's measured build times for the next one. Called once on quit."""
+        if not self.build_times_path or not self.build_times_changed:
+            return
+        try:
+            directory = os.path.dirname(self.build_times_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.build_times_path, "w") as f:
+                json.dump(self.expected_build_ms, f)
+            self.build_times_changed = False
+        except OSError as e:
+            self.logger.warning(f"Could not save scene build times: {e}")
+
     def set_scene(self, name: str) -> None:
-        if name in self.scenes:
+        scene = self.get_scene(name)
+        if scene is not None:
             if self.active_scene:
                 self.active_scene.exit()
-            self.active_scene = self.scenes[name]
+            self.active_scene = scene
+            self.active_scene_name = name
             self.active_scene.enter()
+            if hasattr(self.active_scene, 'mark_dirty'):
+                self.active_scene.mark_dirty() # Newly shown scene always needs a full frame
             self.logger.info(f"Switched to scene: {name}")
+            self.schedule_warm_up(SCENE_WARMUP.get(name, []))
         else:
             self.logger.warning(f"Warning: Scene '{name}' not found.")
 
     def handle_events(self, events: Any) -> None:
         if self.active_scene:
-            self.active_scene.handle_events(events)
+            with self.profiler.span(f"{self.active_scene_name}.events"):
+                self.active_scene.handle_events(events)
 
     def update(self, dt: float) -> None:
         if self.active_scene:
-            self.active_scene.update(dt)
+            with self.profiler.span(f"{self.active_scene_name}.update"):
+                self.active_scene.update(dt)
 
     def draw(self, screen: Any) -> None:
         if self.active_scene:
-            self.active_scene.draw(screen)
+            with self.profiler.span(f"{self.active_scene_name}.draw"):
+                self.active_scene.draw(screen)
+
+    def draw_dirty(self, screen: Any) -> Optional[List[Any]]:
+        """
+        Draws the active scene only if it reported changes.
+        Returns the rects to pass to pygame.display.update(), an empty list when
+        nothing needs presenting, or None when a full flip is required.
+        """
+        scene = self.active_scene
+        if not scene or not getattr(scene, 'supports_dirty_rects', False):
+            self.draw(screen)
+            return None
+
+        if not scene.has_dirty_regions():
+            return [] # Static frame: skip both drawing and presenting
+
+        with self.profiler.span(f"{self.active_scene_name}.draw"):
+            scene.draw(screen)
+        rects = scene.consume_dirty_rects()
+        if rects is None:
+            return None
+
+        screen_rect = screen.get_rect()
+        clipped = [rect.clip(screen_rect) for rect in rects]
+        changed_area = sum(rect.width * rect.height for rect in clipped)
+        if changed_area > screen_rect.width * screen_rect.height * DIRTY_RECT_FULL_FLIP_RATIO:
+            return None
+        return [rect for rect in clipped if rect.width and rect.height]
@@ -1,44 +1,135 @@
-import pytmx
+import os
 import pygame
+from config import TILEMAP_CHUNK_SIZE, MAP_CACHE_DIR
 from game.managers.asset_manager import AssetManager
+from game.utils import map_compiler
+from game.utils.map_compiler import TileLayer, ImageLayer
+from game.utils.startup_profile import StartupProfile
 
 class TileMapManager:
-    def __init__(self):
+    def __init__(self, chunk_size=TILEMAP_CHUNK_SIZE, cache_dir=MAP_CACHE_DIR):
         self.tmx_data = None
         self.map_layer = None
         self.asset_manager = AssetManager()
+        self.cache_dir = cache_dir # Compiled maps, keyed by TMX content hash; None disables
+
+        # Tile layers are baked into chunk_size x chunk_size tile surfaces once,
+        # so per-frame cost depends on the viewport instead of the map size.
+        self.chunk_size = chunk_size
+        self.chunks = {} # (layer_index, chunk_x, chunk_y) -> Surface or None if empty
+        self.dirty_chunks = set()
 
     def load_map(self, filename):
-        # We need a full path to load with pytmx
-        # Assuming maps are in assets/maps/ (need to check directory structure or assume)
-        # The prompt says "render .tmx maps".
-        import os
-        map_path = os.path.join("assets", "maps", filename)
+        # Maps are in assets/maps/, either loose or inside the asset pack. The TMX XML is
+        # only parsed when its compiled form isn't cached yet (see map_compiler).
+        map_path = "maps/" + filename
 
         try:
-             self.tmx_data = pytmx.load_pygame(map_path)
+            with StartupProfile().phase(f"load map {filename}"):
+                self.tmx_data = map_compiler.load_map(self.read_asset(map_path), map_path, self.cache_dir, self.read_asset)
+                self.tmx_data.load_images(self.load_tileset_image)
         except Exception as e:
             print(f"Error loading map {map_path}: {e}")
+            self.tmx_data = None
+            return
+
+        self.invalidate()
+
+    def read_asset(self, path):
+        """Bytes of an asset given its '/'-separated path under the assets root."""
+        folder, name = path.split("/", 1)
+        source = self.asset_manager.get_source(folder, name)
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                return f.read()
+        with source:
+            return source.read()
+
+    def load_tileset_image(self, path):
+        folder, name = path.split("/", 1)
+        image = pygame.image.load(self.asset_manager.get_source(folder, name), os.path.basename(name))
+        if pygame.display.get_surface():
+            image = image.convert_alpha()
+        return image
+
+    def invalidate(self):
+        """Drops every baked chunk so they are rebuilt on next render."""
+        self.chunks.clear()
+        self.dirty_chunks.clear()
+
+    def get_chunk_pixel_size(self):
+        return (self.tmx_data.tilewidth * self.chunk_size,
+                self.tmx_data.tileheight * self.chunk_size)
+
+    def set_tile(self, x, y, layer_index, gid):
+        """Changes a single tile and marks only the chunk containing it for rebuild."""
+        if not self.tmx_data:
             return
 
-    def render(self, surface):
+        layer = self.tmx_data.layers[layer_index]
+        layer.data[y][x] = gid
+        self.dirty_chunks.add((layer_index, x // self.chunk_size, y // self.chunk_size))
+
+    def render(self, surface, camera=(0, 0)):
         if not self.tmx_data:
             return
 
-        # Iterate over all layers
-        for layer in self.tmx_data.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                for x, y, gid in layer:
-                    tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    if tile:
-                        surface.blit(tile, (x * self.tmx_data.tilewidth,
-                                            y * self.tmx_data.tileheight))
-            elif isinstance(layer, pytmx.TiledObjectGroup):
-                # We can handle objects here if needed
-                pass
-            elif isinstance(layer, pytmx.TiledImageLayer):
+        cam_x, cam_y = int(camera[0]), int(camera[1])
+        chunk_w, chunk_h = self.get_chunk_pixel_size()
+        chunks_x = (self.tmx_data.width + self.chunk_size - 1) // self.chunk_size
+        chunks_y = (self.tmx_data.height + self.chunk_size - 1) // self.chunk_size
+
+        # Only chunks intersecting the camera viewport are considered
+        first_cx = max(0, cam_x // chunk_w)
+        first_cy = max(0, cam_y // chunk_h)
+        last_cx = min(chunks_x - 1, (cam_x + surface.get_width() - 1) // chunk_w)
+        last_cy = min(chunks_y - 1, (cam_y + surface.get_height() - 1) // chunk_h)
+
+        for layer_index, layer in enumerate(self.tmx_data.layers):
+            if not layer.visible:
+                continue
+
+            if isinstance(layer, TileLayer):
+                for cy in range(first_cy, last_cy + 1):
+                    for cx in range(first_cx, last_cx + 1):
+                        chunk = self._get_chunk(layer_index, layer, cx, cy)
+                        if chunk:
+                            surface.blit(chunk, (cx * chunk_w - cam_x, cy * chunk_h - cam_y))
+            elif isinstance(layer, ImageLayer):
                 if layer.image:
-                     surface.blit(layer.image, (0, 0))
+                     surface.blit(layer.image, (-cam_x, -cam_y))
+
+    def _get_chunk(self, layer_index, layer, cx, cy):
+        key = (layer_index, cx, cy)
+        if key not in self.chunks or key in self.dirty_chunks:
+            self.chunks[key] = self._build_chunk(layer, cx, cy)
+            self.dirty_chunks.discard(key)
+        return self.chunks[key]
+
+    def _build_chunk(self, layer, cx, cy):
+        tile_w = self.tmx_data.tilewidth
+        tile_h = self.tmx_data.tileheight
+        start_x = cx * self.chunk_size
+        start_y = cy * self.chunk_size
+        end_x = min(start_x + self.chunk_size, self.tmx_data.width)
+        end_y = min(start_y + self.chunk_size, self.tmx_data.height)
+
+        chunk = pygame.Surface((self.chunk_size * tile_w, self.chunk_size * tile_h), pygame.SRCALPHA)
+        has_tiles = False
+        for y in range(start_y, end_y):
+            row = layer.data[y]
+            for x in range(start_x, end_x):
+                tile = self.tmx_data.get_tile_image_by_gid(row[x])
+                if tile:
+                    chunk.blit(tile, ((x - start_x) * tile_w, (y - start_y) * tile_h))
+                    has_tiles = True
+
+        if not has_tiles:
+            return None # Nothing to blit for fully empty chunks
+
+        if pygame.display.get_surface():
+            chunk = chunk.convert_alpha()
+        return chunk
 
     def make_map_surface(self):
         if not self.tmx_data:
@@ -1,9 +1,12 @@
 import pygame
 from game.scenes.base_scene import BaseScene
 from game.managers.asset_manager import AssetManager
+from game.utils.text_cache import TextCache
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, WARM_BEIGE, PRIMARY_BLUE
 
 class AboutScene(BaseScene):
+    supports_dirty_rects = True # Fully static, only redrawn when entered
+
     def __init__(self, game):
         super().__init__(game)
         self.asset_manager = AssetManager()
@@ -11,9 +14,17 @@ class AboutScene(BaseScene):
         self.font_title = pygame.font.Font(None, 60)
         self.font_header = pygame.font.Font(None, 40)
         self.font_text = pygame.font.Font(None, 28)
+        self.text_cache = TextCache()
         self.padding = 50
+        self.wrapped_lines = {} # (text, font, max_width) -> lines, text is static per scene
 
     def wrap_text(self, text, font, max_width):
+        key = (text, font, max_width)
+        if key not in self.wrapped_lines:
+            self.wrapped_lines[key] = self._wrap_text(text, font, max_width)
+        return self.wrapped_lines[key]
+
+    def _wrap_text(self, text, font, max_width):
         words = text.split(' ')
         lines = []
         current_line = []
@@ -34,12 +45,12 @@ class AboutScene(BaseScene):
         screen.fill(WARM_BEIGE)
 
         # Title
-        title_surf = self.font_title.render("About Developer", True, PRIMARY_BLUE)
+        title_surf = self.text_cache.render(self.font_title, "About Developer", True, PRIMARY_BLUE)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, self.padding))
         screen.blit(title_surf, title_rect)
 
         if not self.resume_data:
-            error_surf = self.font_text.render("Resume data not found.", True, BLACK)
+            error_surf = self.text_cache.render(self.font_text, "Resume data not found.", True, BLACK)
             screen.blit(error_surf, (self.padding, self.padding * 2))
             return
 
@@ -47,7 +58,7 @@ class AboutScene(BaseScene):
         info = self.resume_data.get('contact_info', {})
         y_offset = self.padding * 2.5
 
-        name_surf = self.font_header.render(info.get('name', ''), True, BLACK)
+        name_surf = self.text_cache.render(self.font_header, info.get('name', ''), True, BLACK)
         name_rect = name_surf.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
         screen.blit(name_surf, name_rect)
         y_offset += 40
@@ -56,7 +67,7 @@ class AboutScene(BaseScene):
         title_text = info.get('title', '')
         title_lines = self.wrap_text(title_text, self.font_text, SCREEN_WIDTH - 2 * self.padding)
         for line in title_lines:
-            line_surf = self.font_text.render(line, True, (50, 50, 50))
+            line_surf = self.text_cache.render(self.font_text, line, True, (50, 50, 50))
             line_rect = line_surf.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             screen.blit(line_surf, line_rect)
             y_offset += 30
@@ -64,7 +75,7 @@ class AboutScene(BaseScene):
         y_offset += 20
 
         # Summary
-        summary_surf = self.font_header.render("Professional Summary", True, PRIMARY_BLUE)
+        summary_surf = self.text_cache.render(self.font_header, "Professional Summary", True, PRIMARY_BLUE)
         screen.blit(summary_surf, (self.padding, y_offset))
         y_offset += 40
 
@@ -72,13 +83,13 @@ class AboutScene(BaseScene):
         summary_lines = self.wrap_text(summary_text, self.font_text, SCREEN_WIDTH - 2 * self.padding)
 
         for line in summary_lines:
-            line_surf = self.font_text.render(line, True, BLACK)
+            line_surf = self.text_cache.render(self.font_text, line, True, BLACK)
             screen.blit(line_surf, (self.padding, y_offset))
             y_offset += 30
 
         # Instructions
         y_offset = SCREEN_HEIGHT - self.padding
-        instr_surf = self.font_text.render("Press ESC to Return", True, (100, 100, 100))
+        instr_surf = self.text_cache.render(self.font_text, "Press ESC to Return", True, (100, 100, 100))
         instr_rect = instr_surf.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
         screen.blit(instr_surf, instr_rect)
 
@@ -1,8 +1,14 @@
 import pygame
 
 class BaseScene:
+    # Scenes that report what changed via mark_dirty() can be presented with
+    # pygame.display.update(rects) when DIRTY_RECT_RENDERING is enabled
+    supports_dirty_rects = False
+
     def __init__(self, game):
         self.game = game
+        self.dirty_rects = []
+        self.full_redraw = True
 
     def enter(self):
         # Called when the scene becomes active
@@ -22,4 +28,21 @@ class BaseScene:
 
     def draw(self, screen):
         # Draw elements specific to this scene
-        pass
\ No newline at end of file
+        pass
+
+    def mark_dirty(self, rect=None):
+        # No rect means the whole screen changed
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def has_dirty_regions(self):
+        return self.full_redraw or bool(self.dirty_rects)
+
+    def consume_dirty_rects(self):
+        # Returns the regions changed since the last call, None for a full redraw
+        rects = None if self.full_redraw else self.dirty_rects
+        self.dirty_rects = []
+        self.full_redraw = False
+        return rects
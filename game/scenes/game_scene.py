@@ -1,10 +1,13 @@
 import pygame
 from game.scenes.base_scene import BaseScene
-from config import BLACK, WHITE, WARM_BEIGE
+from config import BLACK, WHITE, WARM_BEIGE, PLAYER_LIGHT_RADIUS, INTERACTABLE_LIGHT_RADIUS
 from game.managers.tilemap_manager import TileMapManager
 from game.entities.player import Player
 from game.ui.hud import HUD
 from game.ui.pause_menu import PauseMenu
+from game.systems.interaction_system import InteractionIndex
+from game.systems.lighting_system import LightingSystem
+from game.utils.profiler import FrameProfiler
 
 class GameScene(BaseScene):
     def __init__(self, game):
@@ -20,6 +23,9 @@ class GameScene(BaseScene):
         self.all_sprites = pygame.sprite.Group()
         self.all_sprites.add(self.player)
 
+        # Interactables near the player get highlighted (REQ-VISUAL-07)
+        self.interaction_index = InteractionIndex()
+
         # HUD
         self.hud = HUD(game)
         # TODO: Link player to HUD explicitly if needed, or HUD can access via game.scene_manager
@@ -33,8 +39,17 @@ class GameScene(BaseScene):
         self.demo_direction = 1 # 1 for Right, -1 for Left
 
         # Darkness layer for Data Center (REQ-VISUAL-09)
-        self.darkness_surface = pygame.Surface((game.screen.get_width(), game.screen.get_height()), pygame.SRCALPHA)
-        self.darkness_surface.fill((0, 0, 0, 200)) # Semi-transparent black
+        self.lighting = LightingSystem(game.screen.get_size())
+        self.player_light = self.lighting.add_light(PLAYER_LIGHT_RADIUS, falloff=0.5, entity=self.player)
+
+        self.profiler = FrameProfiler()
+
+    def add_interactable(self, sprite, interaction_range=None, on_interact=None, is_available=None,
+                         light_radius=INTERACTABLE_LIGHT_RADIUS):
+        self.all_sprites.add(sprite)
+        if light_radius:
+            self.lighting.add_light(light_radius, entity=sprite)
+        return self.interaction_index.register(sprite, interaction_range, on_interact, is_available)
 
     def enter_demo_mode(self):
         self.demo_mode = True
@@ -86,43 +101,31 @@ class GameScene(BaseScene):
 
     def draw(self, screen):
         screen.fill(WARM_BEIGE) # Use WARM_BEIGE as default bg
-        self.tilemap_manager.render(screen)
-
-        self.all_sprites.draw(screen)
-
-        # Draw highlights (REQ-VISUAL-07)
-        for sprite in self.all_sprites:
-            if hasattr(sprite, 'draw_highlight') and sprite != self.player:
-                sprite.draw_highlight(screen, self.player.rect.center)
+        with self.profiler.span("tilemap"):
+            self.tilemap_manager.render(screen)
+
+        # Sprites are drawn between their last two simulation steps (fixed-timestep loop)
+        with self.profiler.span("sprites"):
+            alpha = getattr(self.game, 'interpolation_alpha', 1.0)
+            for sprite in self.all_sprites:
+                if hasattr(sprite, 'get_render_position'):
+                    screen.blit(sprite.image, sprite.get_render_position(alpha))
+                else:
+                    screen.blit(sprite.image, sprite.rect)
+
+            # Draw highlights (REQ-VISUAL-07)
+            for interactable in self.interaction_index.query(self.player.rect.center):
+                interactable.entity.draw_interaction_marker(screen)
 
         # Render Vignette/Darkness (REQ-VISUAL-09)
         # Only if in Data Center. For now, we assume we are in it or just show the effect.
         # The requirement says "in the 'Data Center' zone".
-        # I'll just implement the effect logic here.
-        # Cut out circle around player
-        self.darkness_surface.fill((0, 0, 0, 200)) # Reset darkness
-        pygame.draw.circle(self.darkness_surface, (0, 0, 0, 0), self.player.rect.center, 150) # Transparent circle
-        # Note: Pygame doesn't support drawing transparent on surface easily like this with fill.
-        # We need to use BLEND_RGBA_MIN or a mask.
-        # Simpler approach: Create a light image and blit it with special flags or use a mask.
-
-        # Correct approach for cutout:
-        # 1. Create a surface with alpha.
-        # 2. Fill with darkness.
-        # 3. Draw circle with (0,0,0,0) - this doesn't work directly with blit.
-        # 4. Instead, use pygame.draw.circle to clear alpha.
-        # However, pygame.draw.circle with (0,0,0,0) on a surface with SRCALPHA works if we do it right.
-
-        # Actually, simpler:
-        # Fill darkness
-        self.darkness_surface.fill((0, 0, 0, 200))
-        # Draw circle with REPLACE blend mode to clear pixels
-        pygame.draw.circle(self.darkness_surface, (0, 0, 0, 0), self.player.rect.center, 150)
-
-        screen.blit(self.darkness_surface, (0,0))
+        with self.profiler.span("darkness"):
+            self.lighting.draw(screen)
 
         # Draw HUD
-        self.hud.draw(screen)
+        with self.profiler.span("hud"):
+            self.hud.draw(screen)
 
         # Draw Pause Menu
         self.pause_menu.draw(screen)
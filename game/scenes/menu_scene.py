@@ -1,14 +1,18 @@
 import pygame
-import webbrowser
 from game.scenes.base_scene import BaseScene
 from game.managers.asset_manager import AssetManager
+from game.utils.text_cache import TextCache
 from config import WHITE, BLACK, CAPTION, PRIMARY_BLUE, WARM_BEIGE, SCREEN_WIDTH, SCREEN_HEIGHT
 
 class MenuScene(BaseScene):
+    supports_dirty_rects = True
+
     def __init__(self, game):
         super().__init__(game)
         self.font = pygame.font.Font(None, 74)
         self.option_font = pygame.font.Font(None, 50)
+        self.gh_font = pygame.font.Font(None, 24)
+        self.text_cache = TextCache()
 
         self.options = ["Start Career", "View Resume", "Credits / About Dev", "Exit"]
         self.selected_index = 0
@@ -41,24 +45,41 @@ class MenuScene(BaseScene):
 
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
-                    self.selected_index = (self.selected_index - 1) % len(self.options)
-                    if hasattr(self.game, 'audio_manager'):
-                        self.game.audio_manager.play_ui_sound('hover')
+                    self.move_selection(-1)
                 elif event.key == pygame.K_DOWN:
-                    self.selected_index = (self.selected_index + 1) % len(self.options)
-                    if hasattr(self.game, 'audio_manager'):
-                        self.game.audio_manager.play_ui_sound('hover')
+                    self.move_selection(1)
                 elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                     if hasattr(self.game, 'audio_manager'):
                         self.game.audio_manager.play_ui_sound('click')
                     self.select_option()
 
+    def move_selection(self, step):
+        # Only the old and new rows change (text color and cursor), whether or not the cursor is showing
+        self.mark_dirty(self.option_row_rect(self.selected_index))
+        self.selected_index = (self.selected_index + step) % len(self.options)
+        self.mark_dirty(self.option_row_rect(self.selected_index))
+        if hasattr(self.game, 'audio_manager'):
+            self.game.audio_manager.play_ui_sound('hover')
+
+    def option_rect(self, index):
+        rect = pygame.Rect((0, 0), self.option_font.size(self.options[index]))
+        rect.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50 + index * 60)
+        return rect
+
+    def cursor_rect(self, index):
+        rect = self.option_rect(index)
+        return pygame.Rect(rect.left - 30, rect.centery - 10, 20, 20)
+
+    def option_row_rect(self, index):
+        return self.option_rect(index).union(self.cursor_rect(index))
+
     def open_github(self):
         if self.resume_data and 'contact_info' in self.resume_data:
             github_url = self.resume_data['contact_info'].get('github', '')
             if github_url:
                 if not github_url.startswith('http'):
                     github_url = 'https://' + github_url
+                import webbrowser # Deferred, only needed when a link is opened
                 webbrowser.open(github_url)
                 print(f"Opening GitHub: {github_url}")
 
@@ -79,6 +100,8 @@ class MenuScene(BaseScene):
         if self.animation_timer > 0.5:
             self.cursor_visible = not self.cursor_visible
             self.animation_timer = 0
+            # Only the blinking cursor changed; its rect follows the selection even while hidden
+            self.mark_dirty(self.cursor_rect(self.selected_index))
 
         self.idle_timer += dt
         if self.idle_timer > self.DEMO_TIMEOUT:
@@ -87,8 +110,8 @@ class MenuScene(BaseScene):
     def start_demo_mode(self):
         print("Starting Demo Mode...")
         self.idle_timer = 0
-        if "game_scene" in self.game.scene_manager.scenes:
-            game_scene = self.game.scene_manager.scenes["game_scene"]
+        game_scene = self.game.scene_manager.get_scene("game_scene")
+        if game_scene is not None:
             game_scene.enter_demo_mode()
             self.game.scene_manager.set_scene("game_scene")
 
@@ -128,16 +151,14 @@ class MenuScene(BaseScene):
         screen.blit(self.title_text, title_rect)
 
         # Draw Options
-        start_y = SCREEN_HEIGHT / 2 + 50
         for i, option in enumerate(self.options):
             color = PRIMARY_BLUE if i == self.selected_index else BLACK
-            text_surf = self.option_font.render(option, True, color)
-            rect = text_surf.get_rect(center=(SCREEN_WIDTH / 2, start_y + i * 60))
-            screen.blit(text_surf, rect)
+            text_surf = self.text_cache.render(self.option_font, option, True, color)
+            screen.blit(text_surf, self.option_rect(i))
 
             if i == self.selected_index and self.cursor_visible:
                 # Draw cursor/arrow
-                cursor_rect = pygame.Rect(rect.left - 30, rect.centery - 10, 20, 20)
+                cursor_rect = self.cursor_rect(i)
                 pygame.draw.polygon(screen, PRIMARY_BLUE, [
                     (cursor_rect.left, cursor_rect.top),
                     (cursor_rect.left, cursor_rect.bottom),
@@ -147,7 +168,6 @@ class MenuScene(BaseScene):
         # Draw GitHub Icon (Simple square with 'GH' for now, or use an asset if available)
         # Assuming no icon asset, drawing a placeholder
         pygame.draw.rect(screen, BLACK, self.github_rect, border_radius=5)
-        gh_font = pygame.font.Font(None, 24)
-        gh_text = gh_font.render("GH", True, WHITE)
+        gh_text = self.text_cache.render(self.gh_font, "GH", True, WHITE)
         text_rect = gh_text.get_rect(center=self.github_rect.center)
         screen.blit(gh_text, text_rect)
\ No newline at end of file
@@ -1,9 +1,12 @@
 import pygame
 from game.scenes.base_scene import BaseScene
 from game.managers.asset_manager import AssetManager
+from game.utils.text_cache import TextCache
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, WARM_BEIGE, PRIMARY_BLUE
 
 class ResumeScene(BaseScene):
+    supports_dirty_rects = True
+
     def __init__(self, game):
         super().__init__(game)
         self.asset_manager = AssetManager()
@@ -11,6 +14,7 @@ class ResumeScene(BaseScene):
         self.font_title = pygame.font.Font(None, 40)
         self.font_header = pygame.font.Font(None, 32)
         self.font_text = pygame.font.Font(None, 24)
+        self.text_cache = TextCache()
 
         self.scroll_y = 0
         self.content_height = 0
@@ -108,6 +112,9 @@ class ResumeScene(BaseScene):
             lines_list.append({"text": ' '.join(current_line), "font": font, "color": BLACK, "spacing": 2, "is_skill": is_skill})
 
     def handle_events(self, events):
+        previous_scroll = self.scroll_y
+        previous_tooltip_rect = self.get_tooltip_rect()
+
         # Mouse hover detection for tooltip
         mouse_pos = pygame.mouse.get_pos()
         # Adjust mouse_pos by scroll_y to match surface coordinates
@@ -131,6 +138,29 @@ class ResumeScene(BaseScene):
         max_scroll = max(0, self.content_height - SCREEN_HEIGHT)
         self.scroll_y = max(0, min(self.scroll_y, max_scroll))
 
+        # Report what changed for dirty-rect rendering
+        if self.scroll_y != previous_scroll:
+            self.mark_dirty()
+        else:
+            tooltip_rect = self.get_tooltip_rect()
+            if tooltip_rect != previous_tooltip_rect:
+                if previous_tooltip_rect:
+                    self.mark_dirty(previous_tooltip_rect)
+                if tooltip_rect:
+                    self.mark_dirty(tooltip_rect)
+
+    def get_tooltip_rect(self):
+        if not self.tooltip_text:
+            return None
+        tooltip_surf = self.text_cache.render(self.font_text, self.tooltip_text, True, WHITE, (50, 50, 50))
+        # Ensure tooltip stays on screen
+        tooltip_rect = tooltip_surf.get_rect(topleft=self.tooltip_pos)
+        if tooltip_rect.right > SCREEN_WIDTH:
+            tooltip_rect.right = SCREEN_WIDTH - 5
+        if tooltip_rect.bottom > SCREEN_HEIGHT:
+            tooltip_rect.bottom = SCREEN_HEIGHT - 5
+        return tooltip_rect
+
     def update(self, dt):
         pass
 
@@ -150,12 +180,5 @@ class ResumeScene(BaseScene):
 
         # Draw tooltip
         if self.tooltip_text:
-            tooltip_surf = self.font_text.render(self.tooltip_text, True, WHITE, (50, 50, 50))
-            # Ensure tooltip stays on screen
-            tooltip_rect = tooltip_surf.get_rect(topleft=self.tooltip_pos)
-            if tooltip_rect.right > SCREEN_WIDTH:
-                tooltip_rect.right = SCREEN_WIDTH - 5
-            if tooltip_rect.bottom > SCREEN_HEIGHT:
-                tooltip_rect.bottom = SCREEN_HEIGHT - 5
-
-            screen.blit(tooltip_surf, tooltip_rect)
+            tooltip_surf = self.text_cache.render(self.font_text, self.tooltip_text, True, WHITE, (50, 50, 50))
+            screen.blit(tooltip_surf, self.get_tooltip_rect())
@@ -1,19 +1,49 @@
 from config import *
 from game.scenes.base_scene import BaseScene
 from game.systems.collision_system import CollisionSystem
+from game.systems.interaction_system import InteractionIndex
+from game.utils.text_cache import TextCache
+from game.ui.hud import draw_loading_bar
 
 class BaseZone(BaseScene):
     def __init__(self, game_manager, zone_id):
         super().__init__(game_manager)
+        self.game_manager = game_manager
         self.zone_id = zone_id
         self.entities = []
+        self.interaction_index = InteractionIndex()
+        self.text_cache = TextCache()
         self.player = None
         self.camera_x = 0
         self.camera_y = 0
         self.current_message = None
         self.message_timer = 0.0
+        self.loading = None # AssetBatch while the zone's assets stream in
+
+    def enter(self):
+        self.on_enter()
+
+    def exit(self):
+        self.on_exit()
+
+    def handle_events(self, events):
+        for event in events:
+            self.handle_event(event)
+
+    def handle_event(self, event):
+        # Override in subclasses
+        pass
 
     def on_enter(self):
+        # Assets load in the background; the zone is built once they are in (see update)
+        if hasattr(self.game_manager, 'asset_manager'):
+            self.loading = self.game_manager.asset_manager.preload_zone_assets(self.zone_id)
+        else:
+            self.finish_loading()
+
+    def finish_loading(self):
+        self.loading = None
+
         # Load zone-specific data
         self.load_zone_data()
 
@@ -26,7 +56,9 @@ class BaseZone(BaseScene):
 
     def on_exit(self):
         # Clear entities to prevent memory leaks
+        self.loading = None
         self.entities.clear()
+        self.interaction_index.clear()
 
     def show_message(self, message, duration=3.0):
         self.current_message = message
@@ -51,11 +83,36 @@ class BaseZone(BaseScene):
     def remove_entity(self, entity):
         if entity in self.entities:
             self.entities.remove(entity)
+        self.interaction_index.unregister(entity)
+
+    def register_interactable(self, entity, interaction_range, on_interact, is_available=None):
+        # Shared lookup for the interact key and the highlight pass
+        return self.interaction_index.register(entity, interaction_range, on_interact, is_available)
+
+    def get_interactables(self):
+        if not self.player:
+            return []
+        return self.interaction_index.query(self.player.rect.center)
+
+    def check_interactions(self):
+        if not self.player:
+            return
+        target = self.interaction_index.nearest(self.player.rect.center)
+        if target:
+            target.interact()
 
     def update(self, dt):
+        if hasattr(self.game_manager, 'asset_manager'):
+            self.game_manager.asset_manager.poll() # Also finishes the adjacent-zone prefetch
+
+        if self.loading is not None:
+            if self.loading.done:
+                self.finish_loading()
+            return
+
         # Update player
         if self.player:
-            self.player.update(dt, self.game_manager.input_manager, self.entities)
+            self.player.update(dt)
 
         # Update other entities
         for entity in self.entities:
@@ -64,8 +121,8 @@ class BaseZone(BaseScene):
 
         # Update camera to follow player
         if self.player:
-            self.camera_x = self.player.x - SCREEN_WIDTH // 2
-            self.camera_y = self.player.y - SCREEN_HEIGHT // 2
+            self.camera_x = self.player.rect.x - SCREEN_WIDTH // 2
+            self.camera_y = self.player.rect.y - SCREEN_HEIGHT // 2
 
             # Clamp camera to world bounds
             self.camera_x = max(0, min(self.camera_x, WORLD_WIDTH - SCREEN_WIDTH))
@@ -91,14 +148,25 @@ class BaseZone(BaseScene):
             elif self.current_message:
                 self.displayed_text = self.current_message
 
+    def draw(self, screen):
+        self.render(screen)
+
     def render(self, screen):
         # Clear screen with zone-specific color
         screen.fill(self.get_zone_color())
 
+        if self.loading is not None:
+            draw_loading_bar(screen, self.loading.progress, f"Loading {ZONES[self.zone_id]}...")
+            return
+
         # Render entities
         for entity in self.entities:
             entity.render(screen, self.camera_x, self.camera_y)
 
+        # Highlight whatever the interact key would trigger (REQ-VISUAL-07)
+        for interactable in self.get_interactables():
+            interactable.entity.draw_interaction_marker(screen, (-self.camera_x, -self.camera_y))
+
         # Render UI
         self.render_ui(screen)
 
@@ -111,13 +179,13 @@ class BaseZone(BaseScene):
         font = self.game_manager.asset_manager.load_font("default.ttf", 24)
 
         # Zone name
-        zone_text = font.render(f"Zone {self.zone_id}: {ZONES[self.zone_id]}", True, WHITE)
+        zone_text = self.text_cache.render(font, f"Zone {self.zone_id}: {ZONES[self.zone_id]}", True, WHITE)
         screen.blit(zone_text, (10, 10))
 
         # Player stats
         if self.player:
-            level_text = font.render(f"Level: {self.player.level}", True, WHITE)
-            exp_text = font.render(f"XP: {self.player.experience}", True, WHITE)
+            level_text = self.text_cache.render(font, f"Level: {self.player.level}", True, WHITE)
+            exp_text = self.text_cache.render(font, f"XP: {self.player.experience}", True, WHITE)
             screen.blit(level_text, (10, 40))
             screen.blit(exp_text, (10, 70))
 
@@ -126,7 +194,7 @@ class BaseZone(BaseScene):
             msg_font = self.game_manager.asset_manager.load_font("default.ttf", 20)
             # Use displayed_text instead of current_message for typewriter effect
             text_to_render = getattr(self, 'displayed_text', self.current_message)
-            msg_text = msg_font.render(text_to_render, True, YELLOW)
+            msg_text = self.text_cache.render(msg_font, text_to_render, True, YELLOW)
             msg_x = SCREEN_WIDTH // 2 - msg_text.get_width() // 2
             msg_y = SCREEN_HEIGHT - 50
             screen.blit(msg_text, (msg_x, msg_y))
\ No newline at end of file
@@ -24,7 +24,7 @@ class Zone1(BaseZone):
     def load_zone_data(self):
         # Create player
         player_data = self.game_manager.save_manager.get_player_data()
-        self.player = Player(player_data["position"][0], player_data["position"][1])
+        self.player = Player(player_data["position"][0], player_data["position"][1], 32, 32, asset_key="player.png")
         self.add_entity(self.player)
 
         # Create Gherkin puzzle stations
@@ -45,9 +45,10 @@ class Zone1(BaseZone):
             entity = Entity(station["x"], station["y"], 64, 64)
             entity.scenario = station["scenario"]
             entity.completed = False
-            entity.render = lambda screen, cx=0, cy=0: pygame.draw.rect(screen, BLUE, (entity.x - cx, entity.y - cy, entity.width, entity.height))
+            entity.render = lambda screen, cx=0, cy=0, e=entity: pygame.draw.rect(screen, BLUE, (e.rect.x - cx, e.rect.y - cy, e.width, e.height))
             entity.update = lambda dt: None
             self.gherkin_puzzles.append(entity)
+            self.register_interactable(entity, 50, self.start_gherkin_puzzle, lambda e: not e.completed)
             self.add_entity(entity)
 
     def create_api_terminals(self):
@@ -61,9 +62,10 @@ class Zone1(BaseZone):
             entity = Entity(terminal["x"], terminal["y"], 48, 48)
             entity.endpoint = terminal["endpoint"]
             entity.validated = False
-            entity.render = lambda screen, cx=0, cy=0: pygame.draw.rect(screen, GREEN, (entity.x - cx, entity.y - cy, entity.width, entity.height))
+            entity.render = lambda screen, cx=0, cy=0, e=entity: pygame.draw.rect(screen, GREEN, (e.rect.x - cx, e.rect.y - cy, e.width, e.height))
             entity.update = lambda dt: None
             self.api_terminals.append(entity)
+            self.register_interactable(entity, 40, self.start_api_validation, lambda e: not e.validated)
             self.add_entity(entity)
 
     def handle_event(self, event):
@@ -74,22 +76,6 @@ class Zone1(BaseZone):
         if event.type == pygame.KEYDOWN and event.key == KEYS["INTERACT"]:
             self.check_interactions()
 
-    def check_interactions(self):
-        player_center_x = self.player.x + self.player.width // 2
-        player_center_y = self.player.y + self.player.height // 2
-
-        # Check Gherkin stations
-        for station in self.gherkin_puzzles:
-            if not station.completed and abs(player_center_x - (station.x + 32)) < 50 and abs(player_center_y - (station.y + 32)) < 50:
-                self.start_gherkin_puzzle(station)
-                break
-
-        # Check API terminals
-        for terminal in self.api_terminals:
-            if not terminal.validated and abs(player_center_x - (terminal.x + 24)) < 40 and abs(player_center_y - (terminal.y + 24)) < 40:
-                self.start_api_validation(terminal)
-                break
-
     def start_gherkin_puzzle(self, station):
         scenario_data = SCENARIOS.get(station.scenario)
         if not scenario_data:
@@ -99,7 +85,7 @@ class Zone1(BaseZone):
         def on_complete():
             station.completed = True
             self.completed_gherkin += 1
-            self.player.experience += 50
+            self.player.gain_experience(50)
             self.game_manager.audio_manager.play_sound("gherkin_complete.wav")
             self.show_message(f"Gherkin puzzle completed: {station.scenario}")
             self.current_minigame = None
@@ -115,7 +101,7 @@ class Zone1(BaseZone):
         self.show_message(f"API validated: {terminal.endpoint}")
         terminal.validated = True
         self.completed_apis += 1
-        self.player.experience += 75
+        self.player.gain_experience(75)
         self.game_manager.audio_manager.play_sound("api_validated.wav")
         self.check_completion()
 
@@ -134,7 +120,7 @@ class Zone1(BaseZone):
         font = self.game_manager.asset_manager.load_font("default.ttf", 20)
 
         # Zone progress
-        progress_text = font.render(f"Gherkin: {self.completed_gherkin}/{len(self.gherkin_puzzles)}  APIs: {self.completed_apis}/{len(self.api_terminals)}", True, WHITE)
+        progress_text = self.text_cache.render(font, f"Gherkin: {self.completed_gherkin}/{len(self.gherkin_puzzles)}  APIs: {self.completed_apis}/{len(self.api_terminals)}", True, WHITE)
         screen.blit(progress_text, (10, SCREEN_HEIGHT - 40))
 
     def draw(self, screen):
@@ -14,7 +14,7 @@ class Zone2(BaseZone):
 
     def load_zone_data(self):
         player_data = self.game_manager.save_manager.get_player_data()
-        self.player = Player(player_data["position"][0], player_data["position"][1])
+        self.player = Player(player_data["position"][0], player_data["position"][1], 32, 32, asset_key="player.png")
         self.add_entity(self.player)
 
         self.create_sql_terminals()
@@ -31,9 +31,10 @@ class Zone2(BaseZone):
             entity = Entity(terminal["x"], terminal["y"], 64, 64)
             entity.query = terminal["query"]
             entity.completed = False
-            entity.render = lambda screen, cx=0, cy=0: pygame.draw.rect(screen, PURPLE, (entity.x - cx, entity.y - cy, entity.width, entity.height))
+            entity.render = lambda screen, cx=0, cy=0, e=entity: pygame.draw.rect(screen, PURPLE, (e.rect.x - cx, e.rect.y - cy, e.width, e.height))
             entity.update = lambda dt: None
             self.sql_terminals.append(entity)
+            self.register_interactable(entity, 50, self.solve_sql_query, lambda e: not e.completed)
             self.add_entity(entity)
 
     def create_analytics_dashboards(self):
@@ -47,34 +48,21 @@ class Zone2(BaseZone):
             entity = Entity(dashboard["x"], dashboard["y"], 48, 48)
             entity.type = dashboard["type"]
             entity.completed = False
-            entity.render = lambda screen, cx=0, cy=0: pygame.draw.rect(screen, ORANGE, (entity.x - cx, entity.y - cy, entity.width, entity.height))
+            entity.render = lambda screen, cx=0, cy=0, e=entity: pygame.draw.rect(screen, ORANGE, (e.rect.x - cx, e.rect.y - cy, e.width, e.height))
             entity.update = lambda dt: None
             self.analytics_dashboards.append(entity)
+            self.register_interactable(entity, 40, self.create_analytics_dashboard, lambda e: not e.completed)
             self.add_entity(entity)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN and event.key == KEYS["INTERACT"]:
             self.check_interactions()
 
-    def check_interactions(self):
-        player_center_x = self.player.x + self.player.width // 2
-        player_center_y = self.player.y + self.player.height // 2
-
-        for terminal in self.sql_terminals:
-            if not terminal.completed and abs(player_center_x - (terminal.x + 32)) < 50 and abs(player_center_y - (terminal.y + 32)) < 50:
-                self.solve_sql_query(terminal)
-                break
-
-        for dashboard in self.analytics_dashboards:
-            if not dashboard.completed and abs(player_center_x - (dashboard.x + 24)) < 40 and abs(player_center_y - (dashboard.y + 24)) < 40:
-                self.create_analytics_dashboard(dashboard)
-                break
-
     def solve_sql_query(self, terminal):
         self.show_message(f"SQL query solved: {terminal.query}")
         terminal.completed = True
         self.completed_sql += 1
-        self.player.experience += 60
+        self.player.gain_experience(60)
         self.game_manager.audio_manager.play_sound("sql_success.wav")
         self.check_completion()
 
@@ -82,7 +70,7 @@ class Zone2(BaseZone):
         self.show_message(f"Analytics dashboard created: {dashboard.type}")
         dashboard.completed = True
         self.completed_analytics += 1
-        self.player.experience += 80
+        self.player.gain_experience(80)
         self.game_manager.audio_manager.play_sound("dashboard_created.wav")
         self.check_completion()
 
@@ -94,14 +82,14 @@ class Zone2(BaseZone):
         # REQ-AUDIO-03: Spatial Audio (Simple)
         # Update spatial audio for terminals (simulating server fans)
         if hasattr(self.game_manager, 'audio_manager') and self.player:
-            player_pos = (self.player.x, self.player.y)
+            player_pos = self.player.rect.topleft
             # Use the first terminal as the main server fan noise source
             if self.sql_terminals:
                 server = self.sql_terminals[0]
                 # Calculate volume based on distance
                 max_dist = 400
-                dx = server.x - player_pos[0]
-                dy = server.y - player_pos[1]
+                dx = server.rect.x - player_pos[0]
+                dy = server.rect.y - player_pos[1]
                 dist = (dx*dx + dy*dy)**0.5
 
                 if dist <= max_dist:
@@ -116,7 +104,7 @@ class Zone2(BaseZone):
     def render_ui(self, screen):
         super().render_ui(screen)
         font = self.game_manager.asset_manager.load_font("default.ttf", 20)
-        progress_text = font.render(f"SQL: {self.completed_sql}/{len(self.sql_terminals)}  Analytics: {self.completed_analytics}/{len(self.analytics_dashboards)}", True, WHITE)
+        progress_text = self.text_cache.render(font, f"SQL: {self.completed_sql}/{len(self.sql_terminals)}  Analytics: {self.completed_analytics}/{len(self.analytics_dashboards)}", True, WHITE)
         screen.blit(progress_text, (10, SCREEN_HEIGHT - 40))
 
     def check_completion(self):
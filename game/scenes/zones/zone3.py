@@ -14,7 +14,7 @@ class Zone3(BaseZone):
 
     def load_zone_data(self):
         player_data = self.game_manager.save_manager.get_player_data()
-        self.player = Player(player_data["position"][0], player_data["position"][1])
+        self.player = Player(player_data["position"][0], player_data["position"][1], 32, 32, asset_key="player.png")
         self.add_entity(self.player)
         self.create_model_workbenches()
         self.create_research_terminals()
@@ -29,9 +29,10 @@ class Zone3(BaseZone):
             entity = Entity(wb["x"], wb["y"], 64, 64)
             entity.model = wb["model"]
             entity.completed = False
-            entity.render = lambda screen, cx=0, cy=0: pygame.draw.rect(screen, TEAL, (entity.x - cx, entity.y - cy, entity.width, entity.height))
+            entity.render = lambda screen, cx=0, cy=0, e=entity: pygame.draw.rect(screen, TEAL, (e.rect.x - cx, e.rect.y - cy, e.width, e.height))
             entity.update = lambda dt: None
             self.model_workbenches.append(entity)
+            self.register_interactable(entity, 50, self.build_model, lambda e: not e.completed)
             self.add_entity(entity)
 
     def create_research_terminals(self):
@@ -44,34 +45,21 @@ class Zone3(BaseZone):
             entity = Entity(term["x"], term["y"], 48, 48)
             entity.topic = term["topic"]
             entity.completed = False
-            entity.render = lambda screen, cx=0, cy=0: pygame.draw.rect(screen, YELLOW, (entity.x - cx, entity.y - cy, entity.width, entity.height))
+            entity.render = lambda screen, cx=0, cy=0, e=entity: pygame.draw.rect(screen, YELLOW, (e.rect.x - cx, e.rect.y - cy, e.width, e.height))
             entity.update = lambda dt: None
             self.research_terminals.append(entity)
+            self.register_interactable(entity, 40, self.conduct_research, lambda e: not e.completed)
             self.add_entity(entity)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN and event.key == KEYS["INTERACT"]:
             self.check_interactions()
 
-    def check_interactions(self):
-        player_center_x = self.player.x + self.player.width // 2
-        player_center_y = self.player.y + self.player.height // 2
-
-        for wb in self.model_workbenches:
-            if not wb.completed and abs(player_center_x - (wb.x + 32)) < 50 and abs(player_center_y - (wb.y + 32)) < 50:
-                self.build_model(wb)
-                break
-
-        for term in self.research_terminals:
-            if not term.completed and abs(player_center_x - (term.x + 24)) < 40 and abs(player_center_y - (term.y + 24)) < 40:
-                self.conduct_research(term)
-                break
-
     def build_model(self, wb):
         self.show_message(f"Model built: {wb.model}")
         wb.completed = True
         self.completed_models += 1
-        self.player.experience += 70
+        self.player.gain_experience(70)
         self.game_manager.audio_manager.play_sound("model_built.wav")
         self.check_completion()
 
@@ -79,7 +67,7 @@ class Zone3(BaseZone):
         self.show_message(f"Research completed: {term.topic}")
         term.completed = True
         self.completed_research += 1
-        self.player.experience += 90
+        self.player.gain_experience(90)
         self.game_manager.audio_manager.play_sound("research_complete.wav")
         self.check_completion()
 
@@ -89,7 +77,7 @@ class Zone3(BaseZone):
     def render_ui(self, screen):
         super().render_ui(screen)
         font = self.game_manager.asset_manager.load_font("default.ttf", 20)
-        progress_text = font.render(f"Models: {self.completed_models}/{len(self.model_workbenches)}  Research: {self.completed_research}/{len(self.research_terminals)}", True, WHITE)
+        progress_text = self.text_cache.render(font, f"Models: {self.completed_models}/{len(self.model_workbenches)}  Research: {self.completed_research}/{len(self.research_terminals)}", True, WHITE)
         screen.blit(progress_text, (10, SCREEN_HEIGHT - 40))
 
     def check_completion(self):
@@ -14,7 +14,7 @@ class Zone4(BaseZone):
 
     def load_zone_data(self):
         player_data = self.game_manager.save_manager.get_player_data()
-        self.player = Player(player_data["position"][0], player_data["position"][1])
+        self.player = Player(player_data["position"][0], player_data["position"][1], 32, 32, asset_key="player.png")
         self.add_entity(self.player)
         self.create_blueprint_tables()
         self.create_qa_stations()
@@ -29,9 +29,10 @@ class Zone4(BaseZone):
             entity = Entity(table["x"], table["y"], 64, 64)
             entity.system = table["system"]
             entity.completed = False
-            entity.render = lambda screen, cx=0, cy=0: pygame.draw.rect(screen, ORANGE, (entity.x - cx, entity.y - cy, entity.width, entity.height))
+            entity.render = lambda screen, cx=0, cy=0, e=entity: pygame.draw.rect(screen, ORANGE, (e.rect.x - cx, e.rect.y - cy, e.width, e.height))
             entity.update = lambda dt: None
             self.blueprint_tables.append(entity)
+            self.register_interactable(entity, 50, self.design_blueprint, lambda e: not e.completed)
             self.add_entity(entity)
 
     def create_qa_stations(self):
@@ -44,34 +45,21 @@ class Zone4(BaseZone):
             entity = Entity(station["x"], station["y"], 48, 48)
             entity.test = station["test"]
             entity.completed = False
-            entity.render = lambda screen, cx=0, cy=0: pygame.draw.rect(screen, RED, (entity.x - cx, entity.y - cy, entity.width, entity.height))
+            entity.render = lambda screen, cx=0, cy=0, e=entity: pygame.draw.rect(screen, RED, (e.rect.x - cx, e.rect.y - cy, e.width, e.height))
             entity.update = lambda dt: None
             self.qa_stations.append(entity)
+            self.register_interactable(entity, 40, self.perform_qa_test, lambda e: not e.completed)
             self.add_entity(entity)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN and event.key == KEYS["INTERACT"]:
             self.check_interactions()
 
-    def check_interactions(self):
-        player_center_x = self.player.x + self.player.width // 2
-        player_center_y = self.player.y + self.player.height // 2
-
-        for table in self.blueprint_tables:
-            if not table.completed and abs(player_center_x - (table.x + 32)) < 50 and abs(player_center_y - (table.y + 32)) < 50:
-                self.design_blueprint(table)
-                break
-
-        for station in self.qa_stations:
-            if not station.completed and abs(player_center_x - (station.x + 24)) < 40 and abs(player_center_y - (station.y + 24)) < 40:
-                self.perform_qa_test(station)
-                break
-
     def design_blueprint(self, table):
         self.show_message(f"Blueprint designed: {table.system}")
         table.completed = True
         self.completed_blueprints += 1
-        self.player.experience += 85
+        self.player.gain_experience(85)
         self.game_manager.audio_manager.play_sound("blueprint_done.wav")
         self.check_completion()
 
@@ -79,7 +67,7 @@ class Zone4(BaseZone):
         self.show_message(f"QA test completed: {station.test}")
         station.completed = True
         self.completed_qa += 1
-        self.player.experience += 65
+        self.player.gain_experience(65)
         self.game_manager.audio_manager.play_sound("qa_complete.wav")
         self.check_completion()
 
@@ -89,7 +77,7 @@ class Zone4(BaseZone):
     def render_ui(self, screen):
         super().render_ui(screen)
         font = self.game_manager.asset_manager.load_font("default.ttf", 20)
-        progress_text = font.render(f"Blueprints: {self.completed_blueprints}/{len(self.blueprint_tables)}  QA: {self.completed_qa}/{len(self.qa_stations)}", True, WHITE)
+        progress_text = self.text_cache.render(font, f"Blueprints: {self.completed_blueprints}/{len(self.blueprint_tables)}  QA: {self.completed_qa}/{len(self.qa_stations)}", True, WHITE)
         screen.blit(progress_text, (10, SCREEN_HEIGHT - 40))
 
     def check_completion(self):
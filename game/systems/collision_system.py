@@ -33,4 +33,163 @@ class CollisionSystem:
                 entity2.y += overlap_y / 2
             else:
                 entity1.y += overlap_y / 2
-                entity2.y -= overlap_y / 2
\ No newline at end of file
+                entity2.y -= overlap_y / 2
+
+    @staticmethod
+    def resolve_all(entities, grid=None):
+        """
+        Resolve every overlapping pair using a spatial hash broadphase.
+        A persistent grid can be passed in to avoid rebuilding it every frame;
+        entities are (re)inserted so their buckets match their current rects, and
+        grid members no longer in entities (removed from the scene) are dropped.
+        Returns the number of pairs that were pushed apart.
+        """
+        if grid is None:
+            grid = SpatialHashGrid()
+        current = dict.fromkeys(entities) # Deduplicated, in order so pair order stays stable
+        for entity in current:
+            grid.insert(entity)
+        if len(grid) > len(current):
+            for stale in [entity for entity in grid.entity_cells if entity not in current]:
+                grid.remove(stale)
+
+        resolved = 0
+        for entity1, entity2 in grid.candidate_pairs():
+            rect1, rect2 = entity1.rect, entity2.rect
+            if not rect1.colliderect(rect2):
+                continue
+
+            # Same push-apart rule as resolve_collision, applied to the rects
+            overlap_x = min(rect1.right - rect2.left, rect2.right - rect1.left)
+            overlap_y = min(rect1.bottom - rect2.top, rect2.bottom - rect1.top)
+            if overlap_x < overlap_y:
+                half = overlap_x // 2
+                if rect1.x < rect2.x:
+                    rect1.x -= half
+                    rect2.x += overlap_x - half
+                else:
+                    rect1.x += half
+                    rect2.x -= overlap_x - half
+            else:
+                half = overlap_y // 2
+                if rect1.y < rect2.y:
+                    rect1.y -= half
+                    rect2.y += overlap_y - half
+                else:
+                    rect1.y += half
+                    rect2.y -= overlap_y - half
+
+            grid.move(entity1)
+            grid.move(entity2)
+            resolved += 1
+        return resolved
+
+class SpatialHashGrid:
+    """
+    Uniform grid broadphase. Entities are bucketed by the cells their rect covers,
+    so neighbour queries only look at nearby buckets instead of every entity.
+    Cells default to the TMX tile size so they line up with the map grid.
+    """
+
+    def __init__(self, cell_width=32, cell_height=None):
+        self.cell_width = cell_width
+        self.cell_height = cell_height or cell_width
+        self.cells = {} # (cell_x, cell_y) -> dict of entities (insertion ordered, keeps pair order stable)
+        self.entity_cells = {} # entity -> tuple of cells it currently occupies
+
+    @classmethod
+    def for_tilemap(cls, tilemap_manager):
+        """Creates a grid whose cells match the loaded map's tile size."""
+        tmx_data = tilemap_manager.tmx_data
+        if not tmx_data:
+            return cls()
+        return cls(tmx_data.tilewidth, tmx_data.tileheight)
+
+    def _cells_for_rect(self, rect):
+        first_x = rect.left // self.cell_width
+        first_y = rect.top // self.cell_height
+        # right/bottom are exclusive, a zero-sized rect still occupies its cell
+        last_x = max(rect.left, rect.right - 1) // self.cell_width
+        last_y = max(rect.top, rect.bottom - 1) // self.cell_height
+        return tuple((x, y) for y in range(first_y, last_y + 1) for x in range(first_x, last_x + 1))
+
+    def insert(self, entity):
+        if entity in self.entity_cells:
+            self.move(entity)
+            return
+
+        cells = self._cells_for_rect(entity.rect)
+        self.entity_cells[entity] = cells
+        for cell in cells:
+            self.cells.setdefault(cell, {})[entity] = None
+
+    def remove(self, entity):
+        cells = self.entity_cells.pop(entity, ())
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.pop(entity, None)
+                if not bucket:
+                    del self.cells[cell]
+
+    def move(self, entity):
+        """Re-buckets an entity after its rect changed. Cheap when it stayed in the same cells."""
+        cells = self._cells_for_rect(entity.rect)
+        if self.entity_cells.get(entity) == cells:
+            return
+        self.remove(entity)
+        self.entity_cells[entity] = cells
+        for cell in cells:
+            self.cells.setdefault(cell, {})[entity] = None
+
+    def clear(self):
+        self.cells.clear()
+        self.entity_cells.clear()
+
+    def __len__(self):
+        return len(self.entity_cells)
+
+    def __contains__(self, entity):
+        return entity in self.entity_cells
+
+    def query_rect(self, rect):
+        """Returns the set of entities whose rect overlaps the given rect."""
+        rect = pygame.Rect(rect)
+        found = set()
+        for cell in self._cells_for_rect(rect):
+            bucket = self.cells.get(cell)
+            if bucket:
+                for entity in bucket:
+                    if entity not in found and entity.rect.colliderect(rect):
+                        found.add(entity)
+        return found
+
+    def query_radius(self, center, radius):
+        """Returns the set of entities whose rect center lies within radius of center."""
+        cx, cy = center
+        bounds = pygame.Rect(int(cx - radius), int(cy - radius), int(radius * 2) + 1, int(radius * 2) + 1)
+        radius_sq = radius * radius
+        found = set()
+        for cell in self._cells_for_rect(bounds):
+            bucket = self.cells.get(cell)
+            if bucket:
+                for entity in bucket:
+                    ex, ey = entity.rect.center
+                    if (ex - cx) ** 2 + (ey - cy) ** 2 <= radius_sq:
+                        found.add(entity)
+        return found
+
+    def candidate_pairs(self):
+        """Yields each pair of entities that share at least one cell, exactly once."""
+        seen = set()
+        for bucket in list(self.cells.values()):
+            if len(bucket) < 2:
+                continue
+            members = list(bucket)
+            for i, entity1 in enumerate(members):
+                for entity2 in members[i + 1:]:
+                    key = (id(entity1), id(entity2)) if id(entity1) < id(entity2) else (id(entity2), id(entity1))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield entity1, entity2
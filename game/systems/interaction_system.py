@@ -0,0 +1,98 @@
+from game.systems.collision_system import SpatialHashGrid
+
+class Interactable:
+    """An entity registered with an InteractionIndex, plus how to interact with it."""
+
+    def __init__(self, entity, interaction_range, on_interact=None, is_available=None, order=0):
+        self.entity = entity
+        self.interaction_range = interaction_range
+        self.on_interact = on_interact
+        self.is_available = is_available
+        self.order = order # Registration order, breaks distance ties deterministically
+
+    def available(self):
+        return self.is_available is None or self.is_available(self.entity)
+
+    def interact(self):
+        if self.on_interact:
+            self.on_interact(self.entity)
+
+class InteractionIndex:
+    """
+    Spatial index answering "what can the player interact with right now".
+    Backed by a SpatialHashGrid; the in-range set is cached until the player
+    moves or the registered interactables change. Availability (e.g. an already
+    completed station) is re-checked on every read, so it never goes stale.
+    """
+
+    def __init__(self, cell_size=32):
+        self.grid = SpatialHashGrid(cell_size)
+        self.interactables = {} # entity -> Interactable
+        self.max_range = 0
+        self._next_order = 0
+        self._cached_position = None
+        self._cached_in_range = []
+
+    def register(self, entity, interaction_range=None, on_interact=None, is_available=None):
+        if interaction_range is None:
+            interaction_range = getattr(entity, 'interaction_range', 50)
+        interactable = Interactable(entity, interaction_range, on_interact, is_available, self._next_order)
+        self._next_order += 1
+        self.interactables[entity] = interactable
+        self.grid.insert(entity)
+        self.max_range = max(self.max_range, interaction_range)
+        self.invalidate()
+        return interactable
+
+    def unregister(self, entity):
+        if self.interactables.pop(entity, None):
+            self.grid.remove(entity)
+            self.max_range = max((i.interaction_range for i in self.interactables.values()), default=0)
+            self.invalidate()
+
+    def update_entity(self, entity):
+        """Call after a registered entity moved."""
+        if entity in self.interactables:
+            self.grid.move(entity)
+            self.invalidate()
+
+    def clear(self):
+        self.grid.clear()
+        self.interactables.clear()
+        self.max_range = 0
+        self.invalidate()
+
+    def invalidate(self):
+        self._cached_position = None
+        self._cached_in_range = []
+
+    def _in_range(self, position):
+        position = (position[0], position[1])
+        if position == self._cached_position:
+            return self._cached_in_range
+
+        px, py = position
+        in_range = []
+        for entity in self.grid.query_radius(position, self.max_range):
+            interactable = self.interactables[entity]
+            ex, ey = entity.rect.center
+            dist_sq = (ex - px) ** 2 + (ey - py) ** 2
+            if dist_sq < interactable.interaction_range ** 2:
+                in_range.append((dist_sq, interactable))
+
+        # Nearest first, registration order for equal distances
+        in_range.sort(key=lambda item: (item[0], item[1].order))
+
+        self._cached_position = position
+        self._cached_in_range = [interactable for _, interactable in in_range]
+        return self._cached_in_range
+
+    def query(self, position):
+        """Returns available interactables in range of position, nearest first."""
+        return [i for i in self._in_range(position) if i.available()]
+
+    def nearest(self, position):
+        for interactable in self._in_range(position):
+            if interactable.available():
+                return interactable
+        return None
@@ -0,0 +1,106 @@
+import pygame
+from config import LIGHTING_AMBIENT, LIGHTING_SCALE
+
+class Light:
+    """A radial light, either at a fixed position or following an entity's rect center."""
+
+    def __init__(self, radius, falloff=1.0, intensity=255, position=(0, 0), entity=None):
+        self.radius = radius
+        self.falloff = falloff # 0 = hard edge, 1 = linear, higher = tighter hotspot
+        self.intensity = intensity
+        self.position = position
+        self.entity = entity
+
+    def get_position(self):
+        if self.entity is not None:
+            return self.entity.rect.center
+        return self.position
+
+class LightingSystem:
+    """
+    Darkness with any number of lights, composited with a multiply blend.
+
+    Each (radius, falloff, intensity) mask is rendered once and shared. Lights are
+    combined into a light map at 1/LIGHTING_SCALE resolution, which is only rebuilt
+    (and upscaled) when a light moves by at least one light-map pixel or the set of
+    lights changes. Drawing an unchanged frame is a single BLEND_RGB_MULT blit.
+    The upscale is nearest-neighbour: smoothscale costs ~10x more per rebuild and
+    the gradients are soft enough that the difference doesn't show at small scales.
+    """
+    _masks = {} # (radius, falloff, intensity, scale) -> Surface
+
+    def __init__(self, size, ambient=LIGHTING_AMBIENT, scale=LIGHTING_SCALE):
+        self.size = (int(size[0]), int(size[1]))
+        self.scale = scale
+        self.ambient = (ambient, ambient, ambient)
+        self.lights = []
+
+        low_size = (max(1, -(-self.size[0] // scale)), max(1, -(-self.size[1] // scale)))
+        self.light_map = pygame.Surface(low_size)
+        self.full_light_map = pygame.Surface(self.size)
+        self._signature = None
+        self.rebuilds = 0
+
+    @classmethod
+    def get_mask(cls, radius, falloff=1.0, intensity=255, scale=1):
+        """Grayscale radial gradient on black, rendered at 1/scale size and cached."""
+        key = (radius, falloff, intensity, scale)
+        mask = cls._masks.get(key)
+        if mask is None:
+            low_radius = max(1, round(radius / scale))
+            mask = pygame.Surface((low_radius * 2, low_radius * 2))
+            mask.fill((0, 0, 0))
+            # Outermost ring first, each smaller circle overwrites with a brighter value
+            for r in range(low_radius, 0, -1):
+                value = int(intensity * (1 - (r - 1) / low_radius) ** falloff)
+                pygame.draw.circle(mask, (value, value, value), (low_radius, low_radius), r)
+            cls._masks[key] = mask
+        return mask
+
+    def add_light(self, radius, falloff=1.0, intensity=255, position=(0, 0), entity=None):
+        light = Light(radius, falloff, intensity, position, entity)
+        self.lights.append(light)
+        self.invalidate()
+        return light
+
+    def remove_light(self, light):
+        if light in self.lights:
+            self.lights.remove(light)
+            self.invalidate()
+
+    def clear(self):
+        self.lights.clear()
+        self.invalidate()
+
+    def invalidate(self):
+        self._signature = None
+
+    def _light_map_signature(self, camera):
+        cx, cy = camera
+        return tuple(
+            (int((x - cx) // self.scale), int((y - cy) // self.scale), light.radius, light.falloff, light.intensity)
+            for light in self.lights
+            for x, y in (light.get_position(),)
+        )
+
+    def update(self, camera=(0, 0)):
+        """Rebuilds the light map if any light moved. Returns True when it was rebuilt."""
+        signature = self._light_map_signature(camera)
+        if signature == self._signature:
+            return False
+
+        self.light_map.fill(self.ambient)
+        for x, y, radius, falloff, intensity in signature:
+            mask = self.get_mask(radius, falloff, intensity, self.scale)
+            half = mask.get_width() // 2
+            # Overlapping lights take the brighter value instead of saturating
+            self.light_map.blit(mask, (x - half, y - half), special_flags=pygame.BLEND_RGB_MAX)
+
+        pygame.transform.scale(self.light_map, self.size, self.full_light_map)
+        self._signature = signature
+        self.rebuilds += 1
+        return True
+
+    def draw(self, screen, camera=(0, 0)):
+        self.update(camera)
+        screen.blit(self.full_light_map, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
@@ -1,6 +1,7 @@
 import pygame
 import random
 from config import *
+from game.utils.text_cache import TextCache
 
 class Block:
     def __init__(self, text, x, y, width, height, font):
@@ -10,13 +11,14 @@ class Block:
         self.font = font
         self.is_dragging = False
         self.drag_offset = (0, 0)
+        self.text_cache = TextCache()
 
     def draw(self, screen):
         color = (200, 200, 200) if not self.is_dragging else (220, 220, 220)
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, BLACK, self.rect, 2)
 
-        text_surface = self.font.render(self.text, True, BLACK)
+        text_surface = self.text_cache.render(self.font, self.text, True, BLACK)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -28,6 +30,7 @@ class GherkinMinigame:
         self.on_complete = on_complete
         self.on_cancel = on_cancel
         self.font = pygame.font.Font(None, 24)
+        self.text_cache = TextCache()
 
         if not self.correct_order:
              # Fallback or error handling
@@ -149,7 +152,7 @@ class GherkinMinigame:
         screen.blit(overlay, (0, 0))
 
         # Draw title
-        title_surf = self.font.render(f"Construct Scenario: {self.scenario_name}", True, WHITE)
+        title_surf = self.text_cache.render(self.font, f"Construct Scenario: {self.scenario_name}", True, WHITE)
         screen.blit(title_surf, (20, 20))
 
         # Draw slots
@@ -158,7 +161,7 @@ class GherkinMinigame:
             pygame.draw.rect(screen, WHITE, slot, 2)
             # Label
             label = ["Given", "When", "Then"][i]
-            label_surf = self.font.render(label, True, (150, 150, 150))
+            label_surf = self.text_cache.render(self.font, label, True, (150, 150, 150))
             screen.blit(label_surf, (slot.x - 60, slot.centery - 10))
 
         # Draw blocks
@@ -1,11 +1,29 @@
 import pygame
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, PRIMARY_BLUE
+from game.utils.text_cache import TextCache
+from game.utils.xp_table import level_progress, xp_for_level
+
+def draw_loading_bar(screen, progress, label="Loading..."):
+    """Centered progress bar for zone changes, progress is 0.0 - 1.0."""
+    bar_width = SCREEN_WIDTH * 0.5
+    bar_height = 20
+    x = (SCREEN_WIDTH - bar_width) / 2
+    y = SCREEN_HEIGHT / 2
+
+    pygame.draw.rect(screen, (50, 50, 50), (x, y, bar_width, bar_height))
+    pygame.draw.rect(screen, PRIMARY_BLUE, (x, y, int(bar_width * max(0.0, min(1.0, progress))), bar_height))
+    pygame.draw.rect(screen, WHITE, (x, y, bar_width, bar_height), 2)
+
+    text_cache = TextCache()
+    text = text_cache.render(text_cache.get_font(24), label, True, WHITE)
+    screen.blit(text, text.get_rect(midbottom=(SCREEN_WIDTH / 2, y - 10)))
 
 class HUD:
     def __init__(self, game):
         self.game = game
         self.font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 32)
+        self.text_cache = TextCache()
 
     def draw(self, screen):
         # Experience/Level Bar at the top
@@ -15,16 +33,12 @@ class HUD:
         self.draw_zone_info(screen)
 
     def draw_experience_bar(self, screen):
-        # Placeholder for experience.
-        # Assuming player has .experience and .level attributes or we use placeholders.
-        # Since I don't see Player class implementation details yet, I'll assume some values or check Player class.
-
         player = self.game.scene_manager.scenes.get('game_scene').player if 'game_scene' in self.game.scene_manager.scenes else None
 
-        # Let's check if player exists and has attributes, otherwise defaults.
-        level = getattr(player, 'level', 1)
+        # Level and bar come from the shared XP table, so they match the player and the pipeline
         experience = getattr(player, 'experience', 0)
-        max_experience = getattr(player, 'max_experience', 100)
+        level, into_level, level_xp = level_progress(experience)
+        max_experience = xp_for_level(level + 1)
 
         bar_width = SCREEN_WIDTH * 0.8
         bar_height = 20
@@ -35,18 +49,18 @@ class HUD:
         pygame.draw.rect(screen, (50, 50, 50), (x, y, bar_width, bar_height))
 
         # Progress
-        fill_width = int(bar_width * (experience / max_experience))
+        fill_width = int(bar_width * (into_level / level_xp))
         pygame.draw.rect(screen, PRIMARY_BLUE, (x, y, fill_width, bar_height))
 
         # Border
         pygame.draw.rect(screen, WHITE, (x, y, bar_width, bar_height), 2)
 
         # Text
-        text = self.font.render(f"Level {level}", True, WHITE)
+        text = self.text_cache.render(self.font, f"Level {level}", True, WHITE)
         text_rect = text.get_rect(midleft=(x + 10, y + bar_height / 2))
         screen.blit(text, text_rect)
 
-        xp_text = self.font.render(f"{experience}/{max_experience}", True, WHITE)
+        xp_text = self.text_cache.render(self.font, f"{experience}/{max_experience}", True, WHITE)
         xp_rect = xp_text.get_rect(midright=(x + bar_width - 10, y + bar_height / 2))
         screen.blit(xp_text, xp_rect)
 
@@ -64,7 +78,7 @@ class HUD:
                  zone_name = getattr(game_scene.active_zone, 'name', "Zone 1")
 
         # Draw styled box for Zone Name
-        text = self.title_font.render(zone_name, True, WHITE)
+        text = self.text_cache.render(self.title_font, zone_name, True, WHITE)
         padding = 10
         box_width = text.get_width() + 2 * padding
         box_height = text.get_height() + 2 * padding
@@ -1,14 +1,15 @@
 import pygame
-import webbrowser
 import os
 import json
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, PRIMARY_BLUE, WARM_BEIGE
 from game.managers.asset_manager import AssetManager
+from game.utils.text_cache import TextCache
 
 class PauseMenu:
     def __init__(self, game):
         self.game = game
         self.font = pygame.font.Font(None, 50)
+        self.text_cache = TextCache()
         self.options = ["Resume", "Print Resume", "Main Menu"]
         self.selected_index = 0
         self.visible = False
@@ -67,6 +68,7 @@ class PauseMenu:
             print(f"Resume exported to {os.path.abspath(filename)}")
 
             # Open the file
+            import webbrowser
             webbrowser.open('file://' + os.path.abspath(filename))
         except Exception as e:
             print(f"Failed to export resume: {e}")
@@ -161,7 +163,7 @@ class PauseMenu:
         pygame.draw.rect(screen, BLACK, self.rect, 2)
 
         # Draw Title
-        title_surf = self.font.render("Paused", True, PRIMARY_BLUE)
+        title_surf = self.text_cache.render(self.font, "Paused", True, PRIMARY_BLUE)
         title_rect = title_surf.get_rect(center=(self.rect.centerx, self.rect.top + 40))
         screen.blit(title_surf, title_rect)
 
@@ -169,6 +171,6 @@ class PauseMenu:
         start_y = self.rect.top + 100
         for i, option in enumerate(self.options):
             color = PRIMARY_BLUE if i == self.selected_index else BLACK
-            text_surf = self.font.render(option, True, color)
+            text_surf = self.text_cache.render(self.font, option, True, color)
             rect = text_surf.get_rect(center=(self.rect.centerx, start_y + i * 50))
             screen.blit(text_surf, rect)
@@ -0,0 +1,174 @@
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Any, Dict, List, Optional, Union
+
+# Layout: header | index (JSON, utf-8) | data
+# header = magic, format version, flags (unused), index length in bytes
+HEADER = struct.Struct("<4sHHQ")
+MAGIC = b"PGPK"
+VERSION = 1
+
+# Text formats shrink well; images and audio are already compressed and stay stored
+# as-is so they can be read straight out of the mapping without a copy
+COMPRESSED_EXTENSIONS = {".json", ".tmx", ".tsx", ".txt"}
+SKIPPED_FILES = {".placeholder", ".DS_Store", "Thumbs.db"}
+
+class AssetPackError(ValueError):
+    pass
+
+class PackFileReader(io.RawIOBase):
+    """Read-only file object over a slice of the pack; reads copy only into the caller's buffer."""
+
+    def __init__(self, view: memoryview, name: str):
+        self.view = view
+        self.name = name
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = min(len(buffer), len(self.view) - self.position)
+        if count <= 0:
+            return 0
+        buffer[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = len(self.view) + offset
+        else:
+            raise ValueError(f"invalid whence {whence}")
+        self.position = max(0, position)
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+    def close(self) -> None:
+        self.view = memoryview(b"")
+        super().close()
+
+class AssetPack:
+    """
+    Read side of the single-file asset pack written by write_pack().
+
+    The file is memory-mapped (or read whole where mmap is unavailable, e.g. the
+    browser file system), and entries are served as memoryview slices of it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self.buffer: Union[mmap.mmap, bytes] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self.buffer = f.read()
+        self.view = memoryview(self.buffer)
+
+        if len(self.view) < HEADER.size:
+            raise AssetPackError(f"{path}: truncated header")
+        magic, version, _flags, index_size = HEADER.unpack_from(self.view, 0)
+        if magic != MAGIC:
+            raise AssetPackError(f"{path}: not an asset pack")
+        if version != VERSION:
+            raise AssetPackError(f"{path}: unsupported pack version {version}")
+
+        index_end = HEADER.size + index_size
+        self.index: Dict[str, Dict[str, Any]] = json.loads(str(self.view[HEADER.size:index_end], "utf-8"))["files"]
+        self.data_start = index_end
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def names(self) -> List[str]:
+        return list(self.index)
+
+    def get_buffer(self, name: str) -> Union[memoryview, bytes]:
+        """Entry contents: a zero-copy view for stored entries, bytes for compressed ones."""
+        entry = self.index[name]
+        start = self.data_start + entry["offset"]
+        data = self.view[start:start + entry["stored_size"]]
+        if entry.get("compression") == "zlib":
+            return zlib.decompress(data)
+        return data
+
+    def open(self, name: str) -> PackFileReader:
+        buffer = self.get_buffer(name)
+        return PackFileReader(buffer if isinstance(buffer, memoryview) else memoryview(buffer), name)
+
+    def verify(self, name: Optional[str] = None) -> List[str]:
+        """Returns the names whose content hash doesn't match the index (all entries by default)."""
+        names = [name] if name is not None else self.names()
+        return [n for n in names if hashlib.sha256(self.get_buffer(n)).hexdigest() != self.index[n]["sha256"]]
+
+    def close(self) -> None:
+        self.view.release()
+        if isinstance(self.buffer, mmap.mmap):
+            try:
+                self.buffer.close()
+            except BufferError:
+                pass # Readers still hold slices; the mapping goes away with them
+
+def write_pack(source_dir: str, output_path: str) -> Dict[str, Any]:
+    """
+    Packs every file under source_dir (names are '/'-separated paths relative to it)
+    into output_path. Returns the index, plus totals for reporting.
+    """
+    files = []
+    for root, dirs, names in os.walk(source_dir):
+        dirs.sort()
+        for filename in sorted(names):
+            if filename in SKIPPED_FILES:
+                continue
+            full_path = os.path.join(root, filename)
+            files.append((os.path.relpath(full_path, source_dir).replace(os.sep, "/"), full_path))
+
+    index = {}
+    blobs = []
+    offset = 0
+    for name, full_path in files:
+        with open(full_path, "rb") as f:
+            data = f.read()
+        entry = {"offset": offset, "size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+        stored = data
+        if os.path.splitext(name)[1].lower() in COMPRESSED_EXTENSIONS:
+            compressed = zlib.compress(data, 9)
+            if len(compressed) < len(data):
+                stored = compressed
+                entry["compression"] = "zlib"
+        entry["stored_size"] = len(stored)
+        index[name] = entry
+        blobs.append(stored)
+        offset += len(stored)
+
+    index_bytes = json.dumps({"files": index}, separators=(",", ":")).encode("utf-8")
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(index_bytes)))
+        f.write(index_bytes)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, output_path)
+
+    return {
+        "files": index,
+        "total_size": sum(entry["size"] for entry in index.values()),
+        "packed_size": HEADER.size + len(index_bytes) + offset,
+    }
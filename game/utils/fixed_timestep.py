@@ -0,0 +1,40 @@
+# Tolerance for float drift, so e.g. 0.25 s + 0.05 s yields exactly three 0.1 s steps
+EPSILON = 1e-9
+
+class FixedTimestep:
+    """
+    Accumulates real frame time and hands it out as fixed-size simulation steps.
+    Whatever is left over (less than one step) is exposed as alpha in [0, 1) so
+    draw code can interpolate between the previous and current simulation state.
+    """
+
+    def __init__(self, tick_rate, max_steps):
+        self.step = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped_time = 0.0 # Simulation time discarded by the last advance()
+
+    def advance(self, frame_time):
+        """Adds frame_time and returns how many fixed steps to simulate this frame."""
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator + EPSILON >= self.step and steps < self.max_steps:
+            self.accumulator -= self.step
+            steps += 1
+
+        # Cap catch-up so a long stall can't snowball into ever longer frames
+        self.dropped_time = 0.0
+        if self.accumulator + EPSILON >= self.step:
+            remainder = self.accumulator % self.step
+            self.dropped_time = self.accumulator - remainder
+            self.accumulator = remainder
+
+        self.accumulator = max(0.0, self.accumulator)
+        self.alpha = min(self.accumulator / self.step, 1.0)
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped_time = 0.0
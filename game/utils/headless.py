@@ -0,0 +1,50 @@
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Stand-ins for Game and its managers, enough to construct and drive scenes without the
+# main loop: used by benchmark.py (under the SDL dummy drivers) and the scene tests.
+
+class HeadlessAudioManager:
+    """Silent audio manager covering everything the scenes and zones call."""
+
+    def play_ui_sound(self, sound):
+        pass
+
+    def play_sound(self, sound):
+        pass
+
+    def play_music(self, track):
+        pass
+
+    def start_ambient(self, zone_id):
+        pass
+
+    def set_ambient_volume(self, volume):
+        pass
+
+    def play_typing_sound(self):
+        pass
+
+class HeadlessSceneManager:
+    """Holds ready-made scenes; set_scene only records which one was asked for."""
+
+    def __init__(self, game):
+        self.scenes = {}
+        self.current_scene = None
+        self.game = game
+
+    def add_scene(self, name, scene):
+        self.scenes[name] = scene
+
+    def get_scene(self, name):
+        return self.scenes.get(name)
+
+    def set_scene(self, scene_name):
+        self.current_scene = scene_name
+
+class HeadlessGame:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.running = True
+        self.scene_manager = HeadlessSceneManager(self)
+        self.audio_manager = HeadlessAudioManager()
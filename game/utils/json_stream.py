@@ -0,0 +1,133 @@
+import json
+from typing import Any, Iterator, TextIO, Tuple
+
+# Characters read per refill; a value that doesn't fit is retried with a doubled read
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+def _error_at(message, doc, pos, offset, lines, line_start):
+    """JSONDecodeError for doc[pos], where doc starts offset chars (and lines newlines) into
+    the stream, on a line that starts at line_start."""
+    e = json.JSONDecodeError(message, doc, pos)
+    e.pos = offset + pos
+    if e.lineno == 1:
+        e.colno = e.pos - line_start + 1
+    e.lineno += lines
+    e.args = (f"{message}: line {e.lineno} column {e.colno} (char {e.pos})",)
+    return e
+
+def iter_object_members(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields (key, value) for each member of the top-level JSON object in stream, parsing
+    one member at a time. Only the text of the member being parsed is held, so memory is
+    bounded by the largest value rather than the whole document.
+
+    Raises json.JSONDecodeError for malformed input, positioned in the whole stream.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    # Text already dropped from the front of the buffer: length, newlines, start of its last line
+    dropped = 0
+    dropped_lines = 0
+    line_start = 0
+
+    def drop_parsed():
+        nonlocal buffer, pos, dropped, dropped_lines, line_start
+        newlines = buffer.count("\n", 0, pos)
+        if newlines:
+            dropped_lines += newlines
+            line_start = dropped + buffer.rindex("\n", 0, pos) + 1
+        dropped += pos
+        buffer = buffer[pos:]
+        pos = 0
+
+    def refill(minimum):
+        nonlocal buffer, eof
+        drop_parsed()
+        data = stream.read(max(chunk_size, minimum))
+        if data:
+            buffer += data
+        else:
+            eof = True
+
+    def error(message, at=None):
+        return _error_at(message, buffer, pos if at is None else at, dropped, dropped_lines, line_start)
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            refill(0)
+
+    def expect(char, message):
+        nonlocal pos
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] != char:
+            raise error(message)
+        pos += 1
+
+    def decode():
+        nonlocal pos
+        skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # A number near the end of the buffer may be cut short ("-1" of "-1.5e3"): at
+                # most two more number characters can follow a decodable prefix
+                tail = buffer[end:end + 3]
+                if eof or len(tail) == 3 or tail.strip(_NUMBER_CHARS):
+                    pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise error(e.msg, e.pos) from None
+            refill(len(buffer) - pos)
+
+    expect("{", "Expecting '{'")
+    skip_whitespace()
+    if buffer[pos:pos + 1] == "}":
+        pos += 1
+    else:
+        while True:
+            skip_whitespace()
+            if buffer[pos:pos + 1] != '"':
+                raise error("Expecting property name enclosed in double quotes")
+            key = decode()
+            expect(":", "Expecting ':' delimiter")
+            value = decode()
+            if pos > chunk_size:
+                drop_parsed() # Don't keep the text of a large value while it is being used
+            yield key, value
+            del value
+            skip_whitespace()
+            if buffer[pos:pos + 1] == ",":
+                pos += 1
+                continue
+            expect("}", "Expecting ',' delimiter")
+            break
+
+    skip_whitespace()
+    if pos < len(buffer):
+        raise error("Extra data")
+
+def iter_jsonl_members(stream: TextIO) -> Iterator[Tuple[str, Any]]:
+    """Line-delimited form: each non-blank line is an object of one or more top-level members."""
+    offset = 0
+    for line_number, line in enumerate(stream, 1):
+        line_offset, offset = offset, offset + len(line)
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise _error_at(e.msg, line, e.pos, line_offset, line_number - 1, line_offset) from None
+        if not isinstance(record, dict):
+            raise _error_at("Expecting an object", line, 0, line_offset, line_number - 1, line_offset)
+        yield from record.items()
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+class SizedLRUCache(MutableMapping):
+    """
+    Dict-like cache bounded by the total size of its values rather than their count.
+
+    sizeof(key, value) gives an entry's size in bytes. When inserting pushes the
+    resident size past budget_bytes, least recently used entries are evicted. Pinned
+    keys are never evicted (but still count towards the budget). A value larger than
+    the whole budget is not stored at all, rather than flushing everything else.
+
+    Only get() and __getitem__ count as lookups for the hit/miss stats and refresh
+    recency; `in` checks and iteration don't.
+    """
+
+    def __init__(self, budget_bytes: int, sizeof: Callable[[Any, Any], int], name: str = "cache",
+                 on_evict: Optional[Callable[[Any, Any], None]] = None):
+        self.budget_bytes = budget_bytes
+        self.sizeof = sizeof
+        self.name = name
+        self.on_evict = on_evict
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.sizes: Dict[Hashable, int] = {}
+        self.pinned = set()
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getitem__(self, key):
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self.entries:
+            return self[key]
+        self.misses += 1
+        return default
+
+    def __setitem__(self, key, value):
+        size = self.sizeof(key, value)
+        if key in self.entries:
+            self._discard(key)
+        if size > self.budget_bytes and key not in self.pinned:
+            return # Would evict everything else and still not fit
+
+        self.entries[key] = value
+        self.sizes[key] = size
+        self.resident_bytes += size
+        self.trim()
+
+    def __delitem__(self, key):
+        if key not in self.entries:
+            raise KeyError(key)
+        self._discard(key)
+
+    def _discard(self, key):
+        del self.entries[key]
+        self.resident_bytes -= self.sizes.pop(key)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __iter__(self) -> Iterator:
+        return iter(list(self.entries))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def trim(self) -> None:
+        """Evicts unpinned entries, oldest first, until resident size fits the budget."""
+        if self.resident_bytes <= self.budget_bytes:
+            return
+        for key in list(self.entries):
+            if self.resident_bytes <= self.budget_bytes:
+                break
+            if key in self.pinned:
+                continue
+            value = self.entries[key]
+            self._discard(key)
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(key, value)
+
+    def pin(self, key) -> None:
+        """Keeps key resident once it is loaded. Keys may be pinned before they are cached."""
+        self.pinned.add(key)
+
+    def unpin(self, key) -> None:
+        self.pinned.discard(key)
+        self.trim()
+
+    def is_pinned(self, key) -> bool:
+        return key in self.pinned
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = budget_bytes
+        self.trim()
+
+    def clear(self) -> None:
+        # Pins describe what the game needs, not what is loaded, so they survive a clear
+        self.entries.clear()
+        self.sizes.clear()
+        self.resident_bytes = 0
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.entries),
+            "pinned": len(self.pinned & self.entries.keys()),
+            "resident_bytes": self.resident_bytes,
+            "budget_bytes": self.budget_bytes,
+        }
@@ -0,0 +1,414 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import struct
+import sys
+from array import array
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional
+from xml.etree import ElementTree
+import pygame
+import pytmx
+
+# Layout: header | meta (JSON, utf-8) | tile data (uint32 little-endian, one block per tile layer)
+# header = magic, format version, meta length in bytes
+HEADER = struct.Struct("<4sHI")
+MAGIC = b"PGMC"
+VERSION = 3
+
+# Tiled keeps tile flips in the top bits of each GID
+FLIPPED_HORIZONTALLY = 0x80000000
+FLIPPED_VERTICALLY = 0x40000000
+FLIPPED_DIAGONALLY = 0x20000000
+GID_MASK = 0x1FFFFFFF
+
+logger = logging.getLogger("MapCompiler")
+
+class MapCompileError(ValueError):
+    pass
+
+class TileLayer:
+    def __init__(self, name, width, height, visible=True, opacity=1.0, properties=None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.visible = visible
+        self.opacity = opacity
+        self.properties = properties or {}
+        self.data = [] # One writable uint32 row view per map row, indexed data[y][x]
+
+    def set_buffer(self, buffer) -> None:
+        """Points the rows at a width*height block of native uint32s (any writable buffer)."""
+        view = memoryview(buffer).cast("B").cast("I")
+        self.data = [view[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+
+    def to_bytes(self) -> bytes:
+        values = array("I")
+        for row in self.data:
+            values.frombytes(row.tobytes())
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tobytes()
+
+class ObjectLayer:
+    def __init__(self, name, objects, visible=True, properties=None):
+        self.name = name
+        self.objects = objects # Plain dicts: id, name, type, x, y, width, height, ...
+        self.visible = visible
+        self.properties = properties or {}
+
+class ImageLayer:
+    def __init__(self, name, source, visible=True, properties=None):
+        self.name = name
+        self.source = source # Relative to the map file
+        self.visible = visible
+        self.properties = properties or {}
+        self.image = None
+
+class CompiledMap:
+    """
+    Tile map ready to render: tile layers are flat uint32 GID buffers, tilesets are
+    references to their images (sliced into tiles by load_images()).
+    """
+
+    def __init__(self, width, height, tilewidth, tileheight, tilesets=None, layers=None,
+                 properties=None, dependencies=None):
+        self.width = width
+        self.height = height
+        self.tilewidth = tilewidth
+        self.tileheight = tileheight
+        self.tilesets: List[Dict[str, Any]] = tilesets or []
+        self.layers: List[Any] = layers or []
+        self.properties = properties or {}
+        self.dependencies: Dict[str, str] = dependencies or {} # External file -> sha256
+        self.images: List[Optional[pygame.Surface]] = []
+        self.flipped_images: Dict[int, Optional[pygame.Surface]] = {}
+
+    def get_layer_by_name(self, name):
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise ValueError(f"Layer '{name}' not found")
+
+    def load_images(self, load_image: Callable[[str], pygame.Surface]) -> None:
+        """Slices every tileset into per-GID tiles. load_image takes a path relative to the map."""
+        images: List[Optional[pygame.Surface]] = []
+        for tileset in self.tilesets:
+            last_gid = tileset["firstgid"] + tileset["tilecount"]
+            images.extend([None] * (last_gid - len(images)))
+
+            if tileset.get("image"):
+                sheet = load_image(tileset["image"])
+                tile_w, tile_h = tileset["tilewidth"], tileset["tileheight"]
+                columns = tileset["columns"] or max(1, sheet.get_width() // tile_w)
+                margin, spacing = tileset["margin"], tileset["spacing"]
+                sheet_rect = sheet.get_rect()
+                for i in range(tileset["tilecount"]):
+                    rect = pygame.Rect(margin + (i % columns) * (tile_w + spacing),
+                                       margin + (i // columns) * (tile_h + spacing), tile_w, tile_h)
+                    if sheet_rect.contains(rect):
+                        images[tileset["firstgid"] + i] = sheet.subsurface(rect)
+
+            # Image collection tilesets (and per-tile overrides) name one image per tile id
+            for tile_id, source in tileset.get("tiles", {}).items():
+                gid = tileset["firstgid"] + int(tile_id)
+                if gid >= len(images):
+                    images.extend([None] * (gid + 1 - len(images)))
+                images[gid] = load_image(source)
+
+        self.images = images
+        self.flipped_images.clear()
+        for layer in self.layers:
+            if isinstance(layer, ImageLayer) and layer.source:
+                layer.image = load_image(layer.source)
+
+    def get_tile_image_by_gid(self, gid: int) -> Optional[pygame.Surface]:
+        tile_gid = gid & GID_MASK
+        image = self.images[tile_gid] if 0 < tile_gid < len(self.images) else None
+        if image is None or gid == tile_gid:
+            return image
+
+        flipped = self.flipped_images.get(gid)
+        if flipped is None:
+            flipped = image
+            if gid & FLIPPED_DIAGONALLY:
+                # Transpose: swap x and y
+                flipped = pygame.transform.flip(pygame.transform.rotate(flipped, 90), False, True)
+            flipped = pygame.transform.flip(flipped, bool(gid & FLIPPED_HORIZONTALLY), bool(gid & FLIPPED_VERTICALLY))
+            self.flipped_images[gid] = flipped
+        return flipped
+
+# TMX parsing, done by pytmx once per map version; only its result is converted and cached
+
+def _inline_tileset(element, base_dir, read_dependency, dependencies):
+    """
+    Replaces an external .tsx reference with the tileset itself, so pytmx never opens
+    files on its own (maps may live in the asset pack). Image paths are rewritten to be
+    relative to the map, as they would be in an embedded tileset.
+    """
+    if read_dependency is None:
+        raise MapCompileError(f"external tileset '{element.get('source')}' but no way to read it")
+    path = posixpath.normpath(posixpath.join(base_dir, element.get("source")))
+    data = read_dependency(path)
+    dependencies[path] = hashlib.sha256(data).hexdigest()
+    tileset = ElementTree.fromstring(data)
+    for image in tileset.iter("image"):
+        source = posixpath.normpath(posixpath.join(posixpath.dirname(path), image.get("source")))
+        image.set("source", posixpath.relpath(source, base_dir) if base_dir else source)
+    tileset.set("firstgid", element.get("firstgid", "1"))
+    return tileset
+
+def _no_images(path, colorkey, **kwargs):
+    """pytmx image loader that loads nothing; CompiledMap.load_images slices the tiles later."""
+    return lambda rect=None, flags=None: None
+
+def _raw_gids(tiled_map) -> List[int]:
+    """pytmx renumbers GIDs (one per tile and flip combination); maps them back to Tiled's."""
+    raw = [0] * tiled_map.maxgid
+    for (tiled_gid, flags), entry in tiled_map.imagemap.items():
+        if not tiled_gid:
+            continue # The empty tile, mapped to a bare 0
+        gid = entry[0]
+        if flags:
+            tiled_gid |= ((FLIPPED_HORIZONTALLY if flags.flipped_horizontally else 0) |
+                          (FLIPPED_VERTICALLY if flags.flipped_vertically else 0) |
+                          (FLIPPED_DIAGONALLY if flags.flipped_diagonally else 0))
+        raw[gid] = tiled_gid
+    return raw
+
+def _convert_tilesets(tiled_map, base_dir, raw) -> List[Dict[str, Any]]:
+    def relative(source):
+        return posixpath.normpath(posixpath.join(base_dir, source)) if source else None
+
+    tilesets = {}
+    for ts in sorted(tiled_map.tilesets, key=lambda ts: ts.firstgid):
+        tilesets[ts.firstgid] = {
+            "firstgid": ts.firstgid,
+            "name": ts.name or "",
+            "tilewidth": ts.tilewidth,
+            "tileheight": ts.tileheight,
+            "tilecount": ts.tilecount,
+            "columns": ts.columns,
+            "margin": ts.margin,
+            "spacing": ts.spacing,
+            "image": relative(ts.source),
+            "tiles": {}, # tile id -> own image, for image collection tilesets
+            "animations": {}, # tile id -> [[frame tile id, duration ms], ...], kept for renderers that animate
+        }
+
+    # Per-tile data is kept by pytmx in one map-wide dict, keyed by its own GIDs
+    for gid, properties in tiled_map.tile_properties.items():
+        tiled_gid = raw[gid] & GID_MASK
+        firstgid = max((firstgid for firstgid in tilesets if firstgid <= tiled_gid), default=None)
+        if firstgid is None:
+            continue
+        tileset, tile_id = tilesets[firstgid], str(tiled_gid - firstgid)
+        if properties.get("source"):
+            tileset["tiles"][tile_id] = relative(properties["source"])
+        if properties.get("frames"):
+            tileset["animations"][tile_id] = [[(raw[frame.gid] & GID_MASK) - firstgid, frame.duration]
+                                              for frame in properties["frames"]]
+
+    for tileset in tilesets.values():
+        if not tileset["tilecount"]:
+            tileset["tilecount"] = max(map(int, tileset["tiles"]), default=-1) + 1
+    return list(tilesets.values())
+
+def _convert_object(obj, raw) -> Dict[str, Any]:
+    converted = {
+        "id": obj.id,
+        "name": obj.name or "",
+        "type": obj.type or getattr(obj, "class", None) or "",
+        "x": obj.x,
+        "y": obj.y,
+        "width": obj.width,
+        "height": obj.height,
+        "rotation": obj.rotation,
+        "visible": bool(obj.visible),
+        "properties": dict(obj.properties),
+    }
+    if obj.gid:
+        converted["gid"] = raw[obj.gid]
+    if hasattr(obj, "points"):
+        # pytmx makes the points absolute; the TMX form (relative to x, y) is kept
+        converted["polygon" if obj.closed else "polyline"] = [(x - obj.x, y - obj.y) for x, y in obj.points]
+    return converted
+
+def _convert_layers(parent, parsed, raw, base_dir, width, height, layers, parent_visible, parent_opacity) -> None:
+    """
+    Appends parent's layers in draw order. pytmx lists layers grouped by kind, so the
+    document order comes from the XML; <group> layers are flattened into their children.
+    """
+    for element in parent:
+        visible = parent_visible and element.get("visible", "1") == "1"
+        opacity = parent_opacity * float(element.get("opacity", 1))
+        layer = parsed.get(element)
+        name = element.get("name", "")
+        if element.tag == "group":
+            _convert_layers(element, parsed, raw, base_dir, width, height, layers, visible, opacity)
+        elif isinstance(layer, pytmx.TiledTileLayer):
+            values = array("I", map(raw.__getitem__, chain.from_iterable(layer.data)))
+            if len(values) != width * height:
+                raise MapCompileError(f"layer '{name}' has {len(values)} tiles, expected {width * height}")
+            compiled = TileLayer(name, width, height, visible, opacity, dict(layer.properties))
+            compiled.set_buffer(values) # The rows are views into it
+            layers.append(compiled)
+        elif isinstance(layer, pytmx.TiledObjectGroup):
+            layers.append(ObjectLayer(name, [_convert_object(obj, raw) for obj in layer], visible, dict(layer.properties)))
+        elif isinstance(layer, pytmx.TiledImageLayer):
+            source = posixpath.normpath(posixpath.join(base_dir, layer.source)) if layer.source else None
+            layers.append(ImageLayer(name, source, visible, dict(layer.properties)))
+
+def compile_tmx(source: bytes, map_path: str = "", read_dependency: Optional[Callable[[str], bytes]] = None) -> CompiledMap:
+    """
+    Parses TMX source (with pytmx) into a CompiledMap. map_path ('/'-separated) is used to
+    resolve external tilesets and images; read_dependency(path) returns an external file's bytes.
+    """
+    base_dir = posixpath.dirname(map_path)
+    dependencies = {}
+    try:
+        root = ElementTree.fromstring(source)
+        for index, element in enumerate(root):
+            if element.tag == "tileset" and element.get("source"):
+                root[index] = _inline_tileset(element, base_dir, read_dependency, dependencies)
+
+        tiled_map = pytmx.TiledMap(image_loader=_no_images, load_all=False, invert_y=False)
+        tiled_map.filename = map_path or "map.tmx"
+        tiled_map.parse_xml(root)
+    except MapCompileError:
+        raise
+    except Exception as e: # pytmx raises bare Exceptions as well as ValueError and friends
+        raise MapCompileError(f"invalid TMX: {e}") from e
+
+    # pytmx parses each kind of layer in findall order, which pairs them with their elements
+    parsed = {}
+    for tag, kind in (("layer", pytmx.TiledTileLayer), ("objectgroup", pytmx.TiledObjectGroup),
+                      ("imagelayer", pytmx.TiledImageLayer)):
+        parsed.update(zip(root.findall(".//" + tag), (layer for layer in tiled_map.layers if isinstance(layer, kind))))
+
+    raw = _raw_gids(tiled_map)
+    layers = []
+    _convert_layers(root, parsed, raw, base_dir, tiled_map.width, tiled_map.height, layers, True, 1.0)
+    return CompiledMap(tiled_map.width, tiled_map.height, tiled_map.tilewidth, tiled_map.tileheight,
+                       _convert_tilesets(tiled_map, base_dir, raw), layers, dict(tiled_map.properties), dependencies)
+
+# Binary form
+
+def write_compiled(compiled: CompiledMap, path: str) -> None:
+    layers = []
+    blocks = []
+    offset = 0
+    for layer in compiled.layers:
+        entry = {"name": layer.name, "visible": layer.visible, "properties": layer.properties}
+        if isinstance(layer, TileLayer):
+            block = layer.to_bytes()
+            entry.update(kind="tiles", opacity=layer.opacity, offset=offset, size=len(block))
+            blocks.append(block)
+            offset += len(block)
+        elif isinstance(layer, ObjectLayer):
+            entry.update(kind="objects", objects=layer.objects)
+        else:
+            entry.update(kind="image", source=layer.source)
+        layers.append(entry)
+
+    meta = json.dumps({
+        "width": compiled.width,
+        "height": compiled.height,
+        "tilewidth": compiled.tilewidth,
+        "tileheight": compiled.tileheight,
+        "properties": compiled.properties,
+        "tilesets": compiled.tilesets,
+        "dependencies": compiled.dependencies,
+        "layers": layers,
+    }, separators=(",", ":")).encode("utf-8")
+    meta += b" " * (-(HEADER.size + len(meta)) % 4) # Keeps the tile data 4-byte aligned
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(meta)))
+        f.write(meta)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp_path, path)
+
+def read_compiled(path: str) -> CompiledMap:
+    """Loads a compiled map with a single read; tile layers are views into that one buffer."""
+    buffer = bytearray(os.path.getsize(path))
+    with open(path, "rb") as f:
+        if f.readinto(buffer) != len(buffer):
+            raise MapCompileError(f"{path}: short read")
+    if len(buffer) < HEADER.size:
+        raise MapCompileError(f"{path}: truncated header")
+    magic, version, meta_size = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise MapCompileError(f"{path}: not a version {VERSION} compiled map")
+
+    view = memoryview(buffer)
+    data_start = HEADER.size + meta_size
+    meta = json.loads(str(view[HEADER.size:data_start], "utf-8"))
+
+    layers = []
+    for entry in meta["layers"]:
+        if entry["kind"] == "tiles":
+            layer = TileLayer(entry["name"], meta["width"], meta["height"], entry["visible"],
+                              entry["opacity"], entry["properties"])
+            block = view[data_start + entry["offset"]:data_start + entry["offset"] + entry["size"]]
+            if len(block) != meta["width"] * meta["height"] * 4:
+                raise MapCompileError(f"{path}: layer '{layer.name}' is truncated")
+            if sys.byteorder == "big":
+                swapped = array("I")
+                swapped.frombytes(block)
+                swapped.byteswap()
+                block = swapped
+            layer.set_buffer(block)
+            layers.append(layer)
+        elif entry["kind"] == "objects":
+            for obj in entry["objects"]:
+                for shape in ("polygon", "polyline"):
+                    if shape in obj:
+                        obj[shape] = [tuple(point) for point in obj[shape]]
+            layers.append(ObjectLayer(entry["name"], entry["objects"], entry["visible"], entry["properties"]))
+        else:
+            layers.append(ImageLayer(entry["name"], entry["source"], entry["visible"], entry["properties"]))
+
+    return CompiledMap(meta["width"], meta["height"], meta["tilewidth"], meta["tileheight"],
+                       meta["tilesets"], layers, meta["properties"], meta["dependencies"])
+
+def cache_path(cache_dir: str, map_path: str, source: bytes) -> str:
+    digest = hashlib.sha256(source).hexdigest()[:16]
+    stem = os.path.splitext(posixpath.basename(map_path))[0]
+    return os.path.join(cache_dir, f"{stem}-{digest}.tmc")
+
+def load_map(source: bytes, map_path: str, cache_dir: Optional[str],
+             read_dependency: Optional[Callable[[str], bytes]] = None) -> CompiledMap:
+    """
+    The compiled form of a TMX file, from cache_dir when a compile of this exact source
+    (and unchanged external tilesets) exists there, otherwise compiled and cached.
+    A cache_dir of None (or one that can't be written) just compiles.
+    """
+    path = cache_path(cache_dir, map_path, source) if cache_dir else None
+    if path and os.path.exists(path):
+        try:
+            compiled = read_compiled(path)
+            if all(read_dependency and hashlib.sha256(read_dependency(dependency)).hexdigest() == digest
+                   for dependency, digest in compiled.dependencies.items()):
+                return compiled
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable map cache {path}: {e}")
+
+    compiled = compile_tmx(source, map_path, read_dependency)
+    if path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Older compiles of this map are keyed by a source hash that no longer exists
+            stem = os.path.splitext(posixpath.basename(map_path))[0]
+            for stale in glob.glob(os.path.join(glob.escape(cache_dir), glob.escape(stem) + "-" + "?" * 16 + ".tmc")):
+                if stale != path:
+                    os.remove(stale)
+            write_compiled(compiled, path)
+        except OSError as e:
+            logger.warning(f"Could not write map cache {path}: {e}")
+    return compiled
@@ -0,0 +1,165 @@
+import sys
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple
+
+class Stat(IntEnum):
+    """Fixed slot of each game stat in a stat vector."""
+    INTELLIGENCE = 0
+    PROGRAMMING = 1
+    ANALYSIS = 2
+    TECHNICAL = 3
+    INTEGRATION = 4
+    LEADERSHIP = 5
+    MANAGEMENT = 6
+    CHARISMA = 7
+    COMMUNICATION = 8
+
+STAT_NAMES = tuple(stat.name.lower() for stat in Stat)
+_STAT_INDEX = {name: index for index, name in enumerate(STAT_NAMES)}
+
+def pack_stats(stats: Dict[str, int]) -> Tuple[array, Optional[Dict[str, int]]]:
+    """Stat dict -> (array('i') indexed by Stat, dict of the stats outside the enum or None)."""
+    vector = array('i', bytes(4 * len(STAT_NAMES)))
+    extra = None
+    for name, value in stats.items():
+        index = _STAT_INDEX.get(name)
+        if index is None:
+            if extra is None:
+                extra = {}
+            extra[sys.intern(name)] = value
+        else:
+            vector[index] = value
+    return vector, extra
+
+def unpack_stats(vector: array, extra: Optional[Dict[str, int]], present: int) -> Dict[str, int]:
+    """Inverse of pack_stats; present is the bitmask of enum stats that were in the dict (absent ones read 0)."""
+    stats = {name: vector[index] for index, name in enumerate(STAT_NAMES) if present & (1 << index)}
+    if extra:
+        stats.update(extra)
+    return stats
+
+def _presence(stats: Dict[str, int]) -> int:
+    mask = 0
+    for name in stats:
+        index = _STAT_INDEX.get(name)
+        if index is not None:
+            mask |= 1 << index
+    return mask
+
+def _interned(strings) -> Tuple[str, ...]:
+    return tuple(sys.intern(s) for s in strings)
+
+@dataclass
+class CompactSkillCategory:
+    """Slotted SkillCategory: interned skill names and an array-backed stat vector."""
+    __slots__ = ("name", "skills", "stats", "stats_present", "extra_stats")
+    name: str
+    skills: Tuple[str, ...]
+    stats: array
+    stats_present: int
+    extra_stats: Optional[Dict[str, int]]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactSkillCategory":
+        stats, extra = pack_stats(data["game_stat_mapping"])
+        return cls(sys.intern(data["name"]), _interned(data["skills"]), stats,
+                   _presence(data["game_stat_mapping"]), extra)
+
+    def stat(self, stat: Stat) -> int:
+        return self.stats[stat]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "skills": list(self.skills),
+            "game_stat_mapping": unpack_stats(self.stats, self.extra_stats, self.stats_present),
+        }
+
+@dataclass
+class CompactExperience:
+    """Slotted ProfessionalExperience."""
+    __slots__ = ("role", "company", "achievements", "level_requirement")
+    role: str
+    company: str
+    achievements: Tuple[str, ...]
+    level_requirement: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactExperience":
+        return cls(sys.intern(data["role"]), sys.intern(data["company"]), tuple(data["achievements"]),
+                   data["level_requirement"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "role": self.role,
+            "company": self.company,
+            "achievements": list(self.achievements),
+            "level_requirement": self.level_requirement,
+        }
+
+@dataclass
+class CompactPortfolio:
+    """
+    Memory-compact form of a transformed portfolio (JSONPipeline output), for holding many
+    of them at once. Strings that repeat across portfolios (skills, companies, sprites,
+    achievement texts) are interned; stats are array('i') vectors indexed by Stat.
+    """
+    __slots__ = ("name", "title", "current_level", "experience_points", "available_skill_points",
+                 "avatar_sprite", "skill_categories", "experience_entries", "game_stats",
+                 "game_stats_present", "extra_game_stats", "achievements")
+    name: str
+    title: str
+    current_level: int
+    experience_points: int
+    available_skill_points: int
+    avatar_sprite: str
+    skill_categories: Tuple[CompactSkillCategory, ...]
+    experience_entries: Tuple[CompactExperience, ...]
+    game_stats: array
+    game_stats_present: int
+    extra_game_stats: Optional[Dict[str, int]]
+    achievements: Tuple[Tuple[str, str, str], ...] # (name, description, icon)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactPortfolio":
+        """From the plain-dict form (serialize_portfolio() output, or a batch JSONL profile)."""
+        profile = data["player_profile"]
+        game_stats, extra = pack_stats(data["game_stats"])
+        return cls(
+            name=profile["name"],
+            title=sys.intern(profile["title"]),
+            current_level=profile["current_level"],
+            experience_points=profile["experience_points"],
+            available_skill_points=profile["available_skill_points"],
+            avatar_sprite=sys.intern(profile["avatar_sprite"]),
+            skill_categories=tuple(CompactSkillCategory.from_dict(c) for c in data["skill_categories"]),
+            experience_entries=tuple(CompactExperience.from_dict(e) for e in data["experience_entries"]),
+            game_stats=game_stats,
+            game_stats_present=_presence(data["game_stats"]),
+            extra_game_stats=extra,
+            achievements=tuple(_interned((a["name"], a["description"], a["icon"])) for a in data["achievement_definitions"]),
+        )
+
+    def stat(self, stat: Stat) -> int:
+        return self.game_stats[stat]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Back to the plain-dict form, equal to what from_dict() was given."""
+        return {
+            "player_profile": {
+                "name": self.name,
+                "title": self.title,
+                "current_level": self.current_level,
+                "experience_points": self.experience_points,
+                "available_skill_points": self.available_skill_points,
+                "avatar_sprite": self.avatar_sprite,
+            },
+            "skill_categories": [category.to_dict() for category in self.skill_categories],
+            "experience_entries": [entry.to_dict() for entry in self.experience_entries],
+            "game_stats": unpack_stats(self.game_stats, self.extra_game_stats, self.game_stats_present),
+            "achievement_definitions": [
+                {"name": name, "description": description, "icon": icon} for name, description, icon in self.achievements
+            ],
+        }
@@ -0,0 +1,185 @@
+import csv
+import json
+import time
+import logging
+from collections import deque
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+import pygame
+from config import PROFILER_HISTORY_FRAMES, PROFILER_FRAME_BUDGET_MS, WHITE, YELLOW
+from game.utils.text_cache import TextCache
+
+# Shared no-op context returned while profiling is off, so spans cost one attribute check
+_NULL_SPAN = nullcontext()
+
+# Overlay colors for the stacked frame graph, by span suffix
+SPAN_COLORS = {
+    "events": (120, 120, 255),
+    "update": (80, 220, 120),
+    "draw": (255, 150, 60),
+}
+OTHER_COLOR = (180, 180, 180)
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+class FrameProfiler:
+    """
+    Per-frame timing of named spans. Off by default; while off, span() returns a
+    shared no-op context. Each finished frame is kept in a rolling window of
+    PROFILER_HISTORY_FRAMES frames, drawn as an overlay and exportable to CSV/JSON.
+
+    Top-level spans are named "<scene>.events", "<scene>.update" and "<scene>.draw";
+    sub-spans such as "tilemap" or "hud" are timed inside them. Times of a span that
+    runs several times in one frame (fixed-step updates) are summed.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(FrameProfiler, cls).__new__(cls)
+            cls._instance.enabled = False
+            cls._instance.frames = deque(maxlen=PROFILER_HISTORY_FRAMES)
+            cls._instance.current = None
+            cls._instance.frame_start = 0.0
+            cls._instance.frame_index = 0
+            cls._instance.logger = logging.getLogger("FrameProfiler")
+        return cls._instance
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        self.current = None
+        self.logger.info(f"Frame profiler {'enabled' if self.enabled else 'disabled'}")
+        return self.enabled
+
+    def span(self, name: str):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def add(self, name: str, elapsed_ms: float) -> None:
+        if self.current is not None:
+            self.current[name] = self.current.get(name, 0.0) + elapsed_ms
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self.current = {}
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        if self.current is None:
+            return
+        self.frames.append({
+            "frame": self.frame_index,
+            "total_ms": (time.perf_counter() - self.frame_start) * 1000.0,
+            "spans": self.current,
+        })
+        self.frame_index += 1
+        self.current = None
+
+    def clear(self) -> None:
+        self.frames.clear()
+        self.current = None
+
+    def last_frame(self) -> Optional[Dict]:
+        return self.frames[-1] if self.frames else None
+
+    def span_names(self) -> List[str]:
+        names = {}
+        for frame in self.frames:
+            names.update(dict.fromkeys(frame["spans"]))
+        return list(names)
+
+    def averages(self) -> Dict[str, float]:
+        """Mean time per span over the window (frames without the span count as 0)."""
+        if not self.frames:
+            return {}
+        totals = {}
+        for frame in self.frames:
+            for name, ms in frame["spans"].items():
+                totals[name] = totals.get(name, 0.0) + ms
+        return {name: total / len(self.frames) for name, total in totals.items()}
+
+    def format_frame(self, frame: Optional[Dict]) -> str:
+        if not frame:
+            return "no profile data"
+        spans = sorted(frame["spans"].items(), key=lambda item: item[1], reverse=True)
+        return f"total={frame['total_ms']:.2f}ms " + " ".join(f"{name}={ms:.2f}ms" for name, ms in spans)
+
+    def export_csv(self, path: str) -> None:
+        names = self.span_names()
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "total_ms"] + names)
+            for frame in self.frames:
+                writer.writerow([frame["frame"], f"{frame['total_ms']:.4f}"] +
+                                [f"{frame['spans'].get(name, 0.0):.4f}" for name in names])
+
+    def export_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump({"budget_ms": PROFILER_FRAME_BUDGET_MS, "frames": list(self.frames)}, f, indent=2)
+
+    def export(self, base_path: Optional[str] = None) -> List[str]:
+        """Writes both formats next to each other and returns their paths."""
+        base_path = base_path or time.strftime("profile_%Y%m%d_%H%M%S")
+        paths = [base_path + ".csv", base_path + ".json"]
+        self.export_csv(paths[0])
+        self.export_json(paths[1])
+        self.logger.info(f"Exported {len(self.frames)} profiled frames to {', '.join(paths)}")
+        return paths
+
+    def draw_overlay(self, screen: pygame.Surface, position=(10, 10), size=(PROFILER_HISTORY_FRAMES, 80)) -> pygame.Rect:
+        """Rolling stacked graph of the top-level spans plus per-span averages."""
+        x, y = position
+        width, height = size
+        text_cache = TextCache()
+        font = text_cache.get_font(18)
+
+        averages = sorted(self.averages().items(), key=lambda item: item[1], reverse=True)
+        lines = [f"frame {self.last_frame()['total_ms']:.2f}ms" if self.frames else "profiling..."]
+        lines += [f"{name} {ms:.2f}ms" for name, ms in averages[:8]]
+        line_height = font.get_linesize()
+        panel = pygame.Rect(x, y, width + 2, height + 4 + line_height * len(lines))
+
+        background = pygame.Surface(panel.size)
+        background.set_alpha(180)
+        background.fill((0, 0, 0))
+        screen.blit(background, panel)
+
+        # One column per frame, newest on the right, scaled so the budget sits at mid-height
+        scale = (height / 2) / PROFILER_FRAME_BUDGET_MS
+        bottom = y + height
+        left = x + width - len(self.frames)
+        for i, frame in enumerate(self.frames):
+            top = bottom
+            for name, ms in frame["spans"].items():
+                if "." not in name:
+                    continue # Sub-spans are already inside their scene span
+                bar_top = max(y, top - max(1, int(ms * scale)))
+                color = SPAN_COLORS.get(name.rsplit(".", 1)[1], OTHER_COLOR)
+                pygame.draw.line(screen, color, (left + i, bar_top), (left + i, top - 1))
+                top = bar_top
+                if top <= y:
+                    break
+
+        budget_y = bottom - int(PROFILER_FRAME_BUDGET_MS * scale)
+        pygame.draw.line(screen, YELLOW, (x, budget_y), (x + width, budget_y))
+
+        text_y = bottom + 4
+        for line in lines:
+            # Numbers change every frame, rendering them through the TextCache would only churn it
+            screen.blit(font.render(line, True, WHITE), (x + 2, text_y))
+            text_y += line_height
+        return panel
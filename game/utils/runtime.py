@@ -0,0 +1,9 @@
+import sys
+
+def is_web() -> bool:
+    """True when running in the browser build (pygbag / WebAssembly)."""
+    return sys.platform == "emscripten"
+
+def threads_available() -> bool:
+    # The WebAssembly build has no usable threads, work there has to stay on the main loop
+    return not is_web()
@@ -0,0 +1,82 @@
+import json
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Set
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over the (lowercased) keys of a stat mapping table.
+
+    matches(text) returns every key that occurs anywhere in text, the same as testing
+    `key in text.lower()` for each key, but in one pass over the text regardless of
+    how many keys there are. Overlapping keys ("java" / "javascript") are all reported.
+    """
+
+    def __init__(self, mappings: Mapping[str, Mapping[str, int]]):
+        self.mappings = {key.lower(): dict(stats) for key, stats in mappings.items() if key}
+        self.keys: List[str] = list(self.mappings)
+
+        # State 0 is the root; goto[state][char] -> state, outputs[state] -> key indices ending here
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[Set[int]] = [set()]
+        for index, key in enumerate(self.keys):
+            state = 0
+            for char in key:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append(set())
+                state = next_state
+            self.outputs[state].add(index)
+
+        # Breadth-first so a state's fail target is always finished before it
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.outputs[next_state] |= self.outputs[self.fail[next_state]]
+
+    @classmethod
+    def from_json(cls, path: str) -> "SkillMatcher":
+        """Mapping table from a JSON object of {"skill substring": {"stat": bonus, ...}, ...}."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def matches(self, text: str) -> List[str]:
+        found: Set[int] = set()
+        state = 0
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return [self.keys[index] for index in sorted(found)]
+
+    def score_categories(self, categories: Mapping[str, Iterable[str]], totals: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+        """
+        One pass over every skill of every category. Returns {category: stat totals} and
+        adds the same bonuses to totals (in place) for the overall figures.
+        """
+        per_category = {}
+        for category, skills in categories.items():
+            category_stats: Dict[str, int] = {}
+            for skill in skills:
+                for key in self.matches(skill):
+                    for stat, bonus in self.mappings[key].items():
+                        category_stats[stat] = category_stats.get(stat, 0) + bonus
+                        totals[stat] = totals.get(stat, 0) + bonus
+            per_category[category] = category_stats
+        return per_category
@@ -0,0 +1,187 @@
+import importlib.abc
+import json
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional
+
+# Only stdlib imports here: this module is loaded before pygame so it can time that import too
+
+_NULL_PHASE = nullcontext()
+
+class _ImportNode:
+    __slots__ = ("name", "start", "total_ms", "children")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+        self.total_ms = 0.0
+        self.children = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        children_ms = sum(child.total_ms for child in self.children)
+        return {
+            "module": self.name,
+            "total_ms": round(self.total_ms, 3),
+            "self_ms": round(max(0.0, self.total_ms - children_ms), 3),
+            "children": [child.to_dict() for child in self.children],
+        }
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps the real loader of a module and times its execution, nested imports included."""
+
+    def __init__(self, loader, profile):
+        self.loader = loader
+        self.profile = profile
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.profile._enter_import(module.__name__)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profile._exit_import()
+
+    def __getattr__(self, name):
+        # get_resource_reader, is_package, ... are answered by the wrapped loader
+        return getattr(self.loader, name)
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self, profile):
+        self.profile = profile
+
+    def find_spec(self, fullname, path=None, target=None):
+        if threading.current_thread() is not threading.main_thread():
+            return None # Worker thread imports would interleave with the main tree
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self.profile)
+                return spec
+        return None
+
+class StartupProfile:
+    """
+    Cold-start profile for `main.py --profile-startup`: an import-time tree (recorded by
+    a meta path hook installed before pygame is imported) and named startup phases
+    (pygame.init, display setup, scene construction, asset loads).
+
+    While not started, phase() returns a shared no-op context.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(StartupProfile, cls).__new__(cls)
+            cls._instance.enabled = False
+            cls._instance.start_time = 0.0
+            cls._instance.end_time = None
+            cls._instance.phases = []
+            cls._instance.imports = _ImportNode("<startup>")
+            cls._instance.import_stack = []
+            cls._instance.timer = None
+        return cls._instance
+
+    def start(self) -> None:
+        self.enabled = True
+        self.start_time = time.perf_counter()
+        self.end_time = None
+        self.phases = []
+        self.imports = _ImportNode("<startup>")
+        self.import_stack = [self.imports]
+        self.timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self.timer)
+
+    def stop(self) -> float:
+        """Ends the profile and returns the total startup time in ms."""
+        if self.timer in sys.meta_path:
+            sys.meta_path.remove(self.timer)
+        self.timer = None
+        self.enabled = False
+        self.end_time = time.perf_counter()
+        return self.total_ms()
+
+    def total_ms(self) -> float:
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return (end - self.start_time) * 1000.0
+
+    def _enter_import(self, name):
+        node = _ImportNode(name)
+        node.start = time.perf_counter()
+        self.import_stack[-1].children.append(node)
+        self.import_stack.append(node)
+
+    def _exit_import(self):
+        node = self.import_stack.pop()
+        node.total_ms = (time.perf_counter() - node.start) * 1000.0
+
+    def phase(self, name: str):
+        if not self.enabled or threading.current_thread() is not threading.main_thread():
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def report(self) -> Dict[str, Any]:
+        imports = self.imports.to_dict()
+        return {
+            "total_ms": round(self.total_ms(), 3),
+            "import_ms": round(sum(child["total_ms"] for child in imports["children"]), 3),
+            "phases": self.phases,
+            "imports": imports["children"],
+        }
+
+    def format_report(self, budget_ms: Optional[float] = None, min_import_ms: float = 2.0) -> str:
+        """Text report: phases, then the import tree without imports under min_import_ms."""
+        report = self.report()
+        lines = [f"Startup: {report['total_ms']:.1f}ms"
+                 + (f" (budget {budget_ms:.0f}ms)" if budget_ms is not None else ""),
+                 f"  imports {report['import_ms']:.1f}ms"]
+        for phase in sorted(report["phases"], key=lambda p: p["start_ms"]):
+            lines.append(f"  {'  ' * phase['depth']}{phase['name']} {phase['ms']:.1f}ms")
+
+        lines.append("Imports (cumulative / self, >= %.1fms):" % min_import_ms)
+
+        def add(nodes: List[Dict[str, Any]], depth: int):
+            for node in sorted(nodes, key=lambda n: n["total_ms"], reverse=True):
+                if node["total_ms"] < min_import_ms:
+                    continue
+                lines.append(f"  {'  ' * depth}{node['module']} {node['total_ms']:.1f}ms / {node['self_ms']:.1f}ms")
+                add(node["children"], depth + 1)
+
+        add(report["imports"], 0)
+        return "\n".join(lines)
+
+    def export_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+class _Phase:
+    __slots__ = ("profile", "name", "start", "depth")
+
+    # Nesting depth of phases currently open (phases only run on the main thread)
+    open_phases = 0
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.depth = _Phase.open_phases
+        _Phase.open_phases += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _Phase.open_phases -= 1
+        self.profile.phases.append({
+            "name": self.name,
+            "depth": self.depth,
+            "start_ms": round((self.start - self.profile.start_time) * 1000.0, 3),
+            "ms": round((time.perf_counter() - self.start) * 1000.0, 3),
+        })
+        return False
@@ -0,0 +1,78 @@
+import pygame
+from typing import Any, Dict, Optional
+from config import TEXT_CACHE_BUDGET_BYTES
+from game.utils.lru_cache import SizedLRUCache
+
+def _surface_bytes(key, surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+class TextCache:
+    """
+    Shared cache of rendered text surfaces, keyed by (font, text, antialias, color, bg).
+    Least recently used surfaces are evicted once the resident pixel bytes exceed the
+    budget. Returned surfaces are shared, so callers must not draw on them.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TextCache, cls).__new__(cls)
+            cls._instance.surfaces = SizedLRUCache(TEXT_CACHE_BUDGET_BYTES, _surface_bytes, "text")
+            cls._instance.fonts = {}
+            cls._instance._quit_hook_registered = False
+        return cls._instance
+
+    @property
+    def budget_bytes(self) -> int:
+        return self.surfaces.budget_bytes
+
+    @budget_bytes.setter
+    def budget_bytes(self, value: int) -> None:
+        self.surfaces.set_budget(value)
+
+    def _ensure_quit_hook(self) -> None:
+        # Fonts must not be used after pygame.quit(); pygame drops quit hooks once
+        # they have run, so the hook is re-registered after every re-init.
+        if not self._quit_hook_registered:
+            pygame.register_quit(self._on_pygame_quit)
+            self._quit_hook_registered = True
+
+    def _on_pygame_quit(self) -> None:
+        self.clear()
+        self._quit_hook_registered = False
+
+    def get_font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Returns a shared font instead of constructing a new one every frame."""
+        self._ensure_quit_hook()
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color: Any,
+               background: Any = None) -> pygame.Surface:
+        """Drop-in replacement for font.render() that reuses previously rendered text."""
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            return surface
+
+        self._ensure_quit_hook()
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface # Not kept if larger than the whole budget
+        return surface
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+        self.fonts.clear()
+
+    def reset_stats(self) -> None:
+        self.surfaces.reset_stats()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.surfaces.stats()
@@ -0,0 +1,32 @@
+from bisect import bisect_right
+from typing import List, Tuple
+from config import MAX_LEVEL, XP_FIRST_LEVEL, XP_GROWTH
+
+def build_xp_table(first_level: int = XP_FIRST_LEVEL, growth: float = XP_GROWTH, max_level: int = MAX_LEVEL) -> List[int]:
+    """table[i] is the total XP needed to reach level i + 1 (table[0] == 0 for level 1)."""
+    table = [0]
+    cost = first_level
+    while len(table) < max_level:
+        table.append(table[-1] + cost)
+        cost = int(cost * growth)
+    return table
+
+# Shared by JSONPipeline, the Player and the HUD so levels agree everywhere
+XP_TABLE = build_xp_table()
+
+def level_for_xp(experience: int) -> int:
+    """Level reached with this much total XP, capped at MAX_LEVEL."""
+    return max(1, bisect_right(XP_TABLE, experience))
+
+def xp_for_level(level: int) -> int:
+    """Total XP needed to reach level (clamped to 1..MAX_LEVEL)."""
+    return XP_TABLE[min(max(level, 1), len(XP_TABLE)) - 1]
+
+def level_progress(experience: int) -> Tuple[int, int, int]:
+    """(level, XP into that level, XP that level costs in total); the last two are equal at the cap."""
+    level = level_for_xp(experience)
+    floor = XP_TABLE[level - 1]
+    if level == len(XP_TABLE):
+        span = floor - XP_TABLE[level - 2] if level > 1 else 1
+        return level, span, span
+    return level, experience - floor, XP_TABLE[level] - floor
@@ -1,70 +1,157 @@
-import pygame
 import sys
+
+# --profile-startup times every import below (pygame's included), so its hook goes in first
+if __name__ == "__main__" and "--profile-startup" in sys.argv:
+    from game.utils.startup_profile import StartupProfile
+    StartupProfile().start()
+
+import argparse
+import pygame
+import time
 import asyncio
 import logging
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, CAPTION, FPS
-from game.managers.scene_manager import SceneManager
-from game.scenes.menu_scene import MenuScene
-from game.scenes.game_scene import GameScene
-from game.scenes.resume_scene import ResumeScene
-from game.scenes.about_scene import AboutScene
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, CAPTION, FPS, DIRTY_RECT_RENDERING, SIMULATION_TICK_RATE, MAX_SIMULATION_STEPS_PER_FRAME, KEYS, STARTUP_BUDGET_MS
+from game.managers.scene_manager import SceneManager, deferred_scene
+from game.managers.input_manager import InputManager
 from game.utils.event_bus import EventBus
 from game.utils.logger import setup_logging
+from game.utils.fixed_timestep import FixedTimestep
+from game.utils.profiler import FrameProfiler
+from game.utils.startup_profile import StartupProfile
 
 class Game:
-    def __init__(self):
+    def __init__(self, startup_profile_output=None):
         setup_logging()
         self.logger = logging.getLogger("Game")
         self.logger.info("Initializing Game...")
 
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(CAPTION)
+        # Active with --profile-startup: reported and stopped once the first frame is shown
+        self.startup_profile = StartupProfile()
+        self.startup_profile_output = startup_profile_output
+        self.exit_code = 0
+
+        with self.startup_profile.phase("pygame.init"):
+            pygame.init()
+        with self.startup_profile.phase("display.set_mode"):
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption(CAPTION)
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # Fixed-step simulation, draw code reads interpolation_alpha to smooth motion
+        self.timestep = FixedTimestep(SIMULATION_TICK_RATE, MAX_SIMULATION_STEPS_PER_FRAME)
+        self.interpolation_alpha = 1.0
+
+        # Per-frame span timings, toggled with KEYS["PROFILER"]
+        self.profiler = FrameProfiler()
+
         self.event_bus = EventBus() # REQ-TECH-02
 
+        # Scenes (and their modules) are loaded on first use or warmed up while the menu
+        # idles, so only the menu is constructed before the first frame
         self.scene_manager = SceneManager(self.event_bus)
-        self.scene_manager.add_scene("menu_scene", MenuScene(self))
-        self.scene_manager.add_scene("game_scene", GameScene(self))
-        self.scene_manager.add_scene("resume_scene", ResumeScene(self))
-        self.scene_manager.add_scene("about_scene", AboutScene(self))
+        self.scene_manager.add_scene_factory("menu_scene", deferred_scene("game.scenes.menu_scene", "MenuScene", self))
+        self.scene_manager.add_scene_factory("game_scene", deferred_scene("game.scenes.game_scene", "GameScene", self),
+                                             assets=[("image", "player.png")])
+        self.scene_manager.add_scene_factory("resume_scene", deferred_scene("game.scenes.resume_scene", "ResumeScene", self))
+        self.scene_manager.add_scene_factory("about_scene", deferred_scene("game.scenes.about_scene", "AboutScene", self))
         self.scene_manager.set_scene("menu_scene")
 
     def handle_events(self):
         events = pygame.event.get()
+        InputManager().update() # Held-key state for the player
         self.scene_manager.handle_events(events)
         for event in events:
             if event.type == pygame.QUIT:
                 self.logger.info("Quit event received.")
                 self.running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == KEYS["PROFILER"]:
+                    self.profiler.toggle()
+                    scene = self.scene_manager.active_scene
+                    if scene and hasattr(scene, 'mark_dirty'):
+                        scene.mark_dirty() # Repaint over (or without) the overlay
+                elif event.key == KEYS["PROFILER_EXPORT"] and self.profiler.frames:
+                    self.profiler.export()
 
     def update(self):
-        dt = self.clock.get_time() / 1000.0  # Delta time in seconds
-        # REQ-TECH-03: Clamp dt to max 0.1s to prevent physics explosions
-        if dt > 0.1:
-            self.logger.warning(f"Lag spike detected. dt={dt} clamped to 0.1")
-            dt = 0.1
-        self.scene_manager.update(dt)
+        frame_time = self.clock.get_time() / 1000.0  # Real time since last frame in seconds
+        # REQ-TECH-03: Scenes only ever see the fixed step, so physics can't explode on long frames
+        steps = self.timestep.advance(frame_time)
+        if self.timestep.dropped_time:
+            self.logger.warning(f"Lag spike detected. frame_time={frame_time:.3f}s, "
+                                f"dropped {self.timestep.dropped_time:.3f}s after {steps} catch-up steps")
+            if self.profiler.enabled:
+                # The slow frame is the one that just finished
+                self.logger.warning(f"Slow frame breakdown: {self.profiler.format_frame(self.profiler.last_frame())}")
+        for _ in range(steps):
+            self.scene_manager.update(self.timestep.step)
+        self.interpolation_alpha = self.timestep.alpha
 
     def draw(self):
-        self.scene_manager.draw(self.screen)
-        pygame.display.flip()
+        if self.profiler.enabled:
+            # The overlay sits on top of every scene, so dirty-rect presentation is bypassed
+            self.scene_manager.draw(self.screen)
+            self.profiler.draw_overlay(self.screen)
+            pygame.display.flip()
+            return
+
+        if not DIRTY_RECT_RENDERING:
+            self.scene_manager.draw(self.screen)
+            pygame.display.flip()
+            return
+
+        rects = self.scene_manager.draw_dirty(self.screen)
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def finish_startup_profile(self):
+        """Reports the startup profile after the first frame and ends the run."""
+        total_ms = self.startup_profile.stop()
+        print(self.startup_profile.format_report(STARTUP_BUDGET_MS))
+        if self.startup_profile_output:
+            self.startup_profile.export_json(self.startup_profile_output)
+        if total_ms > STARTUP_BUDGET_MS:
+            print(f"Startup took {total_ms:.1f}ms, over the {STARTUP_BUDGET_MS}ms budget")
+            self.exit_code = 1
+        self.running = False
 
     async def run(self):
         self.logger.info("Starting Game Loop...")
+        frame_budget_ms = 1000.0 / FPS
         while self.running:
+            frame_start = time.perf_counter()
+            self.profiler.begin_frame()
             self.handle_events()
             self.update()
             self.draw()
+            if self.startup_profile.enabled:
+                self.finish_startup_profile()
+            # Whatever is left of the frame budget goes to building upcoming scenes
+            self.scene_manager.warm_up(frame_budget_ms - (time.perf_counter() - frame_start) * 1000.0)
+            self.profiler.end_frame()
             self.clock.tick(FPS)
             await asyncio.sleep(0) # Required for pygbag / web assembly
 
         self.logger.info("Game Loop ended. Quitting.")
+        self.scene_manager.save_build_times()
         pygame.quit()
-        sys.exit()
+        sys.exit(self.exit_code)
 
-if __name__ == "__main__":
-    game = Game()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=CAPTION)
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print import-time and startup phase timings after the first frame, then quit "
+                             "(exit status 1 when over STARTUP_BUDGET_MS)")
+    parser.add_argument("--profile-output", help="also write the startup profile as JSON to this path")
+    args = parser.parse_args(argv)
+
+    if args.profile_startup and not StartupProfile().enabled:
+        StartupProfile().start() # Imports are already done when called from elsewhere
+    game = Game(startup_profile_output=args.profile_output)
     asyncio.run(game.run())
+
+if __name__ == "__main__":
+    main()
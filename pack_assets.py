@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Packs the assets directory into a single indexed archive (assets.pak).
+
+AssetManager reads from the pack when it exists next to the assets directory and
+falls back to the loose files otherwise, so during development it can simply be
+deleted (or never built).
+"""
+
+import argparse
+import os
+import sys
+
+from game.utils.asset_pack import AssetPack, write_pack
+
+def pack_assets(source_dir="assets", output_path="assets.pak", verify=True):
+    """Writes the pack and returns its index; exits non-zero if verification fails."""
+    result = write_pack(source_dir, output_path)
+    print(f"Packed {len(result['files'])} files from {source_dir} into {output_path}: "
+          f"{result['total_size']} -> {result['packed_size']} bytes")
+
+    if verify:
+        pack = AssetPack(output_path)
+        corrupt = pack.verify()
+        pack.close()
+        if corrupt:
+            print(f"Hash mismatch in: {', '.join(corrupt)}", file=sys.stderr)
+            sys.exit(1)
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the single-file asset pack")
+    parser.add_argument("--source", default="assets", help="assets directory (default: %(default)s)")
+    parser.add_argument("--output", default=None, help="pack file (default: <source>.pak)")
+    parser.add_argument("--no-verify", action="store_true", help="skip re-reading the pack to check hashes")
+    args = parser.parse_args(argv)
+
+    output = args.output or os.path.normpath(args.source) + ".pak"
+    pack_assets(args.source, output, verify=not args.no_verify)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import gc
+import unittest
+import weakref
+from unittest.mock import patch
+import pygame
+from game.components.animation_component import AnimationComponent, get_frame, _frame_cache
+
+class TestAnimationComponent(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        # 4x4 grid of 16x16 frames
+        self.sheet = pygame.Surface((64, 64))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_frames_are_prescaled(self):
+        animation = AnimationComponent(self.sheet, 16, 16, target_size=(32, 32))
+        animation.add_animation("down", 0, 4)
+        animation.set_animation("down")
+        self.assertEqual(animation.get_current_frame().get_size(), (32, 32))
+
+    def test_frames_shared_between_components(self):
+        first = AnimationComponent(self.sheet, 16, 16, target_size=(32, 32))
+        second = AnimationComponent(self.sheet, 16, 16, target_size=(32, 32))
+        first.add_animation("down", 0, 4)
+        second.add_animation("down", 0, 4)
+        for a, b in zip(first.animations["down"], second.animations["down"]):
+            self.assertIs(a, b)
+
+        # A different target size gets its own frames
+        other = AnimationComponent(self.sheet, 16, 16, target_size=(48, 48))
+        other.add_animation("down", 0, 4)
+        self.assertIsNot(other.animations["down"][0], first.animations["down"][0])
+
+    def test_no_scaling_after_add(self):
+        animation = AnimationComponent(self.sheet, 16, 16, target_size=(32, 32))
+        animation.add_animation("down", 0, 4)
+        animation.set_animation("down")
+        with patch("pygame.transform.scale") as scale:
+            for _ in range(10):
+                animation.update(0.1)
+                animation.get_current_frame()
+            scale.assert_not_called()
+
+    def test_get_frame_without_target_size(self):
+        frame = get_frame(self.sheet, (16, 0, 16, 16))
+        self.assertEqual(frame.get_size(), (16, 16))
+        self.assertIs(get_frame(self.sheet, (16, 0, 16, 16)), frame)
+
+    def test_frames_are_freed_with_the_sheet(self):
+        sheet = pygame.Surface((64, 64))
+        get_frame(sheet, (16, 0, 16, 16)) # Unscaled
+        get_frame(sheet, (0, 0, 16, 16), (32, 32)) # Scaled
+        sheet_ref = weakref.ref(sheet)
+        entries = len(_frame_cache)
+        del sheet
+        gc.collect()
+        self.assertIsNone(sheet_ref())
+        self.assertEqual(len(_frame_cache), entries - 1)
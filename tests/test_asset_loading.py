@@ -0,0 +1,209 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+import pygame
+from game.managers.asset_manager import AssetManager
+
+class TestAssetLoading(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.asset_manager = AssetManager()
+        self.asset_manager.clear_cache()
+        self.original_base_path = self.asset_manager.base_path
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.asset_manager.base_path = self.tmp.name
+        for folder in ("sprites", "data", "fonts"):
+            os.makedirs(os.path.join(self.tmp.name, folder))
+        image = pygame.Surface((8, 8), pygame.SRCALPHA)
+        image.fill((255, 0, 0, 128))
+        pygame.image.save(image, os.path.join(self.tmp.name, "sprites", "red.png"))
+        with open(os.path.join(self.tmp.name, "data", "level.json"), "w") as f:
+            json.dump({"name": "zone"}, f)
+
+    def tearDown(self):
+        self.asset_manager.shutdown()
+        self.asset_manager.pending.clear()
+        self.asset_manager.base_path = self.original_base_path
+        self.asset_manager.clear_cache()
+        self.tmp.cleanup()
+        pygame.quit()
+
+    def test_batch_loads_in_background_and_caches(self):
+        batch = self.asset_manager.load_batch([("image", "red.png"), ("json", "level.json"), ("font", "missing.ttf", 12)])
+        self.assertEqual(batch.total, 3)
+        self.assertLess(batch.progress, 1.0) # Nothing is finished before the main thread polls
+
+        self.asset_manager.wait(batch)
+        self.assertTrue(batch.done)
+        self.assertEqual(batch.progress, 1.0)
+
+        image = batch.result(("image", "red.png"))
+        self.assertEqual(image.get_size(), (8, 8))
+        self.assertIs(self.asset_manager.load_image("red.png"), image) # Sync API hits the cache
+        self.assertEqual(self.asset_manager.get_json("level.json"), {"name": "zone"})
+        self.assertIsNotNone(self.asset_manager.get_font("missing.ttf", 12))
+
+    def test_fonts_are_opened_on_the_main_thread(self):
+        opened_on = []
+        real_font = pygame.font.Font
+        def font(*args):
+            opened_on.append(threading.current_thread())
+            return real_font(*args)
+
+        with patch("pygame.font.Font", side_effect=font):
+            batch = self.asset_manager.load_batch([("font", "missing.ttf", 12), ("image", "red.png")])
+            self.asset_manager.wait(batch)
+        self.assertEqual(batch.failed, [])
+        self.assertEqual(opened_on, [threading.main_thread()])
+
+    def test_cached_assets_resolve_immediately(self):
+        self.asset_manager.load_json("level.json")
+        batch = self.asset_manager.load_batch([("json", "level.json")])
+        self.assertTrue(batch.done)
+        self.assertEqual(self.asset_manager.pending, type(self.asset_manager.pending)())
+
+    def test_failures_are_reported_on_the_future(self):
+        batch = self.asset_manager.load_batch([("image", "nope.png"), ("json", "level.json")])
+        self.asset_manager.wait(batch)
+        self.assertEqual(batch.failed, [("image", "nope.png")])
+        self.assertIsNotNone(batch.futures[("image", "nope.png")].exception())
+        self.assertEqual(batch.progress, 1.0)
+
+    def test_without_threads_loads_a_few_per_poll(self):
+        with patch("game.managers.asset_manager.threads_available", return_value=False):
+            batch = self.asset_manager.load_batch([("json", "level.json"), ("image", "red.png"), ("font", "x.ttf", 10)])
+        self.assertIsNone(self.asset_manager.executor)
+
+        self.assertEqual(self.asset_manager.poll(max_loads=2), 2)
+        self.assertAlmostEqual(batch.progress, 2 / 3)
+        self.asset_manager.poll(max_loads=2)
+        self.assertTrue(batch.done)
+
+class TestZoneManifest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.asset_manager = AssetManager()
+        self.asset_manager.clear_cache()
+        self.original_base_path = self.asset_manager.base_path
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.asset_manager.base_path = self.tmp.name
+        os.makedirs(os.path.join(self.tmp.name, "sprites"))
+        os.makedirs(os.path.join(self.tmp.name, "data"))
+
+        manifest = {"common": {"sprites": ["player.png"]}, "zones": {}}
+        for zone_id in range(1, 5):
+            manifest["zones"][str(zone_id)] = {
+                "sprites": [f"zone{zone_id}_a.png", f"zone{zone_id}_b.png", "shared.png"],
+                "adjacent": [z for z in (zone_id + 1, zone_id - 1) if 1 <= z <= 4],
+            }
+        for name in ["player.png", "shared.png"] + [f"zone{z}_{x}.png" for z in range(1, 5) for x in "ab"]:
+            pygame.image.save(pygame.Surface((4, 4)), os.path.join(self.tmp.name, "sprites", name))
+        with open(os.path.join(self.tmp.name, "data", "zone_manifest.json"), "w") as f:
+            json.dump(manifest, f)
+
+    def tearDown(self):
+        self.asset_manager.shutdown()
+        self.asset_manager.pending.clear()
+        self.asset_manager.zone_refcounts.clear()
+        self.asset_manager.retained_zones = set()
+        for cache in (self.asset_manager.images, self.asset_manager.fonts, self.asset_manager.sounds):
+            cache.pinned.clear()
+        self.asset_manager.base_path = self.original_base_path
+        self.asset_manager.clear_cache()
+        self.tmp.cleanup()
+        pygame.quit()
+
+    def enter_zone(self, zone_id):
+        batch = self.asset_manager.preload_zone_assets(zone_id)
+        self.asset_manager.wait(batch)
+        self.asset_manager.wait(self.asset_manager.prefetch)
+        return {os.path.basename(path) for path in self.asset_manager.images}
+
+    def test_enter_loads_zone_and_prefetches_neighbours(self):
+        loaded = self.enter_zone(1)
+        self.assertEqual(loaded, {"player.png", "shared.png", "zone1_a.png", "zone1_b.png", "zone2_a.png", "zone2_b.png"})
+
+    def test_leaving_evicts_unreferenced_assets(self):
+        self.enter_zone(1)
+        loaded = self.enter_zone(3)
+        self.assertNotIn("zone1_a.png", loaded)
+        self.assertIn("shared.png", loaded) # Still referenced by zones 2-4
+        self.assertEqual(self.asset_manager.zone_refcounts[("image", "shared.png")], 3)
+
+    def test_memory_is_flat_across_zone_tours(self):
+        sizes = {}
+        for _ in range(3):
+            for zone_id in (1, 2, 3, 4, 3, 2, 1):
+                loaded = self.enter_zone(zone_id)
+                sizes.setdefault(zone_id, set()).add(len(loaded))
+                self.assertLessEqual(len(self.asset_manager.zone_refcounts), 7)
+        for zone_id, seen in sizes.items():
+            self.assertEqual(len(seen), 1, f"zone {zone_id} cache size changed between visits: {seen}")
+
+    def test_late_prefetch_is_not_cached(self):
+        self.asset_manager.preload_zone_assets(1) # Prefetch of zone 2 in flight
+        self.asset_manager.retain_zones([4])
+        self.asset_manager.wait(self.asset_manager.prefetch)
+        self.assertNotIn(os.path.join(self.tmp.name, "sprites", "zone2_a.png"), self.asset_manager.images)
+
+class TestAssetCacheBudgets(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.asset_manager = AssetManager()
+        self.asset_manager.clear_cache()
+        self.original_base_path = self.asset_manager.base_path
+        self.original_budget = self.asset_manager.images.budget_bytes
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.asset_manager.base_path = self.tmp.name
+        os.makedirs(os.path.join(self.tmp.name, "sprites"))
+        for name in ("a.png", "b.png", "c.png"):
+            pygame.image.save(pygame.Surface((16, 16)), os.path.join(self.tmp.name, "sprites", name))
+        self.image_bytes = 16 * 16 * 4
+        self.asset_manager.images.reset_stats()
+
+    def tearDown(self):
+        self.asset_manager.images.pinned.clear()
+        self.asset_manager.images.set_budget(self.original_budget)
+        self.asset_manager.base_path = self.original_base_path
+        self.asset_manager.clear_cache()
+        self.tmp.cleanup()
+        pygame.quit()
+
+    def test_images_evicted_past_budget(self):
+        self.asset_manager.images.set_budget(self.image_bytes * 2)
+        self.asset_manager.load_image("a.png")
+        self.asset_manager.load_image("b.png")
+        self.asset_manager.load_image("a.png") # a is now the most recent
+        self.asset_manager.load_image("c.png")
+
+        self.assertIsNotNone(self.asset_manager.get_image("a.png"))
+        self.assertIsNone(self.asset_manager.get_image("b.png"))
+        stats = self.asset_manager.cache_stats()["images"]
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["resident_bytes"], self.image_bytes * 2)
+        self.assertEqual(stats["hits"], 2) # Reloading a.png and get_image("a.png")
+
+    def test_pinned_assets_survive(self):
+        self.asset_manager.images.set_budget(self.image_bytes * 2)
+        self.asset_manager.pin("image", "a.png")
+        for name in ("a.png", "b.png", "c.png", "b.png"):
+            self.asset_manager.load_image(name)
+        self.assertIsNotNone(self.asset_manager.get_image("a.png"))
+        self.assertEqual(self.asset_manager.cache_stats()["images"]["pinned"], 1)
+
+    def test_asset_larger_than_budget_is_returned_but_not_cached(self):
+        self.asset_manager.images.set_budget(self.image_bytes // 2)
+        self.assertIsNotNone(self.asset_manager.load_image("a.png"))
+        self.assertEqual(len(self.asset_manager.images), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import pygame
+from game.managers.asset_manager import AssetManager
+from game.utils.asset_pack import AssetPack, AssetPackError, write_pack
+
+class TestAssetPack(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.tmp.name, "assets")
+        for folder in ("sprites", "data", "sounds"):
+            os.makedirs(os.path.join(self.assets, folder))
+        image = pygame.Surface((6, 4))
+        image.fill((0, 255, 0))
+        pygame.image.save(image, os.path.join(self.assets, "sprites", "green.png"))
+        with open(os.path.join(self.assets, "data", "levels.json"), "w") as f:
+            json.dump({"levels": list(range(200))}, f)
+        open(os.path.join(self.assets, "sounds", ".placeholder"), "w").close()
+        self.pack_path = self.assets + ".pak"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        pygame.quit()
+
+    def test_round_trip(self):
+        result = write_pack(self.assets, self.pack_path)
+        self.assertEqual(set(result["files"]), {"sprites/green.png", "data/levels.json"})
+        self.assertEqual(result["files"]["data/levels.json"]["compression"], "zlib")
+        self.assertNotIn("compression", result["files"]["sprites/green.png"])
+
+        pack = AssetPack(self.pack_path)
+        with open(os.path.join(self.assets, "sprites", "green.png"), "rb") as f:
+            self.assertEqual(bytes(pack.get_buffer("sprites/green.png")), f.read())
+        self.assertIsInstance(pack.get_buffer("sprites/green.png"), memoryview)
+        self.assertEqual(json.loads(bytes(pack.get_buffer("data/levels.json")))["levels"][-1], 199)
+        self.assertEqual(pack.verify(), [])
+        self.assertEqual(pygame.image.load(pack.open("sprites/green.png"), "green.png").get_size(), (6, 4))
+        pack.close()
+
+    def test_reader_seek_and_read(self):
+        write_pack(self.assets, self.pack_path)
+        pack = AssetPack(self.pack_path)
+        reader = pack.open("sprites/green.png")
+        header = reader.read(8)
+        self.assertEqual(header, b"\x89PNG\r\n\x1a\n")
+        reader.seek(-4, io.SEEK_END)
+        self.assertEqual(len(reader.read()), 4)
+        self.assertEqual(reader.read(), b"")
+        reader.close()
+        pack.close()
+
+    def test_rejects_other_files(self):
+        with open(self.pack_path, "wb") as f:
+            f.write(b"not a pack at all, just some bytes")
+        with self.assertRaises(AssetPackError):
+            AssetPack(self.pack_path)
+
+    def test_asset_manager_prefers_pack_and_falls_back_to_loose_files(self):
+        write_pack(self.assets, self.pack_path)
+        pygame.image.save(pygame.Surface((2, 2)), os.path.join(self.assets, "sprites", "new.png")) # Not packed yet
+        os.remove(os.path.join(self.assets, "data", "levels.json")) # Only in the pack now
+
+        asset_manager = AssetManager()
+        original_base_path = asset_manager.base_path
+        asset_manager.base_path = self.assets
+        asset_manager.clear_cache()
+        try:
+            self.assertIsNotNone(asset_manager.get_pack())
+            self.assertEqual(asset_manager.load_json("levels.json")["levels"][0], 0)
+            self.assertEqual(asset_manager.load_image("green.png").get_size(), (6, 4))
+            self.assertEqual(asset_manager.load_image("new.png").get_size(), (2, 2))
+        finally:
+            asset_manager.base_path = original_base_path
+            asset_manager.clear_cache()
+            asset_manager.get_pack() # Re-resolve, releases the temporary pack
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import batch_pipeline
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+class TestBatchPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(ROOT, "Rawdata", "Resume.JSON"), encoding="utf-8") as f:
+            self.resume = json.load(f)
+        self.output = os.path.join(self.tmp.name, "profiles.jsonl")
+        self.errors = os.path.join(self.tmp.name, "errors.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_lines(self, path):
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def write_jsonl(self, count):
+        path = os.path.join(self.tmp.name, "portfolios.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(count):
+                doc = json.loads(json.dumps(self.resume))
+                doc["contact_info"]["name"] = f"Candidate {i}"
+                if i == 3:
+                    del doc["contact_info"] # Fails validation
+                f.write(json.dumps(doc) + "\n")
+            f.write("{not json\n")
+        return path
+
+    def test_jsonl_in_process(self):
+        summary = batch_pipeline.run_batch(self.write_jsonl(6), self.output, self.errors, workers=1, chunk_size=4)
+        self.assertEqual((summary["documents"], summary["profiles"], summary["errors"]), (7, 5, 2))
+
+        profiles = self.read_lines(self.output)
+        self.assertEqual([p["profile"]["player_profile"]["name"] for p in profiles],
+                         ["Candidate 0", "Candidate 1", "Candidate 2", "Candidate 4", "Candidate 5"])
+        self.assertIsInstance(profiles[0]["profile"]["skill_categories"][0]["game_stat_mapping"], dict)
+        self.assertIn("role", profiles[0]["profile"]["experience_entries"][0])
+
+        errors = self.read_lines(self.errors)
+        self.assertEqual([e["source"] for e in errors], ["portfolios.jsonl:4", "portfolios.jsonl:7"])
+        self.assertIn("contact_info", errors[0]["errors"][0])
+
+    def test_directory_on_process_pool_matches_in_process(self):
+        for i in range(5):
+            shutil.copy(os.path.join(ROOT, "Rawdata", "Resume.JSON"), os.path.join(self.tmp.name, f"r{i}.json"))
+        summary = batch_pipeline.run_batch(self.tmp.name, self.output, self.errors, workers=2, chunk_size=2)
+        self.assertEqual(summary["profiles"], 5)
+        self.assertGreater(summary["docs_per_second"], 0)
+        pooled = self.read_lines(self.output)
+
+        batch_pipeline.run_batch(self.tmp.name, self.output, self.errors, workers=1)
+        self.assertEqual(self.read_lines(self.output), pooled)
+        self.assertEqual([p["source"] for p in pooled], [f"r{i}.json" for i in range(5)])
+
+    def test_directory_lists_each_file_once_whatever_the_case(self):
+        for name in ("a.json", "B.JSON", "notes.txt"):
+            with open(os.path.join(self.tmp.name, name), "w") as f:
+                f.write("{}")
+        self.assertEqual([source for source, _ in batch_pipeline.read_documents(self.tmp.name)], ["B.JSON", "a.json"])
+
+    def test_ordered_results_reads_input_as_results_are_consumed(self):
+        pulled = []
+
+        def items():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        with ThreadPoolExecutor(2) as executor:
+            results = batch_pipeline.ordered_results(executor, lambda x: x * 2, items(), window=4)
+            self.assertEqual(next(results), 0)
+            self.assertEqual(len(pulled), 4) # Not the whole input
+            self.assertEqual(list(results), [x * 2 for x in range(1, 100)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import benchmark
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_reports_every_metric(self):
+        report = benchmark.run(["menu", "zone1"], frames=5)
+        self.assertEqual(set(report["scenes"]), {"menu", "zone1"})
+        for scene in report["scenes"].values():
+            self.assertEqual(scene["frames"], 5)
+            for metric in ("update_ms", "draw_ms", "allocated_blocks_per_frame"):
+                self.assertEqual(set(scene[metric]), {"p50", "p95", "p99", "max", "mean"})
+            self.assertGreaterEqual(scene["draw_ms"]["max"], scene["draw_ms"]["p50"])
+            self.assertIn("peak_memory_bytes", scene)
+
+    def test_unknown_scene(self):
+        with self.assertRaises(ValueError):
+            benchmark.run(["nope"], frames=1)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(benchmark.percentile(values, 0.5), 50)
+        self.assertEqual(benchmark.percentile(values, 0.99), 99)
+        self.assertEqual(benchmark.percentile([], 0.5), 0.0)
+
+    def test_compare_flags_regressions_past_threshold(self):
+        def report(draw_p95):
+            stats = {"p50": 1.0, "p95": 1.0, "p99": 1.0, "max": 1.0, "mean": 1.0}
+            return {"scenes": {"menu": {"update_ms": dict(stats), "draw_ms": dict(stats, p95=draw_p95)}}}
+
+        baseline = report(2.0)
+        self.assertEqual(benchmark.compare(baseline, report(2.2), threshold=0.15), [])
+        regressions = benchmark.compare(baseline, report(3.0), threshold=0.15)
+        self.assertEqual([(r["scene"], r["metric"]) for r in regressions], [("menu", "draw_ms.p95")])
+        self.assertAlmostEqual(regressions[0]["change"], 0.5)
+
+    def test_compare_ignores_noise_and_missing_scenes(self):
+        stats = {"p50": 0.01, "p95": 0.01, "p99": 0.01}
+        baseline = {"scenes": {"menu": {"update_ms": dict(stats), "draw_ms": dict(stats)}}}
+        current = {"scenes": {
+            "menu": {"update_ms": dict(stats, p99=0.03), "draw_ms": dict(stats)}, # +200%, but only 0.02ms
+            "resume": {"update_ms": dict(stats), "draw_ms": dict(stats)},
+        }}
+        self.assertEqual(benchmark.compare(baseline, current), [])
+
+if __name__ == '__main__':
+    unittest.main()
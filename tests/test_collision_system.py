@@ -0,0 +1,101 @@
+import unittest
+import pygame
+from game.entities.entity import Entity
+from game.systems.collision_system import CollisionSystem, SpatialHashGrid
+
+class TestSpatialHashGrid(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.grid = SpatialHashGrid(32)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_insert_and_query_rect(self):
+        near = Entity(10, 10, 16, 16)
+        far = Entity(500, 500, 16, 16)
+        self.grid.insert(near)
+        self.grid.insert(far)
+
+        self.assertEqual(self.grid.query_rect((0, 0, 40, 40)), {near})
+        self.assertEqual(len(self.grid), 2)
+
+    def test_entity_spanning_cells(self):
+        wide = Entity(20, 0, 64, 16)
+        self.grid.insert(wide)
+        self.assertEqual(self.grid.entity_cells[wide], ((0, 0), (1, 0), (2, 0)))
+        self.assertEqual(self.grid.query_rect((70, 0, 5, 5)), {wide})
+
+    def test_move_and_remove(self):
+        entity = Entity(0, 0, 16, 16)
+        self.grid.insert(entity)
+
+        entity.rect.topleft = (300, 300)
+        self.grid.move(entity)
+        self.assertFalse(self.grid.query_rect((0, 0, 32, 32)))
+        self.assertEqual(self.grid.query_rect((290, 290, 40, 40)), {entity})
+
+        self.grid.remove(entity)
+        self.assertNotIn(entity, self.grid)
+        self.assertFalse(self.grid.cells)
+
+    def test_query_radius(self):
+        close = Entity(100, 100, 10, 10)
+        outside = Entity(200, 100, 10, 10)
+        self.grid.insert(close)
+        self.grid.insert(outside)
+        self.assertEqual(self.grid.query_radius((110, 105), 20), {close})
+
+    def test_candidate_pairs_are_unique_and_local(self):
+        a = Entity(0, 0, 40, 40) # spans four cells
+        b = Entity(10, 10, 40, 40)
+        c = Entity(400, 400, 10, 10)
+        for entity in (a, b, c):
+            self.grid.insert(entity)
+
+        pairs = list(self.grid.candidate_pairs())
+        self.assertEqual(len(pairs), 1)
+        self.assertEqual(set(pairs[0]), {a, b})
+
+    def test_for_tilemap_without_map(self):
+        class EmptyTileMap:
+            tmx_data = None
+        self.assertEqual(SpatialHashGrid.for_tilemap(EmptyTileMap()).cell_width, 32)
+
+class TestResolveAll(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_resolve_all_separates_overlaps(self):
+        a = Entity(0, 0, 32, 32)
+        b = Entity(20, 4, 32, 32)
+        c = Entity(300, 300, 32, 32)
+
+        resolved = CollisionSystem.resolve_all([a, b, c])
+        self.assertEqual(resolved, 1)
+        self.assertFalse(a.rect.colliderect(b.rect))
+        self.assertEqual(c.rect.topleft, (300, 300))
+
+    def test_resolve_all_with_persistent_grid(self):
+        grid = SpatialHashGrid(32)
+        entities = [Entity(i * 40, 0, 32, 32) for i in range(50)]
+        self.assertEqual(CollisionSystem.resolve_all(entities, grid), 0)
+
+        entities[1].rect.x = entities[0].rect.x + 10
+        self.assertEqual(CollisionSystem.resolve_all(entities, grid), 1)
+        self.assertFalse(entities[0].rect.colliderect(entities[1].rect))
+
+    def test_persistent_grid_drops_removed_entities(self):
+        grid = SpatialHashGrid(32)
+        player, removed = Entity(0, 0, 32, 32), Entity(100, 0, 32, 32)
+        CollisionSystem.resolve_all([player, removed], grid)
+
+        removed.rect.topleft = (10, 0) # No longer in the scene, but overlapping the player
+        self.assertEqual(CollisionSystem.resolve_all([player], grid), 0)
+        self.assertNotIn(removed, grid)
+        self.assertEqual(player.rect.topleft, (0, 0))
@@ -2,6 +2,7 @@ import pygame
 import pytest
 from game.entities.entity import Entity
 from game.managers.input_manager import InputManager
+from game.utils.fixed_timestep import FixedTimestep
 
 # Initialize Pygame for tests that require it
 pygame.init()
@@ -38,3 +39,39 @@ def test_entity_movement(dummy_entity):
 def test_input_manager_instantiation():
     input_manager = InputManager()
     assert input_manager is not None
+
+def test_entity_sub_pixel_movement(dummy_entity):
+    # Small fixed steps must add up instead of being truncated away
+    dummy_entity.speed = 200
+    dummy_entity.velocity.x = 1
+    for _ in range(60):
+        dummy_entity.update(1 / 60)
+    assert dummy_entity.rect.x == 200
+
+def test_entity_render_interpolation(dummy_entity):
+    dummy_entity.speed = 60
+    dummy_entity.velocity.x = 1
+    dummy_entity.update(1) # 0 -> 60
+    assert dummy_entity.get_render_position(0.0) == (0, 0)
+    assert dummy_entity.get_render_position(0.5) == (30, 0)
+    assert dummy_entity.get_render_position(1.0) == (60, 0)
+
+def test_entity_teleport_is_not_interpolated(dummy_entity):
+    dummy_entity.rect.topleft = (300, 300)
+    assert dummy_entity.get_render_position(0.5) == (300, 300)
+    dummy_entity.update(0.1)
+    assert dummy_entity.position == pygame.math.Vector2(300, 300)
+
+def test_fixed_timestep_steps_and_alpha():
+    timestep = FixedTimestep(tick_rate=10, max_steps=5)
+    assert timestep.advance(0.25) == 2
+    assert abs(timestep.alpha - 0.5) < 1e-9
+    assert timestep.advance(0.05) == 1
+    assert abs(timestep.alpha) < 1e-9
+
+def test_fixed_timestep_caps_catch_up():
+    timestep = FixedTimestep(tick_rate=10, max_steps=3)
+    assert timestep.advance(1.05) == 3
+    assert abs(timestep.dropped_time - 0.7) < 1e-9
+    assert timestep.alpha < 1.0
+    assert timestep.advance(0.0) == 0
@@ -2,37 +2,12 @@ import unittest
 import pygame
 from game.scenes.menu_scene import MenuScene
 from game.scenes.game_scene import GameScene
-
-class MockGame:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((800, 600))
-        self.running = True
-        self.scene_manager = MockSceneManager(self)
-        self.audio_manager = MockAudioManager()
-
-class MockAudioManager:
-    def play_ui_sound(self, sound):
-        pass
-
-class MockSceneManager:
-    def __init__(self, game):
-        self.scenes = {}
-        self.current_scene = None
-        self.game = game
-
-    def add_scene(self, name, scene):
-        self.scenes[name] = scene
-
-    def set_scene(self, scene_name):
-        self.current_scene = scene_name
-        if scene_name == "game_scene" and self.scenes.get("game_scene").demo_mode:
-            # Simulate entering demo
-            pass
+from game.utils.headless import HeadlessGame
 
 class TestDemoMode(unittest.TestCase):
     def setUp(self):
         pygame.init()
-        self.game = MockGame()
+        self.game = HeadlessGame()
         self.menu_scene = MenuScene(self.game)
         self.game_scene = GameScene(self.game)
         self.game.scene_manager.add_scene("menu_scene", self.menu_scene)
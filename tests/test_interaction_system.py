@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import MagicMock
+import pygame
+from game.entities.entity import Entity
+from game.systems.interaction_system import InteractionIndex
+
+class TestInteractionIndex(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.index = InteractionIndex()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_query_returns_entities_in_range_nearest_first(self):
+        far = Entity(150, 100, 20, 20)   # center (160, 110)
+        near = Entity(110, 100, 20, 20)  # center (120, 110)
+        out_of_range = Entity(400, 400, 20, 20)
+        for entity in (far, near, out_of_range):
+            self.index.register(entity, 50)
+
+        result = [i.entity for i in self.index.query((115, 110))]
+        self.assertEqual(result, [near, far])
+
+    def test_per_entity_range(self):
+        small = Entity(100, 100, 20, 20)
+        self.index.register(small, 10)
+        self.index.register(Entity(500, 500, 10, 10), 200)
+        self.assertFalse(self.index.query((130, 110)))
+        self.assertEqual(self.index.nearest((115, 110)).entity, small)
+
+    def test_result_cached_until_player_moves(self):
+        self.index.register(Entity(100, 100, 20, 20), 50)
+        self.index.grid.query_radius = MagicMock(wraps=self.index.grid.query_radius)
+
+        self.index.query((110, 110))
+        self.index.query((110, 110))
+        self.index.nearest((110, 110))
+        self.assertEqual(self.index.grid.query_radius.call_count, 1)
+
+        self.index.query((111, 110))
+        self.assertEqual(self.index.grid.query_radius.call_count, 2)
+
+    def test_availability_is_not_cached(self):
+        station = Entity(100, 100, 20, 20)
+        station.completed = False
+        self.index.register(station, 50, is_available=lambda e: not e.completed)
+
+        self.assertEqual(len(self.index.query((110, 110))), 1)
+        station.completed = True
+        self.assertEqual(self.index.query((110, 110)), [])
+        self.assertIsNone(self.index.nearest((110, 110)))
+
+    def test_interact_and_unregister(self):
+        entity = Entity(100, 100, 20, 20)
+        callback = MagicMock()
+        self.index.register(entity, 50, callback)
+
+        self.index.nearest((110, 110)).interact()
+        callback.assert_called_once_with(entity)
+
+        self.index.unregister(entity)
+        self.assertIsNone(self.index.nearest((110, 110)))
+
+    def test_moved_entity(self):
+        entity = Entity(100, 100, 20, 20)
+        self.index.register(entity, 30)
+        self.assertTrue(self.index.query((110, 110)))
+
+        entity.rect.topleft = (300, 300)
+        self.index.update_entity(entity)
+        self.assertFalse(self.index.query((110, 110)))
+        self.assertTrue(self.index.query((310, 310)))
@@ -0,0 +1,138 @@
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+from jsonschema import ValidationError
+from game.managers.json_pipeline import JSONPipeline, SkillCategory
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SCHEMA = os.path.join(ROOT, "schemas", "portfolio_schema.json")
+
+class TestJSONPipelineCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.resume_path = os.path.join(self.tmp.name, "Resume.JSON")
+        shutil.copy(os.path.join(ROOT, "Rawdata", "Resume.JSON"), self.resume_path)
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        self.pipeline = JSONPipeline(SCHEMA, cache_dir=self.cache_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def edit(self, change):
+        with open(self.resume_path, encoding="utf-8") as f:
+            data = json.load(f)
+        change(data)
+        with open(self.resume_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.utime(self.resume_path, ns=(0, os.stat(self.resume_path).st_mtime_ns + 1_000_000)) # Coarse mtime clocks
+
+    def test_unchanged_file_is_served_from_cache(self):
+        first = self.pipeline.load_portfolio_data(self.resume_path)
+        self.assertEqual(len(self.pipeline.last_recomputed), 5)
+        self.assertIs(self.pipeline.load_portfolio_data(self.resume_path), first)
+        self.assertEqual(self.pipeline.last_recomputed, [])
+
+    def test_editing_skills_recomputes_only_dependent_sections(self):
+        before = self.pipeline.load_portfolio_data(self.resume_path)
+        self.edit(lambda data: next(iter(data["skills"].values())).append("Python"))
+        after = self.pipeline.load_portfolio_data(self.resume_path)
+
+        self.assertEqual(self.pipeline.last_recomputed, ["player_profile", "skill_categories", "game_stats"])
+        self.assertIs(after["experience_entries"], before["experience_entries"])
+        self.assertGreater(after["game_stats"]["programming"], before["game_stats"]["programming"])
+        self.assertEqual(after, self.pipeline._transform_portfolio_data(json.load(open(self.resume_path, encoding="utf-8"))))
+
+    def test_reformatting_without_changes_recomputes_nothing(self):
+        self.pipeline.load_portfolio_data(self.resume_path)
+        self.edit(lambda data: None) # Rewritten with different whitespace
+        self.pipeline.load_portfolio_data(self.resume_path)
+        self.assertEqual(self.pipeline.last_recomputed, [])
+
+    def test_disk_cache_skips_validation_and_transform(self):
+        expected = self.pipeline.load_portfolio_data(self.resume_path)
+
+        fresh = JSONPipeline(SCHEMA, cache_dir=self.cache_dir)
+        result = fresh.load_portfolio_data(self.resume_path)
+        self.assertEqual(result, expected)
+        self.assertIsInstance(result["skill_categories"][0], SkillCategory)
+        self.assertEqual(fresh.last_recomputed, [])
+        self.assertIsNone(fresh._validator) # Never needed
+
+    def test_unreadable_disk_cache_is_logged_and_rebuilt(self):
+        expected = self.pipeline.load_portfolio_data(self.resume_path)
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), "w") as f:
+                f.write("{truncated")
+
+        fresh = JSONPipeline(SCHEMA, cache_dir=self.cache_dir)
+        with self.assertLogs("JSONPipeline", "WARNING"):
+            self.assertEqual(fresh.load_portfolio_data(self.resume_path), expected)
+        self.assertEqual(len(fresh.last_recomputed), 5)
+
+    def test_invalid_edit_is_rejected(self):
+        self.pipeline.load_portfolio_data(self.resume_path)
+        self.edit(lambda data: data.pop("contact_info"))
+        with self.assertRaises(RuntimeError):
+            self.pipeline.load_portfolio_data(self.resume_path)
+
+class TestStreamingSections(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(ROOT, "Rawdata", "Resume.JSON"), encoding="utf-8") as f:
+            self.data = json.load(f)
+        self.pipeline = JSONPipeline(SCHEMA, cache_dir=None)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, data, name="portfolio.json"):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            if name.endswith(".jsonl"):
+                f.writelines(json.dumps({key: value}) + "\n" for key, value in data.items())
+            else:
+                json.dump(data, f, indent=2)
+        return path
+
+    def test_same_result_as_full_load(self):
+        path = self.write(self.data)
+        expected = self.pipeline.load_portfolio_data(path)
+        self.assertEqual(dict(self.pipeline.iter_portfolio_sections(path, chunk_size=64)), expected)
+        self.assertEqual(dict(self.pipeline.iter_portfolio_sections(self.write(self.data, "portfolio.jsonl"))), expected)
+
+    def test_sections_are_yielded_as_their_inputs_arrive(self):
+        path = self.write({"skills": self.data["skills"], "education": self.data["education"]})
+        sections = self.pipeline.iter_portfolio_sections(path)
+        self.assertEqual(next(sections)[0], "skill_categories")
+        self.assertEqual(next(sections)[0], "game_stats")
+        with self.assertRaises(ValidationError): # contact_info etc. are only found missing at the end
+            list(sections)
+
+    def test_invalid_section_stops_the_stream(self):
+        self.data["skills"] = {"bad key!": ["x"]}
+        with self.assertRaises(ValidationError):
+            list(self.pipeline.iter_portfolio_sections(self.write(self.data)))
+
+    def test_peak_memory_follows_largest_section(self):
+        for i in range(6):
+            self.data[f"embedded_asset_{i}"] = ["A" * 1000 for _ in range(300)]
+        path = self.write(self.data)
+        self.pipeline.member_validator, self.pipeline.validator # Schema compiled outside the measurement
+
+        def peak(load):
+            tracemalloc.start()
+            try:
+                load()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        streamed = peak(lambda: dict(self.pipeline.iter_portfolio_sections(path)))
+        loaded = peak(lambda: self.pipeline.load_portfolio_data(path))
+        self.assertLess(streamed, loaded / 3)
+
+if __name__ == '__main__':
+    unittest.main()
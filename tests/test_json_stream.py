@@ -0,0 +1,52 @@
+import io
+import json
+import random
+import unittest
+from game.utils.json_stream import iter_jsonl_members, iter_object_members
+
+def random_value(rng, depth=0):
+    roll = rng.random()
+    if depth > 2 or roll < 0.5:
+        return rng.choice([0, -1, 1.5, -2.25e-7, 12345678901234, 1e20, "s", 'a"}{,:b', "ü\\n", True, False, None])
+    if roll < 0.75:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{i}": random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+class TestIterObjectMembers(unittest.TestCase):
+    def test_matches_json_loads_at_any_chunk_size(self):
+        rng = random.Random(3)
+        documents = ["{}", ' { "a" : 123 , "e": -1.5e10 }\n']
+        documents += [json.dumps({f"s{i}": random_value(rng) for i in range(rng.randint(0, 6))},
+                                 indent=rng.choice([None, 1])) for _ in range(100)]
+        for document in documents:
+            for chunk_size in (1, 2, 3, 7, 100):
+                members = list(iter_object_members(io.StringIO(document), chunk_size))
+                self.assertEqual(members, list(json.loads(document).items()), (document, chunk_size))
+
+    def test_errors_are_positioned_like_json_loads(self):
+        for document in ['{"a":\n\n tru}', '{\n"a":1,\n"b":\n[1,\n2,,]}', '{\n"a":1\n\n x}', '{"a": 1, "b" 2}']:
+            with self.assertRaises(json.JSONDecodeError) as expected:
+                json.loads(document)
+            for chunk_size in (2, 5, 1000):
+                with self.assertRaises(json.JSONDecodeError) as raised:
+                    list(iter_object_members(io.StringIO(document), chunk_size))
+                self.assertEqual((raised.exception.lineno, raised.exception.colno, raised.exception.pos),
+                                 (expected.exception.lineno, expected.exception.colno, expected.exception.pos))
+
+    def test_rejects_non_objects_and_trailing_data(self):
+        for document in ["", "[1]", '{"a":1', '{"a":1,}', '{"a":1}x']:
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_object_members(io.StringIO(document), 2))
+
+class TestIterJsonlMembers(unittest.TestCase):
+    def test_members_of_every_line(self):
+        stream = io.StringIO('{"a": 1}\n\n{"b": [2], "c": 3}\n')
+        self.assertEqual(list(iter_jsonl_members(stream)), [("a", 1), ("b", [2]), ("c", 3)])
+
+    def test_error_has_stream_line(self):
+        with self.assertRaises(json.JSONDecodeError) as raised:
+            list(iter_jsonl_members(io.StringIO('{"a": 1}\n\n{"b": x}\n')))
+        self.assertEqual(raised.exception.lineno, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import pygame
+from game.entities.entity import Entity
+from game.systems.lighting_system import LightingSystem
+
+class TestLightingSystem(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((200, 160))
+        LightingSystem._masks.clear()
+        self.lighting = LightingSystem((200, 160), ambient=55, scale=4)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_masks_are_shared(self):
+        first = LightingSystem.get_mask(40, 1.0, 255, 4)
+        self.assertIs(LightingSystem.get_mask(40, 1.0, 255, 4), first)
+        self.assertIsNot(LightingSystem.get_mask(40, 0.5, 255, 4), first)
+        self.assertEqual(first.get_size(), (20, 20))
+
+    def test_mask_falls_off_from_center(self):
+        mask = LightingSystem.get_mask(40, 1.0, 255, 1)
+        center = mask.get_at((40, 40)).r
+        mid = mask.get_at((60, 40)).r
+        self.assertEqual(center, 255)
+        self.assertLess(mid, center)
+        self.assertEqual(mask.get_at((0, 0)).r, 0)
+
+    def test_multiply_darkens_unlit_areas_only(self):
+        self.lighting.add_light(40, falloff=0, position=(50, 50))
+        self.screen.fill((200, 200, 200))
+        self.lighting.draw(self.screen)
+
+        self.assertEqual(self.screen.get_at((50, 50))[:3], (200, 200, 200))
+        unlit = self.screen.get_at((180, 140))
+        self.assertEqual(unlit.r, 200 * 55 // 255)
+
+    def test_light_map_rebuilt_only_when_lights_move(self):
+        player = Entity(100, 80, 10, 10)
+        self.lighting.add_light(40, entity=player)
+        self.lighting.add_light(20, position=(20, 20))
+
+        self.assertTrue(self.lighting.update())
+        self.assertFalse(self.lighting.update())
+        self.assertEqual(self.lighting.rebuilds, 1)
+
+        player.rect.x += 1 # Below one light-map pixel
+        self.assertFalse(self.lighting.update())
+        player.rect.x += 4
+        self.assertTrue(self.lighting.update())
+        self.assertEqual(self.lighting.rebuilds, 2)
+
+    def test_adding_and_removing_lights_rebuilds(self):
+        self.lighting.update()
+        light = self.lighting.add_light(30, position=(100, 100))
+        self.assertTrue(self.lighting.update())
+        self.lighting.remove_light(light)
+        self.assertTrue(self.lighting.update())
+        self.assertEqual(self.lighting.full_light_map.get_at((100, 100))[:3], (55, 55, 55))
+
+    def test_camera_offset(self):
+        self.lighting.add_light(40, falloff=0, position=(300, 250))
+        self.lighting.update(camera=(250, 200))
+        self.assertEqual(self.lighting.full_light_map.get_at((50, 50))[:3], (255, 255, 255))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from game.utils.lru_cache import SizedLRUCache
+
+class TestSizedLRUCache(unittest.TestCase):
+    def setUp(self):
+        self.evicted = []
+        self.cache = SizedLRUCache(10, lambda key, value: len(value), on_evict=lambda k, v: self.evicted.append(k))
+
+    def test_evicts_least_recently_used(self):
+        self.cache["a"] = "xxxx"
+        self.cache["b"] = "xxxx"
+        self.cache.get("a")
+        self.cache["c"] = "xxxx"
+        self.assertEqual(list(self.cache), ["a", "c"])
+        self.assertEqual(self.evicted, ["b"])
+        self.assertEqual(self.cache.resident_bytes, 8)
+
+    def test_replacing_a_key_updates_size(self):
+        self.cache["a"] = "xxxx"
+        self.cache["a"] = "xx"
+        self.assertEqual(self.cache.resident_bytes, 2)
+        del self.cache["a"]
+        self.assertEqual(self.cache.resident_bytes, 0)
+
+    def test_pinned_entries_are_kept(self):
+        self.cache.pin("a")
+        self.cache["a"] = "xxxxxx"
+        self.cache["b"] = "xxxx"
+        self.cache["c"] = "xxxx"
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+
+        self.cache.unpin("a")
+        self.cache["d"] = "xxxx"
+        self.assertNotIn("a", self.cache)
+
+    def test_oversized_value_does_not_flush(self):
+        self.cache["a"] = "xxxx"
+        self.cache["huge"] = "x" * 50
+        self.assertEqual(list(self.cache), ["a"])
+
+    def test_stats(self):
+        self.cache["a"] = "x"
+        self.cache.get("a")
+        self.cache.get("missing")
+        with self.assertRaises(KeyError):
+            self.cache["missing"]
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 3)
+        self.assertEqual(stats["budget_bytes"], 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import base64
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+from unittest import mock
+import pygame
+from game.utils import map_compiler
+from game.utils.map_compiler import (MapCompileError, ObjectLayer, TileLayer, compile_tmx,
+                                     read_compiled, write_compiled, FLIPPED_HORIZONTALLY)
+
+LEVEL1 = os.path.join(os.path.dirname(__file__), "..", "assets", "maps", "level1.tmx")
+
+def tmx(layers, tileset='<tileset firstgid="1" name="t" tilewidth="2" tileheight="2" tilecount="4" columns="2">'
+                         '<image source="../sprites/t.png" width="4" height="4"/></tileset>'):
+    return (f'<map orientation="orthogonal" width="3" height="2" tilewidth="2" tileheight="2">'
+            f'{tileset}{layers}</map>').encode()
+
+class TestMapCompiler(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(LEVEL1, "rb") as f:
+            self.level1 = f.read()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        pygame.quit()
+
+    def test_compile_level1(self):
+        compiled = compile_tmx(self.level1, "maps/level1.tmx")
+        self.assertEqual((compiled.width, compiled.height, compiled.tilewidth), (25, 19, 32))
+        self.assertEqual(compiled.tilesets[0]["image"], "sprites/tileset.png")
+        layer = compiled.layers[0]
+        self.assertIsInstance(layer, TileLayer)
+        self.assertEqual(layer.data[0][0], 1)
+        self.assertEqual(layer.data[1][1], 2)
+
+    def test_binary_round_trip(self):
+        compiled = compile_tmx(tmx('<layer name="ground" width="3" height="2"><data encoding="csv">1,2,3,\n4,0,1</data></layer>'
+                                   '<objectgroup name="spawns"><object id="1" name="start" x="4" y="2">'
+                                   '<polygon points="0,0 2,0 2,2"/></object></objectgroup>'), "maps/test.tmx")
+        path = os.path.join(self.tmp.name, "test.tmc")
+        write_compiled(compiled, path)
+        loaded = read_compiled(path)
+
+        self.assertEqual([list(row) for row in loaded.layers[0].data], [[1, 2, 3], [4, 0, 1]])
+        self.assertIsInstance(loaded.layers[1], ObjectLayer)
+        self.assertEqual(loaded.get_layer_by_name("spawns").objects[0]["polygon"], [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0)])
+        loaded.layers[0].data[1][1] = 3 # Rows are writable views into the file buffer
+        self.assertEqual(loaded.layers[0].data[1][1], 3)
+
+    def test_base64_zlib_layer(self):
+        raw = zlib.compress(struct.pack("<6I", 1, 2, 3, 4, 1, 2))
+        compiled = compile_tmx(tmx('<layer name="l" width="3" height="2"><data encoding="base64" compression="zlib">'
+                                   f'{base64.b64encode(raw).decode()}</data></layer>'))
+        self.assertEqual(list(compiled.layers[0].data[1]), [4, 1, 2])
+
+    def test_rejects_wrong_tile_count(self):
+        with self.assertRaises(MapCompileError):
+            compile_tmx(tmx('<layer name="l" width="3" height="2"><data encoding="csv">1,2</data></layer>'))
+
+    def test_group_layers_are_flattened(self):
+        compiled = compile_tmx(tmx('<layer name="ground" width="3" height="2"><data encoding="csv">1,1,1,1,1,1</data></layer>'
+                                   '<group name="g" opacity="0.5" visible="0"><properties/>'
+                                   '<layer name="detail" width="3" height="2" opacity="0.5"><data encoding="csv">2,0,0,0,0,2</data></layer>'
+                                   '<group name="inner"><objectgroup name="spawns"><object id="1" x="4" y="2"/></objectgroup></group>'
+                                   '</group>'))
+        self.assertEqual([layer.name for layer in compiled.layers], ["ground", "detail", "spawns"])
+        detail = compiled.get_layer_by_name("detail")
+        self.assertEqual((detail.visible, detail.opacity, list(detail.data[1])), (False, 0.25, [0, 0, 2]))
+        self.assertFalse(compiled.get_layer_by_name("spawns").visible)
+
+    def test_unknown_elements_are_skipped(self):
+        compiled = compile_tmx(tmx('<group name="g"><newlayerkind name="x"/></group>'
+                                   '<layer name="l" width="3" height="2"><data encoding="csv">1,1,1,1,1,1</data></layer>'))
+        self.assertEqual([layer.name for layer in compiled.layers], ["l"])
+
+    def test_flipped_tiles_keep_their_flags(self):
+        flipped = FLIPPED_HORIZONTALLY | 2
+        compiled = compile_tmx(tmx(f'<layer name="l" width="3" height="2"><data encoding="csv">1,{flipped},2,0,0,{flipped}</data></layer>'
+                                   '<objectgroup name="o"><object id="1" gid="3" x="0" y="2" width="2" height="2"/></objectgroup>'))
+        self.assertEqual(list(compiled.layers[0].data[0]), [1, flipped, 2])
+        self.assertEqual(compiled.layers[1].objects[0]["gid"], 3)
+
+    def test_tile_animations_are_kept(self):
+        tileset = ('<tileset firstgid="1" name="t" tilewidth="2" tileheight="2" tilecount="4" columns="2">'
+                   '<image source="t.png" width="4" height="4"/>'
+                   '<tile id="0"><animation><frame tileid="0" duration="100"/><frame tileid="1" duration="150"/></animation></tile>'
+                   '</tileset>')
+        path = os.path.join(self.tmp.name, "anim.tmc")
+        write_compiled(compile_tmx(tmx("", tileset)), path)
+        self.assertEqual(read_compiled(path).tilesets[0]["animations"], {"0": [[0, 100], [1, 150]]})
+
+    def test_tile_images_and_flips(self):
+        compiled = compile_tmx(tmx(""), "maps/test.tmx")
+        sheet = pygame.Surface((4, 4))
+        sheet.fill((255, 0, 0), (0, 0, 2, 2))
+        sheet.fill((0, 0, 255), (2, 0, 2, 2))
+        compiled.load_images(lambda path: sheet)
+
+        self.assertIsNone(compiled.get_tile_image_by_gid(0))
+        self.assertEqual(compiled.get_tile_image_by_gid(2).get_at((0, 0))[:3], (0, 0, 255))
+        flipped = compiled.get_tile_image_by_gid(2 | FLIPPED_HORIZONTALLY)
+        self.assertEqual(flipped.get_size(), (2, 2))
+        self.assertIs(compiled.get_tile_image_by_gid(2 | FLIPPED_HORIZONTALLY), flipped)
+
+    def test_load_map_uses_cache_until_source_changes(self):
+        cache_dir = os.path.join(self.tmp.name, "maps")
+        first = map_compiler.load_map(self.level1, "maps/level1.tmx", cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        with mock.patch.object(map_compiler, "compile_tmx", side_effect=AssertionError("recompiled")):
+            cached = map_compiler.load_map(self.level1, "maps/level1.tmx", cache_dir)
+        self.assertEqual([list(row) for row in cached.layers[0].data], [list(row) for row in first.layers[0].data])
+
+        edited = self.level1.replace(b"1,2,2,2", b"1,3,2,2", 1)
+        changed = map_compiler.load_map(edited, "maps/level1.tmx", cache_dir)
+        self.assertEqual(changed.layers[0].data[1][1], 3)
+        self.assertEqual(len(os.listdir(cache_dir)), 1) # The stale compile was replaced
+
+    def test_external_tileset_change_invalidates_cache(self):
+        files = {"maps/t.tsx": b'<tileset name="t" tilewidth="2" tileheight="2" tilecount="4" columns="2">'
+                               b'<image source="../sprites/t.png" width="4" height="4"/></tileset>'}
+        source = tmx('<layer name="l" width="3" height="2"><data encoding="csv">1,1,1,1,1,1</data></layer>',
+                     tileset='<tileset firstgid="1" source="t.tsx"/>')
+        cache_dir = os.path.join(self.tmp.name, "maps")
+        compiled = map_compiler.load_map(source, "maps/test.tmx", cache_dir, files.get)
+        self.assertEqual(compiled.tilesets[0]["image"], "sprites/t.png")
+
+        files["maps/t.tsx"] = files["maps/t.tsx"].replace(b'tilecount="4"', b'tilecount="2"')
+        self.assertEqual(map_compiler.load_map(source, "maps/test.tmx", cache_dir, files.get).tilesets[0]["tilecount"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import pygame
+from game.entities.particle import ParticleSystem, ParticleEngine, ParticleAtlas
+
+class TestParticleEngine(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((200, 200))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_emit_and_expire(self):
+        engine = ParticleEngine(capacity=8, seed=1)
+        engine.emit(100, 100, 5, (0, 255, 0), lifetime=1.0)
+        self.assertEqual(len(engine), 5)
+
+        engine.update(0.5)
+        self.assertEqual(len(engine), 5)
+        engine.update(0.6)
+        self.assertEqual(len(engine), 0)
+
+    def test_grows_past_capacity(self):
+        engine = ParticleEngine(capacity=4, seed=1)
+        engine.emit(0, 0, 10, (255, 0, 0))
+        self.assertEqual(len(engine), 10)
+        self.assertGreaterEqual(engine.capacity, 10)
+
+    def test_compaction_keeps_live_particles_packed(self):
+        engine = ParticleEngine(capacity=16, seed=1)
+        engine.emit(0, 0, 4, (255, 0, 0), lifetime=0.5)
+        engine.emit(50, 50, 4, (0, 0, 255), lifetime=2.0)
+        engine.emit(0, 0, 4, (255, 0, 0), lifetime=0.5)
+
+        engine.update(1.0)
+        self.assertEqual(len(engine), 4)
+        blue = engine.atlas.index_for((0, 0, 255))
+        self.assertTrue((engine.color_index[:4] == blue).all())
+        self.assertTrue((engine.lifetime[:4] == 2.0).all())
+
+    def test_movement(self):
+        engine = ParticleEngine(capacity=4, seed=1)
+        engine.emit(100, 100, 1, (255, 255, 255))
+        velocity = engine.velocity[0].copy()
+        engine.update(0.5)
+        self.assertAlmostEqual(float(engine.position[0][0]), 100 + velocity[0] * 0.5, places=4)
+
+    def test_draw_uses_palette_color(self):
+        engine = ParticleEngine(capacity=4, seed=1)
+        engine.emit(100, 100, 1, (255, 0, 0))
+        engine.velocity[0] = (0, 0)
+        self.screen.fill((0, 0, 0))
+        engine.draw(self.screen)
+        self.assertEqual(self.screen.get_at((100, 100))[:3], (255, 0, 0))
+
+class TestParticleAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_close_colors_share_a_square(self):
+        atlas = ParticleAtlas(2)
+        self.assertEqual(atlas.index_for((250, 2, 3)), atlas.index_for((255, 0, 0)))
+        self.assertEqual(atlas.surface.get_at(atlas.areas[0].topleft)[:3], (255, 0, 0))
+
+    def test_rows_double_up_to_the_cap(self):
+        atlas = ParticleAtlas(2, max_colors=64)
+        heights = []
+        for i in range(64):
+            atlas.index_for(((i % 16) * 17, (i // 16) * 17, 0))
+            heights.append(atlas.surface.get_height())
+        self.assertEqual(sorted(set(heights)), [2, 4, 8]) # 1, 2 then 4 rows of 16
+        self.assertEqual(atlas.surface.get_size(), (32, 8))
+
+    def test_full_atlas_reuses_the_least_recently_used_square(self):
+        atlas = ParticleAtlas(2, max_colors=4)
+        colors = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        indices = [atlas.index_for(color) for color in colors]
+        atlas.index_for(colors[0]) # Red is now the oldest
+
+        white = atlas.index_for((255, 255, 255))
+        self.assertEqual(white, indices[1])
+        self.assertEqual(len(atlas.palette), 4)
+        self.assertEqual(atlas.surface.get_size(), (8, 2))
+        self.assertEqual(atlas.surface.get_at(atlas.areas[white].topleft)[:3], (255, 255, 255))
+
+class TestParticleSystem(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((200, 200))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_api(self):
+        system = ParticleSystem()
+        system.emit(50, 50)
+        self.assertEqual(len(system), 15)
+        system.update(0.1)
+        system.draw(self.screen)
+        system.update(1.0)
+        self.assertEqual(len(system), 0)
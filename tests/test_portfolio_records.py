@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from game.managers.json_pipeline import JSONPipeline, compact_portfolio, serialize_portfolio
+from game.utils.portfolio_records import CompactPortfolio, Stat, pack_stats, unpack_stats
+from batch_pipeline import read_profiles
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+class TestPortfolioRecords(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.schema = os.path.join(ROOT, "schemas", "portfolio_schema.json")
+        self.resume = os.path.join(ROOT, "Rawdata", "Resume.JSON")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trips_serialized_portfolio(self):
+        result = JSONPipeline(self.schema, cache_dir=None).load_portfolio_data(self.resume)
+        compact = compact_portfolio(result)
+        self.assertEqual(compact.to_dict(), serialize_portfolio(result))
+        self.assertEqual(compact.stat(Stat.PROGRAMMING), result["game_stats"]["programming"])
+        self.assertFalse(hasattr(compact, "__dict__"))
+
+    def test_stats_outside_the_enum_are_kept(self):
+        path = os.path.join(self.tmp.name, "mappings.json")
+        with open(path, "w") as f:
+            json.dump({"JIRA": {"wizardry": 3}}, f)
+        result = JSONPipeline(self.schema, cache_dir=None, stat_mappings_path=path).load_portfolio_data(self.resume)
+        compact = compact_portfolio(result)
+        self.assertEqual(compact.extra_game_stats, {"wizardry": 3})
+        self.assertEqual(compact.to_dict(), serialize_portfolio(result))
+
+    def test_absent_stats_stay_absent(self):
+        vector, extra = pack_stats({"charisma": 4, "luck": 1})
+        self.assertEqual(vector[Stat.CHARISMA], 4)
+        self.assertEqual(unpack_stats(vector, extra, 1 << Stat.CHARISMA), {"charisma": 4, "luck": 1})
+
+    def test_read_profiles_from_batch_output(self):
+        result = JSONPipeline(self.schema, cache_dir=None).load_portfolio_data(self.resume)
+        path = os.path.join(self.tmp.name, "profiles.jsonl")
+        with open(path, "w") as f:
+            for i in range(3):
+                f.write(json.dumps({"source": f"p{i}.json", "profile": serialize_portfolio(result)}) + "\n")
+        profiles = list(read_profiles(path))
+        self.assertEqual([source for source, _ in profiles], ["p0.json", "p1.json", "p2.json"])
+        self.assertEqual(profiles[2][1].to_dict(), serialize_portfolio(result))
+
+    def test_smaller_than_plain_dicts(self):
+        result = JSONPipeline(self.schema, cache_dir=None).load_portfolio_data(self.resume)
+        text = json.dumps(serialize_portfolio(result))
+
+        def measure(build):
+            tracemalloc.start()
+            try:
+                kept = [build() for _ in range(300)]
+                return tracemalloc.get_traced_memory()[0], kept
+            finally:
+                tracemalloc.stop()
+
+        plain, _ = measure(lambda: json.loads(text))
+        compact, _ = measure(lambda: CompactPortfolio.from_dict(json.loads(text)))
+        self.assertLess(compact, plain * 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
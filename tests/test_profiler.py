@@ -0,0 +1,97 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+import pygame
+from game.managers.scene_manager import SceneManager
+from game.scenes.about_scene import AboutScene
+from game.utils.profiler import FrameProfiler
+
+class MockGame:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((800, 600))
+        self.running = True
+        self.scene_manager = SceneManager()
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.game = MockGame()
+        self.profiler = FrameProfiler()
+        self.profiler.clear()
+        self.profiler.enabled = True
+
+    def tearDown(self):
+        self.profiler.enabled = False
+        self.profiler.clear()
+        pygame.quit()
+
+    def run_frame(self):
+        self.profiler.begin_frame()
+        self.game.scene_manager.handle_events([])
+        self.game.scene_manager.update(1 / 60)
+        self.game.scene_manager.update(1 / 60)
+        self.game.scene_manager.draw(self.game.screen)
+        self.profiler.end_frame()
+
+    def test_disabled_spans_record_nothing(self):
+        self.profiler.enabled = False
+        self.profiler.begin_frame()
+        with self.profiler.span("tilemap"):
+            pass
+        self.profiler.end_frame()
+        self.assertIsNone(self.profiler.last_frame())
+
+    def test_scene_phases_are_timed_per_scene(self):
+        self.game.scene_manager.add_scene("about_scene", AboutScene(self.game))
+        self.game.scene_manager.set_scene("about_scene")
+        self.run_frame()
+
+        spans = self.profiler.last_frame()["spans"]
+        self.assertEqual(set(spans), {"about_scene.events", "about_scene.update", "about_scene.draw"})
+        self.assertGreaterEqual(self.profiler.last_frame()["total_ms"], spans["about_scene.draw"])
+
+    def test_repeated_spans_are_summed(self):
+        self.profiler.begin_frame()
+        self.profiler.add("step", 1.5)
+        self.profiler.add("step", 2.0)
+        self.profiler.end_frame()
+        self.assertEqual(self.profiler.last_frame()["spans"], {"step": 3.5})
+
+    def test_history_is_bounded(self):
+        for _ in range(self.profiler.frames.maxlen + 5):
+            self.profiler.begin_frame()
+            self.profiler.end_frame()
+        self.assertEqual(len(self.profiler.frames), self.profiler.frames.maxlen)
+
+    def test_export_csv_and_json(self):
+        for ms in (1.0, 2.0):
+            self.profiler.begin_frame()
+            self.profiler.add("menu_scene.draw", ms)
+            self.profiler.add("hud", ms / 2)
+            self.profiler.end_frame()
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path, json_path = self.profiler.export(os.path.join(directory, "trace"))
+            with open(csv_path, newline="") as f:
+                rows = list(csv.reader(f))
+            with open(json_path) as f:
+                trace = json.load(f)
+
+        self.assertEqual(rows[0], ["frame", "total_ms", "menu_scene.draw", "hud"])
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(float(rows[2][2]), 2.0)
+        self.assertEqual([frame["spans"]["hud"] for frame in trace["frames"]], [0.5, 1.0])
+        self.assertAlmostEqual(self.profiler.averages()["menu_scene.draw"], 1.5)
+
+    def test_overlay_draws(self):
+        self.profiler.begin_frame()
+        self.profiler.add("game_scene.draw", 40.0) # Taller than the graph
+        self.profiler.add("tilemap", 1.0)
+        self.profiler.end_frame()
+        panel = self.profiler.draw_overlay(self.game.screen)
+        self.assertTrue(self.game.screen.get_rect().contains(panel))
+
+if __name__ == '__main__':
+    unittest.main()
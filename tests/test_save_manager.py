@@ -0,0 +1,63 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from game.managers.save_manager import SaveManager
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+class TestSaveManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.save_manager = SaveManager(self.tmp.name, os.path.join(ROOT, "schemas", "save_schema.json"))
+        self.state = {"player_position": [1.0, 2.0], "current_scene": "game", "inventory": []}
+
+    def tearDown(self):
+        self.save_manager.shutdown()
+        self.tmp.cleanup()
+
+    def files(self):
+        return sorted(os.listdir(self.tmp.name))
+
+    def test_save_and_load(self):
+        self.assertTrue(self.save_manager.save_game(self.state, "slot"))
+        self.assertEqual(self.save_manager.load_game("slot"), self.state)
+        self.assertEqual(self.files(), ["slot.json"])
+
+    def test_failed_write_keeps_previous_save(self):
+        self.save_manager.save_game(self.state, "slot")
+        self.assertFalse(self.save_manager.save_game({"bad": object()}, "slot"))
+        self.assertEqual(self.save_manager.load_game("slot"), self.state)
+        self.assertEqual(self.files(), ["slot.json"]) # No temporary file left behind
+
+    def test_async_save_snapshots_state(self):
+        self.save_manager.save_game_async(self.state, "autosave")
+        self.state["player_position"][0] = 99.0 # Changed after the save was requested
+        self.assertTrue(self.save_manager.flush(timeout=5))
+        self.assertEqual(self.save_manager.load_game("autosave")["player_position"], [1.0, 2.0])
+
+    def test_queued_saves_are_coalesced(self):
+        release = threading.Event()
+        written = []
+        write_save = self.save_manager._write_save
+
+        def slow_write(filename, package):
+            release.wait(5)
+            written.append(package["data"]["player_position"][0])
+            return write_save(filename, package)
+
+        self.save_manager._write_save = slow_write
+        for x in range(5):
+            self.save_manager.save_game_async(dict(self.state, player_position=[float(x), 0.0]), "autosave")
+        self.assertFalse(self.save_manager.flush(timeout=0.05))
+        release.set()
+        self.save_manager.shutdown() # Waits for the pending write
+        self.assertEqual(written[-1], 4.0)
+        self.assertLessEqual(len(written), 2) # The one in progress, then only the newest
+        self.assertEqual(self.save_manager.saves_coalesced, 5 - len(written))
+        self.assertEqual(self.save_manager.load_game("autosave")["player_position"], [4.0, 0.0])
+        self.assertIsNone(self.save_manager.writer)
+
+if __name__ == '__main__':
+    unittest.main()
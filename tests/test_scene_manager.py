@@ -0,0 +1,160 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pygame
+from game.managers.scene_manager import SceneManager
+from game.scenes.menu_scene import MenuScene
+from game.scenes.about_scene import AboutScene
+from config import PRIMARY_BLUE
+
+class MockGame:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((800, 600))
+        self.running = True
+        self.scene_manager = SceneManager(build_times_path=None)
+
+class TestDirtyRectRendering(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.game = MockGame()
+        self.scene_manager = self.game.scene_manager
+        self.scene_manager.add_scene("menu_scene", MenuScene(self.game))
+        self.scene_manager.add_scene("about_scene", AboutScene(self.game))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_first_frame_is_full(self):
+        self.scene_manager.set_scene("about_scene")
+        self.assertIsNone(self.scene_manager.draw_dirty(self.game.screen))
+
+    def test_static_scene_skips_frames(self):
+        self.scene_manager.set_scene("about_scene")
+        self.scene_manager.draw_dirty(self.game.screen)
+        self.scene_manager.update(1.0)
+        self.assertEqual(self.scene_manager.draw_dirty(self.game.screen), [])
+
+    def test_cursor_blink_updates_small_region(self):
+        self.scene_manager.set_scene("menu_scene")
+        self.scene_manager.draw_dirty(self.game.screen)
+        menu = self.scene_manager.active_scene
+
+        menu.update(0.6) # Cursor blinks
+        rects = self.scene_manager.draw_dirty(self.game.screen)
+        self.assertEqual(rects, [menu.cursor_rect(menu.selected_index)])
+
+    def test_selection_change_redraws_old_and_new_rows(self):
+        self.scene_manager.set_scene("menu_scene")
+        self.scene_manager.draw_dirty(self.game.screen)
+        menu = self.scene_manager.active_scene
+        self.scene_manager.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN)])
+        self.assertEqual(self.scene_manager.draw_dirty(self.game.screen), [menu.option_row_rect(0), menu.option_row_rect(1)])
+
+    def test_cursor_shows_at_new_selection_after_hidden_change(self):
+        self.scene_manager.set_scene("menu_scene")
+        self.scene_manager.draw_dirty(self.game.screen)
+        menu = self.scene_manager.active_scene
+
+        menu.update(0.6) # Cursor hidden
+        self.scene_manager.draw_dirty(self.game.screen)
+        self.assertFalse(menu.cursor_visible)
+        self.scene_manager.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN)])
+        self.scene_manager.draw_dirty(self.game.screen)
+
+        menu.update(0.6) # Visible again, at option 1
+        rects = self.scene_manager.draw_dirty(self.game.screen)
+        cursor = menu.cursor_rect(1)
+        self.assertEqual(rects, [cursor])
+        self.assertEqual(tuple(self.game.screen.get_at(cursor.center))[:3], PRIMARY_BLUE)
+
+    def test_option_rects_match_rendered_text(self):
+        self.scene_manager.set_scene("menu_scene")
+        menu = self.scene_manager.active_scene
+        for i, option in enumerate(menu.options):
+            surface = menu.option_font.render(option, True, (0, 0, 0))
+            self.assertEqual(menu.option_rect(i).size, surface.get_size())
+
+    def test_large_change_falls_back_to_flip(self):
+        self.scene_manager.set_scene("menu_scene")
+        self.scene_manager.draw_dirty(self.game.screen)
+        self.scene_manager.active_scene.mark_dirty((0, 0, 800, 500))
+        self.assertIsNone(self.scene_manager.draw_dirty(self.game.screen))
+
+class TestLazyScenes(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.game = MockGame()
+        self.scene_manager = self.game.scene_manager
+        self.built = []
+        for name, scene_class in (("menu_scene", MenuScene), ("about_scene", AboutScene), ("resume_scene", AboutScene)):
+            self.scene_manager.add_scene_factory(name, self.factory(name, scene_class))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def factory(self, name, scene_class):
+        def build():
+            self.built.append(name)
+            return scene_class(self.game)
+        return build
+
+    def test_scenes_are_built_on_first_use(self):
+        self.assertTrue(self.scene_manager.has_scene("about_scene"))
+        self.assertFalse(self.scene_manager.is_built("about_scene"))
+        self.assertEqual(self.built, [])
+
+        self.scene_manager.set_scene("about_scene")
+        self.scene_manager.set_scene("about_scene")
+        self.assertEqual(self.built, ["about_scene"])
+        self.assertIsInstance(self.scene_manager.active_scene, AboutScene)
+        self.assertIn("about_scene", self.scene_manager.build_times)
+
+    def test_unknown_scene_is_ignored(self):
+        self.scene_manager.set_scene("missing_scene")
+        self.assertIsNone(self.scene_manager.active_scene)
+        self.assertIsNone(self.scene_manager.get_scene("missing_scene"))
+
+    def test_menu_warms_up_likely_next_scenes_in_idle_time(self):
+        self.scene_manager.set_scene("menu_scene")
+        self.assertEqual(list(self.scene_manager.warm_up_queue), ["resume_scene", "about_scene"]) # No game_scene registered
+
+        self.assertIsNone(self.scene_manager.warm_up(idle_ms=1))
+        self.assertEqual(self.scene_manager.warm_up(idle_ms=16), "resume_scene")
+        self.assertEqual(self.built, ["menu_scene", "resume_scene"])
+
+        self.scene_manager.set_scene("about_scene") # Needed before its warm-up came around
+        self.assertIsNone(self.scene_manager.warm_up(idle_ms=16))
+        self.assertEqual(self.built, ["menu_scene", "resume_scene", "about_scene"])
+
+    def test_warm_up_waits_for_a_frame_that_covers_the_build(self):
+        self.scene_manager.expected_build_ms["resume_scene"] = 40.0
+        self.scene_manager.schedule_warm_up(["resume_scene", "about_scene"])
+        self.assertEqual(self.scene_manager.warm_up(idle_ms=16), "about_scene") # Skips the expensive one
+        self.assertIsNone(self.scene_manager.warm_up(idle_ms=16))
+        self.assertEqual(self.scene_manager.warm_up(idle_ms=45), "resume_scene")
+
+    def test_measured_build_times_are_kept_across_runs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "times.json")
+            first = SceneManager(build_times_path=path)
+            first.add_scene_factory("about_scene", self.factory("about_scene", AboutScene))
+            first.get_scene("about_scene")
+            self.assertFalse(os.path.exists(path)) # Building doesn't touch the disk
+            first.save_build_times()
+            self.assertEqual(SceneManager(build_times_path=path).expected_build_ms["about_scene"],
+                             first.build_times["about_scene"])
+
+    def test_assets_are_decoded_before_the_build(self):
+        batch = mock.Mock(done=False)
+        with mock.patch("game.managers.scene_manager.AssetManager") as asset_manager:
+            asset_manager.return_value.load_batch.return_value = batch
+            self.scene_manager.add_scene_factory("about_scene", self.factory("about_scene", AboutScene),
+                                                 assets=[("image", "player.png")])
+            self.scene_manager.schedule_warm_up(["about_scene"])
+            self.assertIsNone(self.scene_manager.warm_up(idle_ms=16))
+            asset_manager.return_value.load_batch.assert_called_once_with([("image", "player.png")])
+            self.assertEqual(self.built, [])
+
+            batch.done = True
+            self.assertEqual(self.scene_manager.warm_up(idle_ms=16), "about_scene")
@@ -0,0 +1,73 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from game.managers.json_pipeline import JSONPipeline
+from game.utils.skill_matcher import SkillMatcher
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+def naive_matches(mappings, text):
+    return [key for key in mappings if key in text.lower()]
+
+class TestSkillMatcher(unittest.TestCase):
+    def test_overlapping_and_nested_keys(self):
+        matcher = SkillMatcher({"java": {"a": 1}, "javascript": {"b": 1}, "script": {"c": 1}, "sql": {"d": 1}})
+        self.assertEqual(matcher.matches("JavaScript (ES6)"), ["java", "javascript", "script"])
+        self.assertEqual(matcher.matches("PL/SQL and SQL Server"), ["sql"])
+        self.assertEqual(matcher.matches("Gardening"), [])
+
+    def test_agrees_with_substring_tests_on_large_tables(self):
+        rng = random.Random(7)
+        alphabet = "abcde /"
+        keys = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))) for _ in range(3000)}
+        mappings = {key: {"stat": 1} for key in keys}
+        matcher = SkillMatcher(mappings)
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            self.assertEqual(sorted(matcher.matches(text)), sorted(naive_matches(mappings, text)))
+
+    def test_score_categories_fills_both_totals(self):
+        matcher = SkillMatcher({"python": {"programming": 15}, "sql": {"analysis": 15, "programming": 1}})
+        totals = {}
+        per_category = matcher.score_categories({"dev": ["Python", "SQL"], "data": ["SQL", "Excel"]}, totals)
+        self.assertEqual(per_category, {"dev": {"programming": 16, "analysis": 15}, "data": {"analysis": 15, "programming": 1}})
+        self.assertEqual(totals, {"programming": 17, "analysis": 30})
+
+class TestPipelineStatMappings(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.schema = os.path.join(ROOT, "schemas", "portfolio_schema.json")
+        self.resume = os.path.join(ROOT, "Rawdata", "Resume.JSON")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_results_match_per_skill_substring_scan(self):
+        pipeline = JSONPipeline(self.schema, cache_dir=None)
+        result = pipeline.load_portfolio_data(self.resume)
+        with open(self.resume, encoding="utf-8") as f:
+            skills = json.load(f)["skills"]
+
+        expected = {"intelligence": 10, "programming": 5, "analysis": 5, "technical": 5,
+                    "integration": 5, "leadership": 5, "management": 5, "charisma": 8}
+        for skill in (skill for skill_list in skills.values() for skill in skill_list):
+            for key in naive_matches(pipeline.STAT_MAPPINGS, skill):
+                for stat, bonus in pipeline.STAT_MAPPINGS[key].items():
+                    expected[stat] = expected.get(stat, 0) + bonus
+        self.assertEqual(result["game_stats"], expected)
+        self.assertEqual(sum(category.game_stat_mapping.get("programming", 0) for category in result["skill_categories"]),
+                         expected["programming"] - 5)
+
+    def test_mappings_loaded_from_data(self):
+        path = os.path.join(self.tmp.name, "mappings.json")
+        with open(path, "w") as f:
+            json.dump({"JIRA": {"wizardry": 3}}, f)
+        pipeline = JSONPipeline(self.schema, cache_dir=None, stat_mappings_path=path)
+        self.assertEqual(pipeline.skill_matcher.keys, ["jira"]) # Keys match case-insensitively
+        stats = pipeline.load_portfolio_data(self.resume)["game_stats"]
+        self.assertEqual(stats["wizardry"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
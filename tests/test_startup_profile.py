@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from config import STARTUP_BUDGET_MS
+from game.utils.startup_profile import StartupProfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+class TestStartupProfile(unittest.TestCase):
+    def setUp(self):
+        self.profile = StartupProfile()
+
+    def tearDown(self):
+        if self.profile.enabled:
+            self.profile.stop()
+
+    def test_phases_are_noops_until_started(self):
+        with self.profile.phase("ignored"):
+            pass
+        self.assertIsNot(self.profile.phase("ignored"), None)
+        self.assertFalse(self.profile.enabled)
+
+    def test_records_imports_and_nested_phases(self):
+        sys.modules.pop("colorsys", None)
+        self.profile.start()
+        with self.profile.phase("outer"):
+            with self.profile.phase("inner"):
+                import colorsys # noqa: F401 - something cheap that isn't loaded yet
+        self.profile.stop()
+
+        report = self.profile.report()
+        self.assertIn("colorsys", [node["module"] for node in report["imports"]])
+        phases = {phase["name"]: phase for phase in report["phases"]}
+        self.assertEqual((phases["outer"]["depth"], phases["inner"]["depth"]), (0, 1))
+        self.assertGreaterEqual(phases["outer"]["ms"], phases["inner"]["ms"])
+        self.assertIn("outer", self.profile.format_report(min_import_ms=0))
+
+    def test_cold_start_within_budget(self):
+        # Fresh interpreter, same as a user launching the game: imports through the first menu frame
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "startup.json")
+            env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+            result = subprocess.run([sys.executable, os.path.join(ROOT, "main.py"), "--profile-startup", "--profile-output", output],
+                                    cwd=tmp, env=env, capture_output=True, text=True, timeout=60)
+            with open(output) as f:
+                report = json.load(f)
+
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertLessEqual(report["total_ms"], STARTUP_BUDGET_MS)
+        phases = [phase["name"] for phase in report["phases"]]
+        for phase in ("pygame.init", "display.set_mode", "scene menu_scene"):
+            self.assertIn(phase, phases)
+        self.assertNotIn("scene game_scene", phases) # Built lazily, after the first frame
+
+        modules = set()
+        stack = list(report["imports"])
+        while stack:
+            node = stack.pop()
+            modules.add(node["module"])
+            stack.extend(node["children"])
+        for deferred in ("jsonschema", "webbrowser", "game.scenes.game_scene"):
+            self.assertNotIn(deferred, modules)
+
+if __name__ == '__main__':
+    unittest.main()
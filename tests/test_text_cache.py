@@ -0,0 +1,60 @@
+import unittest
+import pygame
+from game.utils.text_cache import TextCache
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.cache = TextCache()
+        self.cache.clear()
+        self.cache.reset_stats()
+        self.budget = self.cache.budget_bytes
+        self.font = pygame.font.Font(None, 24)
+
+    def tearDown(self):
+        self.cache.budget_bytes = self.budget
+        pygame.quit()
+
+    def test_hits_and_misses(self):
+        first = self.cache.render(self.font, "Level 1", True, (255, 255, 255))
+        second = self.cache.render(self.font, "Level 1", True, (255, 255, 255))
+        self.assertIs(first, second)
+
+        self.cache.render(self.font, "Level 1", True, (0, 0, 0))
+        self.cache.render(self.font, "Level 1", True, (0, 0, 0), (50, 50, 50))
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["entries"], 3)
+        self.assertGreater(stats["resident_bytes"], 0)
+
+    def test_lru_eviction_respects_budget(self):
+        surface = self.cache.render(self.font, "A", True, (255, 255, 255))
+        entry_size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.cache.clear()
+        self.cache.budget_bytes = entry_size * 2
+
+        self.cache.render(self.font, "A", True, (255, 255, 255))
+        self.cache.render(self.font, "A", True, (255, 0, 0))
+        self.cache.render(self.font, "A", True, (255, 255, 255)) # refresh first entry
+        self.cache.render(self.font, "A", True, (0, 0, 255))     # evicts the red one
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertLessEqual(stats["resident_bytes"], self.cache.budget_bytes)
+        keys = [(key[1], key[3]) for key in self.cache.surfaces]
+        self.assertNotIn(("A", (255, 0, 0)), keys)
+        self.assertIn(("A", (255, 255, 255)), keys)
+
+    def test_shared_fonts_dropped_on_quit(self):
+        font = self.cache.get_font(30)
+        self.assertIs(self.cache.get_font(30), font)
+        self.cache.render(font, "!", True, (255, 255, 255))
+
+        pygame.quit()
+        self.assertFalse(self.cache.fonts)
+        self.assertFalse(self.cache.surfaces)
+
+        pygame.init()
+        self.assertIsNot(self.cache.get_font(30), font)
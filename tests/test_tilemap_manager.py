@@ -0,0 +1,53 @@
+import unittest
+import pygame
+from game.managers.tilemap_manager import TileMapManager
+
+class TestTileMapManager(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.tilemap_manager = TileMapManager(chunk_size=16)
+        self.tilemap_manager.load_map("level1.tmx")
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_map_loaded(self):
+        self.assertIsNotNone(self.tilemap_manager.tmx_data)
+        self.assertEqual(self.tilemap_manager.get_chunk_pixel_size(), (512, 512))
+
+    def test_only_visible_chunks_are_built(self):
+        # A small viewport in the top-left corner touches only one chunk
+        self.tilemap_manager.render(pygame.Surface((100, 100)))
+        self.assertEqual(list(self.tilemap_manager.chunks.keys()), [(0, 0, 0)])
+
+        # Scrolling the camera into the next chunk bakes that one as well
+        self.tilemap_manager.render(pygame.Surface((100, 100)), camera=(520, 0))
+        self.assertIn((0, 1, 0), self.tilemap_manager.chunks)
+        self.assertEqual(len(self.tilemap_manager.chunks), 2)
+
+    def test_chunks_are_reused_between_frames(self):
+        self.tilemap_manager.render(self.screen)
+        first = dict(self.tilemap_manager.chunks)
+        self.tilemap_manager.render(self.screen)
+        for key, chunk in first.items():
+            self.assertIs(self.tilemap_manager.chunks[key], chunk)
+
+    def test_set_tile_rebuilds_only_its_chunk(self):
+        self.tilemap_manager.render(self.screen)
+        before = dict(self.tilemap_manager.chunks)
+
+        self.tilemap_manager.set_tile(20, 3, 0, 1)
+        self.assertEqual(self.tilemap_manager.dirty_chunks, {(0, 1, 0)})
+
+        self.tilemap_manager.render(self.screen)
+        self.assertFalse(self.tilemap_manager.dirty_chunks)
+        self.assertIsNot(self.tilemap_manager.chunks[(0, 1, 0)], before[(0, 1, 0)])
+        self.assertIs(self.tilemap_manager.chunks[(0, 0, 0)], before[(0, 0, 0)])
+
+    def test_chunked_render_matches_full_map(self):
+        map_surface = self.tilemap_manager.make_map_surface()
+        self.screen.fill((0, 0, 0))
+        self.tilemap_manager.render(self.screen, camera=(0, 8))
+        self.assertEqual(self.screen.get_at((40, 40)), map_surface.get_at((40, 48)))
+        self.assertEqual(self.screen.get_at((700, 500)), map_surface.get_at((700, 508)))
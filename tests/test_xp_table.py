@@ -0,0 +1,52 @@
+import os
+import random
+import unittest
+from game.entities.player import Player
+from game.managers.json_pipeline import JSONPipeline
+from game.utils.xp_table import XP_TABLE, build_xp_table, level_for_xp, level_progress, xp_for_level
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+def loop_level(experience_points):
+    # The level-by-level calculation the table replaced
+    level = 1
+    xp_for_next_level = 100
+    while experience_points >= xp_for_next_level:
+        level += 1
+        experience_points -= xp_for_next_level
+        xp_for_next_level = int(xp_for_next_level * 1.5)
+    return min(level, 100)
+
+class TestXPTable(unittest.TestCase):
+    def test_matches_level_by_level_calculation(self):
+        rng = random.Random(5)
+        values = list(range(5000)) + [rng.randrange(10 ** 22) for _ in range(2000)]
+        values += [xp + delta for xp in XP_TABLE for delta in (-1, 0, 1) if xp + delta >= 0]
+        for experience in values:
+            self.assertEqual(level_for_xp(experience), loop_level(experience), experience)
+
+    def test_thresholds_and_cap(self):
+        self.assertEqual(XP_TABLE[:4], [0, 100, 250, 475])
+        self.assertEqual(len(XP_TABLE), 100)
+        self.assertEqual(xp_for_level(2), 100)
+        self.assertEqual(xp_for_level(1000), XP_TABLE[-1])
+        self.assertEqual(level_progress(120), (2, 20, 150))
+        level, into_level, level_xp = level_progress(10 ** 40)
+        self.assertEqual((level, into_level), (100, level_xp))
+        self.assertEqual(build_xp_table(10, 2, 4), [0, 10, 30, 70])
+
+    def test_player_levels_up_from_the_table(self):
+        player = Player(0, 0, 32, 32)
+        self.assertEqual(player.max_experience, 100)
+        self.assertEqual(player.gain_experience(60), 0)
+        self.assertEqual(player.gain_experience(200), 2)
+        self.assertEqual((player.level, player.experience, player.max_experience), (3, 260, 475))
+
+    def test_pipeline_profile_uses_the_table(self):
+        pipeline = JSONPipeline(os.path.join(ROOT, "schemas", "portfolio_schema.json"), cache_dir=None)
+        profile = pipeline.load_portfolio_data(os.path.join(ROOT, "Rawdata", "Resume.JSON"))["player_profile"]
+        self.assertEqual(profile["current_level"], level_for_xp(profile["experience_points"]))
+        self.assertEqual(profile["available_skill_points"], (profile["current_level"] - 1) * 3)
+
+if __name__ == '__main__':
+    unittest.main()